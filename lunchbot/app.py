@@ -17,17 +17,8 @@ sys.path.insert(0, str(Path(__file__).parent))
 import streamlit as st
 
 from bot_config.constants import SESSION_KEY_SEARCH_RESULTS, SESSION_KEY_INPUT_DATA
-from bot_core.search import RestaurantSearcher
-from bot_core.notification import SlackNotifier
 from ui.styles import CUSTOM_CSS
 from ui.components import render_header
-from ui.pages.home import render_input_form, render_auto_select_button
-from ui.pages.search_results import render_search_results
-from ui.pages.search_results import render_search_results
-from ui.pages.history import render_history_tab
-from ui.pages.db_management import render_db_management_tab
-from bot_utils.date_helper import format_date_korean
-from bot_core.search import RestaurantSearcher, Restaurant
 
 
 # ── 페이지 설정 ──────────────────────────────────────────
@@ -54,8 +45,24 @@ def _get_secret(key: str, default: str = "") -> str:
 NAVER_CLIENT_ID = _get_secret("NAVER_CLIENT_ID")
 NAVER_CLIENT_SECRET = _get_secret("NAVER_CLIENT_SECRET")
 SLACK_WEBHOOK_URL = _get_secret("SLACK_WEBHOOK_URL")
+# 추가 알림 채널: [[SLACK_TARGETS]] 배열 (name, webhook_url, template, timeout)
+SLACK_TARGETS = [dict(t) for t in _get_secret("SLACK_TARGETS", [])]
 
-if not NAVER_CLIENT_ID or not NAVER_CLIENT_SECRET:
+# Slack 알림은 아웃박스에 쌓아 두고 백그라운드 스레드가 전송 (이전 실행에서 남은 알림 포함)
+if SLACK_WEBHOOK_URL or SLACK_TARGETS:
+    from bot_core.outbox import start_outbox_sender
+
+    start_outbox_sender()
+
+# 네이버 API/지도 트래픽 녹화·재생 (재생 모드는 API 키 없이 녹화된 응답으로 동작)
+from bot_config.settings import CASSETTE_MODE, CASSETTE_PATH, CASSETTE_REPLAY_SPEED
+
+if CASSETTE_MODE:
+    from bot_utils.cassette import install_cassette
+
+    install_cassette(CASSETTE_PATH, CASSETTE_MODE, CASSETTE_REPLAY_SPEED)
+
+if (not NAVER_CLIENT_ID or not NAVER_CLIENT_SECRET) and CASSETTE_MODE != "replay":
     st.error(
         "⚠️ 네이버 API 키가 설정되지 않았습니다.\n\n"
         "**Streamlit Cloud**: Settings → Secrets 에 아래 내용을 추가하세요.\n\n"
@@ -67,6 +74,14 @@ if not NAVER_CLIENT_ID or not NAVER_CLIENT_SECRET:
     )
     st.stop()
 
+# 점심시간 전 인기 검색 조합을 미리 캐시 (프로세스당 스레드 하나)
+from bot_config.settings import PREWARM_ENABLED
+
+if PREWARM_ENABLED:
+    from bot_core.prewarm import start_prewarm_scheduler
+
+    start_prewarm_scheduler(NAVER_CLIENT_ID, NAVER_CLIENT_SECRET)
+
 
 # ── 세션 상태 초기화 ──────────────────────────────────────
 if SESSION_KEY_SEARCH_RESULTS not in st.session_state:
@@ -78,14 +93,18 @@ if SESSION_KEY_INPUT_DATA not in st.session_state:
 # ── 메인 영역 ────────────────────────────────────────────
 render_header()
 
-# 탭 구성
-tab_search, tab_history, tab_db = st.tabs(["🔍 맛집 검색", "📜 검색 이력", "🗄️ DB 관리"])
-
 
 def _run_search(form_data: dict) -> None:
     """검색을 실행하고 결과를 세션에 저장합니다."""
     import random
-    from bot_config.settings import BUDGET_KEYWORDS
+    import time
+    from bot_config.settings import (
+        BUDGET_KEYWORDS,
+        SEARCH_MAX_PAGES,
+        SEARCH_PAGE_CONCURRENCY,
+        SEARCH_TIMEOUT_BUDGET,
+    )
+    from bot_core.search import RestaurantSearcher, Restaurant, attach_landmark_distances, api_cache, search_cache, naver_api
 
     with st.spinner("🔍 맛집을 검색하고 있습니다..."):
         # 검색 시작 시 이전 랜덤 추천 상태 초기화
@@ -95,18 +114,33 @@ def _run_search(form_data: dict) -> None:
             # 1. DB 검색 모드
             if form_data.get("source") == "db":
                 from bot_core.db import db
-                raw_results = db.search_favorites(form_data["query"])
+                from bot_utils.geo import format_distance, estimate_walking_time
+
+                coords = form_data["area_coords"]
+                raw_results = db.search_favorites(
+                    form_data["query"],
+                    center_lat=coords["lat"],
+                    center_lng=coords["lng"],
+                    radius_m=form_data["radius"] or None,
+                )
                 results = []
                 for row in raw_results:
+                    distance = row["distance_m"]
                     results.append(Restaurant(
                         name=row["restaurant_name"],
                         address=row["address"] or "",
+                        lat=row["lat"] or 0.0,
+                        lng=row["lng"] or 0.0,
                         category="⭐ 즐겨찾기",
                         description=row["memo"] or "내 DB 저장 맛집",
-                        distance_text="내 저장소",
-                        walking_time="",
+                        distance_m=distance or 0.0,
+                        # 좌표가 없는(보강 전) 식당은 거리 대신 출처 표시
+                        distance_text=format_distance(distance) if distance is not None else "내 저장소",
+                        walking_time=estimate_walking_time(distance) if distance is not None else "",
                     ))
                 
+                attach_landmark_distances(results)
+
                 if not results:
                     st.toast("검색 결과가 없습니다.", icon="⚠️")
                 
@@ -122,15 +156,23 @@ def _run_search(form_data: dict) -> None:
                 client_secret=NAVER_CLIENT_SECRET,
                 center_lat=coords["lat"],
                 center_lng=coords["lng"],
+                cache=search_cache,
+                api_cache=api_cache,
+                caller=naver_api,
+                max_pages=SEARCH_MAX_PAGES,
+                page_concurrency=SEARCH_PAGE_CONCURRENCY,
             )
 
             budget_kw = BUDGET_KEYWORDS.get(form_data.get("budget", "상관없음"), "")
+            # 반경 확대 재검색까지 포함한 전체 시간 예산
+            deadline = time.monotonic() + SEARCH_TIMEOUT_BUDGET
 
             results = searcher.search(
                 area_name=form_data["area"],
                 cuisine_keyword=form_data["cuisine_keyword"],
                 radius=form_data["radius"],
                 budget_keyword=budget_kw,
+                deadline=deadline,
             )
 
             # 결과가 없으면 자동 반경 확대
@@ -139,10 +181,14 @@ def _run_search(form_data: dict) -> None:
                     area_name=form_data["area"],
                     cuisine_keyword=form_data["cuisine_keyword"],
                     initial_radius=form_data["radius"],
+                    deadline=deadline,
                 )
                 if results:
                     st.info("검색 반경을 자동으로 넓혔습니다.")
 
+            # 시간 예산을 넘겨 생략된 지역 (결과 화면에서 안내)
+            form_data = {**form_data, "skipped_areas": list(results.skipped_areas)}
+
             # 자동선택 모드: 3개만 랜덤 선정
             if form_data.get("auto_select") and results and len(results) > 3:
                 results = random.sample(results, 3)
@@ -155,8 +201,13 @@ def _run_search(form_data: dict) -> None:
             st.error(f"검색 중 오류가 발생했습니다: {str(e)}")
 
 
-# ── 검색 탭 ───────────────────────────────────────────────
-with tab_search:
+# ── 페이지 ───────────────────────────────────────────────
+# 각 페이지의 코드와 import는 해당 페이지가 선택됐을 때만 실행됩니다.
+def _search_page():
+    from bot_core.notification import SlackNotifier, SlackTarget
+    from bot_utils.date_helper import format_date_korean
+    from ui.pages.home import render_input_form, render_auto_select_button
+    from ui.pages.search_results import render_search_results
 
     # 검색 결과가 없을 때: 입력 폼 표시
     if st.session_state[SESSION_KEY_SEARCH_RESULTS] is None:
@@ -197,16 +248,23 @@ with tab_search:
             )
 
             # Slack 알림
-            if SLACK_WEBHOOK_URL:
-                notifier = SlackNotifier(SLACK_WEBHOOK_URL)
-                notifier.send_search_result(
-                    restaurant_name=selected.name,
-                    address=selected.road_address or selected.address,
-                    date_str=format_date_korean(input_data["date"]),
-                    time_str=input_data["time"],
-                    party_size=input_data["party_size"],
-                    phone=selected.phone,
-                )
+            if SLACK_WEBHOOK_URL or SLACK_TARGETS:
+                try:
+                    notifier = SlackNotifier(
+                        SLACK_WEBHOOK_URL,
+                        targets=[SlackTarget.from_config(t) for t in SLACK_TARGETS],
+                    )
+                except ValueError as e:
+                    st.error(f"Slack 알림 설정 오류: {e}")
+                else:
+                    notifier.send_search_result(
+                        restaurant_name=selected.name,
+                        address=selected.road_address or selected.address,
+                        date_str=format_date_korean(input_data["date"]),
+                        time_str=input_data["time"],
+                        party_size=input_data["party_size"],
+                        phone=selected.phone,
+                    )
 
         # 다시 검색 버튼
         st.markdown("---")
@@ -218,13 +276,35 @@ with tab_search:
             st.rerun()
 
 
-# ── 이력 탭 ───────────────────────────────────────────────
-# ── 이력 탭 ───────────────────────────────────────────────
-with tab_history:
+def _history_page():
+    from ui.pages.history import render_history_tab
+
     render_history_tab()
 
 
-# ── DB 관리 탭 ───────────────────────────────────────────
-with tab_db:
+def _reports_page():
+    from ui.pages.reports import render_reports_tab
+
+    render_reports_tab()
+
+
+def _db_management_page():
+    from ui.pages.db_management import render_db_management_tab
+
     render_db_management_tab()
 
+
+pages = [
+    st.Page(_search_page, title="맛집 검색", icon="🔍", url_path="search", default=True),
+    st.Page(_history_page, title="검색 이력", icon="📜", url_path="history"),
+    st.Page(_reports_page, title="리포트", icon="📊", url_path="reports"),
+    st.Page(_db_management_page, title="DB 관리", icon="🗄️", url_path="db"),
+]
+current_page = st.navigation(pages, position="hidden")
+
+# 탭처럼 보이는 상단 페이지 링크 (사이드바는 기본으로 접혀 있음)
+for col, page in zip(st.columns(len(pages)), pages):
+    with col:
+        st.page_link(page, use_container_width=True)
+
+current_page.run()
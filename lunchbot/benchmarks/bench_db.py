@@ -0,0 +1,328 @@
+"""DatabaseManager 벤치마크
+
+임시 DB에 대량의 합성 데이터를 채운 뒤 DatabaseManager의 공개 메서드별
+지연 시간(p50/p95/p99)과 처리량(ops/sec)을 측정하고 JSON으로 저장합니다.
+
+실행 (lunchbot 디렉터리에서):
+    python -m benchmarks.bench_db --history 1000000 --favorites 50000 \\
+        --exclusions 10000 --output bench_db.json
+"""
+
+import argparse
+import json
+import platform
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bot_core.db import DatabaseManager, restaurant_key
+from bot_core.enrichment import STATUS_OK
+
+_CUISINES = ["한식", "중식", "일식", "양식", "분식", "동남아", "뷔페"]
+_DISTRICTS = ["중구", "종로구", "마포구", "용산구", "서대문구"]
+
+# 합성 식당 좌표의 중심 (광화문)과 퍼짐 정도 (위경도 ±0.05도 ≈ ±5km)
+_CENTER = (37.5759, 126.9768)
+_SPREAD = 0.05
+
+# 이 간격마다 한 곳은 좌표가 없고 아직 보강되지 않은 식당 (보강 대기열)
+_UNENRICHED_EVERY = 5
+
+# 일괄 작업 한 번에 선택하는 행 수 (목록 화면 한 페이지 분량)
+_BULK_SIZE = 50
+
+# 무거운 연산도 p95/p99가 최댓값과 같아지지 않도록 최소한 이만큼은 반복
+_MIN_TAIL_SAMPLES = 30
+
+
+def _restaurant(i: int) -> tuple[str, str]:
+    return f"식당{i:07d}", f"서울 {_DISTRICTS[i % len(_DISTRICTS)]} 세종대로 {i}"
+
+
+def _is_unenriched(i: int) -> bool:
+    return i % _UNENRICHED_EVERY == _UNENRICHED_EVERY - 1
+
+
+def _restaurant_row(i: int, rng: random.Random) -> tuple:
+    name, address = _restaurant(i)
+    if _is_unenriched(i):
+        lat = lng = enriched_at = None
+    else:
+        lat = _CENTER[0] + rng.uniform(-_SPREAD, _SPREAD)
+        lng = _CENTER[1] + rng.uniform(-_SPREAD, _SPREAD)
+        enriched_at = "2026-01-01 00:00:00"
+    return i + 1, restaurant_key(name, address), name, address, lat, lng, enriched_at
+
+
+def seed_database(
+    db_path: str,
+    history: int,
+    favorites: int,
+    exclusions: int,
+    batch_size: int = 50_000,
+) -> DatabaseManager:
+    """
+    스키마를 만들고 합성 데이터를 executemany로 빠르게 채웁니다.
+    식당 대부분은 좌표가 있는 보강 완료 상태이고, _UNENRICHED_EVERY개 중 하나는 보강 대기 상태입니다.
+    """
+    manager = DatabaseManager(db_path)
+    # 즐겨찾기/제외는 서로 겹치지 않게, 이력은 전체 식당 중에서 참조
+    restaurant_count = max(favorites + exclusions, 1)
+    coords_rng = random.Random(2)
+
+    with sqlite3.connect(db_path) as conn:
+        cursor = conn.cursor()
+        cursor.executemany(
+            "INSERT INTO restaurants (id, identity_key, name, address, lat, lng, enriched_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (_restaurant_row(i, coords_rng) for i in range(restaurant_count)),
+        )
+        if manager._has_rtree:
+            cursor.execute(
+                "INSERT INTO restaurant_geo (id, min_lat, max_lat, min_lng, max_lng) "
+                "SELECT id, lat, lat, lng, lng FROM restaurants WHERE lat IS NOT NULL"
+            )
+        cursor.executemany(
+            "INSERT INTO favorites (restaurant_id, memo, category) VALUES (?, ?, ?)",
+            ((i + 1, f"메모 {i}", _CUISINES[i % len(_CUISINES)]) for i in range(favorites)),
+        )
+        cursor.executemany(
+            "INSERT INTO exclusions (restaurant_id, reason) VALUES (?, ?)",
+            ((favorites + i + 1, "벤치마크") for i in range(exclusions)),
+        )
+
+        rng = random.Random(0)
+        for start in range(0, history, batch_size):
+            rows = [
+                (
+                    rng.randint(1, restaurant_count),
+                    "02-000-0000",
+                    rng.choice(_CUISINES),
+                    "한국프레스센터",
+                    "2026년 2월 16일 (월)",
+                    "12:00",
+                    rng.randint(2, 30),
+                    "",
+                )
+                for _ in range(min(batch_size, history - start))
+            ]
+            cursor.executemany(
+                """
+                INSERT INTO search_history
+                    (restaurant_id, phone, cuisine_type, area,
+                     reservation_date, reservation_time, party_size, link)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                rows,
+            )
+        conn.commit()
+
+    return manager
+
+
+def _percentile(sorted_values: list[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def time_operation(func, iterations: int) -> dict:
+    """func(i)를 iterations번 호출하여 지연 시간 분포를 반환합니다 (단위: ms)."""
+    samples = []
+    started = time.perf_counter()
+    for i in range(iterations):
+        t0 = time.perf_counter()
+        func(i)
+        samples.append((time.perf_counter() - t0) * 1000)
+    total = time.perf_counter() - started
+
+    samples.sort()
+    return {
+        "iterations": iterations,
+        "p50_ms": round(_percentile(samples, 50), 4),
+        "p95_ms": round(_percentile(samples, 95), 4),
+        "p99_ms": round(_percentile(samples, 99), 4),
+        "max_ms": round(samples[-1], 4) if samples else 0.0,
+        "ops_per_sec": round(iterations / total, 2) if total > 0 else 0.0,
+    }
+
+
+def build_cases(manager: DatabaseManager, favorites: int, exclusions: int, iterations: int) -> dict:
+    """측정할 공개 메서드 목록 (이름 → (호출 함수, 반복 횟수))."""
+    rng = random.Random(1)
+    fav_total = max(favorites, 1)
+    exc_total = max(exclusions, 1)
+    # 전체 목록 조회처럼 무거운 연산은 반복 횟수를 줄이되, 꼬리 지연을 볼 수 있는 표본 수는 유지
+    # (--iterations를 그보다 작게 주면 그 값을 따름)
+    heavy = max(min(_MIN_TAIL_SAMPLES, iterations), iterations // 20, 1)
+
+    def existing_favorite(_):
+        return _restaurant(rng.randrange(fav_total))
+
+    def existing_exclusion(_):
+        return _restaurant(favorites + rng.randrange(exc_total))
+
+    new_offset = favorites + exclusions + 1_000_000
+
+    def bulk_ids(i: int, first_id: int, total: int) -> list[int]:
+        # 식당 ID first_id부터 total개 범위에서 i번째 묶음 (범위를 넘으면 처음부터 다시)
+        return [first_id + (i * _BULK_SIZE + j) % total for j in range(_BULK_SIZE)]
+
+    def nearby(i: int, radius_m: float | None) -> list[dict]:
+        lat = _CENTER[0] + rng.uniform(-_SPREAD, _SPREAD) / 2
+        lng = _CENTER[1] + rng.uniform(-_SPREAD, _SPREAD) / 2
+        return manager.search_favorites("", center_lat=lat, center_lng=lng, radius_m=radius_m)
+
+    unenriched_after = [0]
+
+    def next_unenriched_page(_):
+        # 보강 작업처럼 after_id로 이어서 읽고, 끝에 닿으면 처음부터
+        rows = manager.get_unenriched_favorites(limit=100, after_id=unenriched_after[0])
+        unenriched_after[0] = rows[-1]["id"] if rows else 0
+        return rows
+
+    unenriched_total = max(1, favorites // _UNENRICHED_EVERY)
+
+    def save_enrichment(i: int):
+        # 보강 대기 중인 즐겨찾기를 차례로 보강 완료 처리 (즐겨찾기 id = 식당 id)
+        restaurant_id = (i % unenriched_total + 1) * _UNENRICHED_EVERY
+        manager.save_enrichment(
+            restaurant_id, restaurant_id, STATUS_OK, category="한식",
+            lat=_CENTER[0], lng=_CENTER[1],
+        )
+
+    return {
+        "save_search_result": (
+            lambda i: manager.save_search_result(*_restaurant(i % fav_total), cuisine_type="한식", party_size=6),
+            iterations,
+        ),
+        "get_search_history": (lambda i: manager.get_search_history(limit=20), iterations),
+        "is_favorite": (lambda i: manager.is_favorite(*existing_favorite(i)), iterations),
+        "is_favorite_miss": (lambda i: manager.is_favorite(*_restaurant(new_offset + i)), iterations),
+        "is_excluded": (lambda i: manager.is_excluded(*existing_exclusion(i)), iterations),
+        "get_excluded_keys": (lambda i: manager.get_excluded_keys(), heavy),
+        "add_favorite": (lambda i: manager.add_favorite(*_restaurant(new_offset + i), memo="bench"), iterations),
+        "remove_favorite": (lambda i: manager.remove_favorite(*_restaurant(new_offset + i)), iterations),
+        "add_exclusion": (lambda i: manager.add_exclusion(*_restaurant(new_offset + i), reason="bench"), iterations),
+        "remove_exclusion": (lambda i: manager.remove_exclusion(*_restaurant(new_offset + i)), iterations),
+        "get_favorites": (lambda i: manager.get_favorites(), heavy),
+        "get_exclusions": (lambda i: manager.get_exclusions(), heavy),
+        "search_favorites": (lambda i: manager.search_favorites(f"식당{rng.randrange(fav_total):07d}"), heavy),
+        # DB 검색 모드: 지역 중심에서 반경 안의 즐겨찾기를 거리순으로 (반경 없음 = 전체 거리 정렬)
+        "search_favorites_radius": (lambda i: nearby(i, 1000), iterations),
+        "search_favorites_by_distance": (lambda i: nearby(i, None), heavy),
+        # 목록 화면: 개수 + 한 페이지
+        "count_favorites": (lambda i: manager.count_favorites(), heavy),
+        "get_favorites_page": (
+            lambda i: manager.get_favorites_page(
+                sort=("recent", "oldest", "name", "category")[i % 4],
+                offset=rng.randrange(fav_total) // 50 * 50,
+            ),
+            heavy,
+        ),
+        "count_exclusions": (lambda i: manager.count_exclusions(), heavy),
+        "get_exclusions_page": (
+            lambda i: manager.get_exclusions_page(offset=rng.randrange(exc_total) // 50 * 50),
+            heavy,
+        ),
+        # 보강 대기열 조회/저장
+        "count_unenriched_favorites": (lambda i: manager.count_unenriched_favorites(), heavy),
+        "get_unenriched_favorites": (next_unenriched_page, iterations),
+        "save_enrichment": (save_enrichment, iterations),
+        "import_favorites": (
+            lambda i: manager.import_favorites(
+                [
+                    {"name": _restaurant(new_offset * 2 + i * 100 + j)[0],
+                     "address": _restaurant(new_offset * 2 + i * 100 + j)[1]}
+                    for j in range(100)
+                ]
+            ),
+            heavy,
+        ),
+        # 목록 화면 일괄 작업 (_BULK_SIZE건씩). 옮긴 묶음은 바로 다음 케이스가 되돌려 놓음
+        "tag_favorites": (
+            lambda i: manager.tag_favorites(bulk_ids(i, 1, fav_total), _CUISINES[i % len(_CUISINES)]),
+            iterations,
+        ),
+        "move_favorites_to_exclusions": (
+            lambda i: manager.move_favorites_to_exclusions(bulk_ids(i, 1, fav_total)), heavy,
+        ),
+        "move_exclusions_to_favorites": (
+            lambda i: manager.move_exclusions_to_favorites(bulk_ids(i, 1, fav_total)), heavy,
+        ),
+        # 삭제는 데이터를 줄이므로 마지막에 측정
+        "remove_favorites": (lambda i: manager.remove_favorites(bulk_ids(i, 1, fav_total)), heavy),
+        "remove_exclusions": (
+            lambda i: manager.remove_exclusions(bulk_ids(i, favorites + 1, exc_total)), heavy,
+        ),
+    }
+
+
+def run(args: argparse.Namespace) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = str(Path(tmp) / "bench.db")
+
+        t0 = time.perf_counter()
+        manager = seed_database(db_path, args.history, args.favorites, args.exclusions)
+        seed_seconds = time.perf_counter() - t0
+
+        results = {}
+        cases = build_cases(manager, args.favorites, args.exclusions, args.iterations)
+        for name, (func, iterations) in cases.items():
+            if args.only and name not in args.only:
+                continue
+            results[name] = time_operation(func, iterations)
+            print(
+                f"{name:<28} p50={results[name]['p50_ms']:>9.3f}ms "
+                f"p95={results[name]['p95_ms']:>9.3f}ms "
+                f"p99={results[name]['p99_ms']:>9.3f}ms "
+                f"{results[name]['ops_per_sec']:>10.1f} ops/s"
+            )
+
+        db_size = Path(db_path).stat().st_size
+
+    return {
+        "benchmark": "database_manager",
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "environment": {
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "platform": platform.platform(),
+        },
+        "dataset": {
+            "history": args.history,
+            "favorites": args.favorites,
+            "exclusions": args.exclusions,
+            "seed_seconds": round(seed_seconds, 2),
+            "db_size_bytes": db_size,
+        },
+        "results": results,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="DatabaseManager 벤치마크")
+    parser.add_argument("--history", type=int, default=1_000_000, help="검색 이력 행 수")
+    parser.add_argument("--favorites", type=int, default=50_000, help="즐겨찾기 행 수")
+    parser.add_argument("--exclusions", type=int, default=10_000, help="제외 목록 행 수")
+    parser.add_argument("--iterations", type=int, default=200, help="메서드별 반복 횟수")
+    parser.add_argument("--only", nargs="*", help="측정할 메서드 이름만 지정")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    args = parser.parse_args(argv)
+
+    report = run(args)
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+        print(f"결과 저장: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
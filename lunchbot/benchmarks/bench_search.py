@@ -0,0 +1,340 @@
+"""RestaurantSearcher 벤치마크 (로컬 모의 네이버 API)
+
+실제 API 키/네트워크 없이 httpx.MockTransport로 지역/블로그 검색 API를 흉내 내고
+search / search_with_expanded_radius를 처음부터 끝까지 실행해
+벽시계 시간(p50/p95/p99), API 호출 수, 주고받은 바이트, 메모리 할당을 측정합니다.
+
+모의 API 설정:
+- 응답 지연: 로그정규분포 (중앙값 --latency-ms, 퍼짐 --latency-sigma). 요청 타임아웃보다 길면 ReadTimeout
+- 오류: --error-rate 비율로 503
+- 항목 수: 질의마다 --local-items개의 합성 식당 (start/display로 페이지), 블로그는 --blog-items개
+
+--cassette를 주면 모의 API 대신 녹화된 실제 트래픽(bot_utils.cassette)을 재생합니다.
+녹화 당시 검색한 키워드를 --keywords로 지정해야 녹화에 없는 요청(misses)이 생기지 않습니다.
+
+실행 (lunchbot 디렉터리에서):
+    python -m benchmarks.bench_search --iterations 50 --latency-ms 80 --error-rate 0.02 \\
+        --pages 3 --resilient --output bench_search.json
+    python -m benchmarks.bench_search --cassette data/cassettes/naver.jsonl.gz \\
+        --replay-speed 1.0 --keywords 한식 중식
+"""
+
+import argparse
+import json
+import math
+import platform
+import random
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+import zlib
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import httpx
+
+from benchmarks.bench_db import time_operation
+from bot_config.settings import (
+    AREA_CENTER,
+    CUISINE_TYPES,
+    NAVER_BLOG_SEARCH_API_URL,
+    NAVER_SEARCH_API_URL,
+    SEARCH_TIMEOUT_BUDGET,
+)
+from bot_core import db as db_module
+from bot_core import search as search_module
+from bot_core.db import DatabaseManager
+from bot_core.search import RestaurantSearcher
+from bot_utils.cassette import MODE_REPLAY, Cassette
+from bot_utils.resilience import ResilientCaller
+from bot_utils.ttl_cache import TTLCache
+
+_LOCAL_PATH = httpx.URL(NAVER_SEARCH_API_URL).path
+_BLOG_PATH = httpx.URL(NAVER_BLOG_SEARCH_API_URL).path
+_CATEGORIES = ["한식>백반", "중식>중식당", "일식>초밥", "양식>파스타", "분식", "아시아음식>베트남음식"]
+
+
+@dataclass
+class MockApiStats:
+    """모의 API가 받은 요청 통계."""
+
+    local_calls: int = 0
+    blog_calls: int = 0
+    errors: int = 0
+    timeouts: int = 0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+
+
+@dataclass
+class MockNaverApi:
+    """지역/블로그 검색 API를 흉내 내는 MockTransport 핸들러."""
+
+    latency_ms: float = 0.0
+    latency_sigma: float = 0.5
+    error_rate: float = 0.0
+    local_items: int = 30
+    blog_items: int = 3
+    spread_m: float = 2500.0
+    seed: int = 0
+    stats: MockApiStats = field(default_factory=MockApiStats)
+
+    def __post_init__(self):
+        self._rng = random.Random(self.seed)
+        self._lock = threading.Lock()
+
+    def _sample_latency(self) -> float:
+        """로그정규분포 지연 (초). 중앙값이 latency_ms."""
+        if self.latency_ms <= 0:
+            return 0.0
+        with self._lock:
+            return self.latency_ms / 1000 * math.exp(self._rng.gauss(0, self.latency_sigma))
+
+    def _fail(self) -> bool:
+        with self._lock:
+            return self._rng.random() < self.error_rate
+
+    def _local_items(self, query: str) -> list[dict]:
+        """질의마다 항상 같은 합성 식당 목록 (중심에서 spread_m 안에 흩뿌림)."""
+        rng = random.Random(zlib.crc32(query.encode("utf-8")))
+        items = []
+        for i in range(self.local_items):
+            distance = rng.uniform(0, self.spread_m)
+            bearing = rng.uniform(0, 2 * math.pi)
+            lat = AREA_CENTER["lat"] + distance * math.cos(bearing) / 111_000
+            lng = AREA_CENTER["lng"] + distance * math.sin(bearing) / 88_000
+            name = f"{query.split()[-1]} 식당 {zlib.crc32(f'{query}-{i}'.encode()) % 5000:04d}"
+            items.append({
+                "title": f"<b>{name}</b>",
+                "link": "",
+                "category": rng.choice(_CATEGORIES),
+                "description": "",
+                "telephone": f"02-{rng.randint(100, 999)}-{rng.randint(1000, 9999)}",
+                "address": f"서울특별시 중구 태평로1가 {i + 1}",
+                "roadAddress": f"서울특별시 중구 세종대로 {i + 1}",
+                "mapx": str(int(lng * 1e7)),
+                "mapy": str(int(lat * 1e7)),
+            })
+        return items
+
+    def _blog_items(self, query: str) -> list[dict]:
+        return [
+            {
+                "title": f"{query} {i + 1}",
+                "link": f"https://blog.example.com/{zlib.crc32(query.encode())}/{i}",
+                "description": f"{query} 다녀왔어요. 점심 메뉴 11,000원, 양 많고 맛있어요. " * 3,
+            }
+            for i in range(self.blog_items)
+        ]
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        params = request.url.params
+        with self._lock:
+            if path == _LOCAL_PATH:
+                self.stats.local_calls += 1
+            elif path == _BLOG_PATH:
+                self.stats.blog_calls += 1
+            self.stats.bytes_sent += len(str(request.url)) + sum(
+                len(k) + len(v) for k, v in request.headers.raw
+            )
+
+        delay = self._sample_latency()
+        read_timeout = (request.extensions.get("timeout") or {}).get("read")
+        if read_timeout is not None and delay > read_timeout:
+            time.sleep(read_timeout)
+            with self._lock:
+                self.stats.timeouts += 1
+            raise httpx.ReadTimeout("mock API timeout", request=request)
+        time.sleep(delay)
+
+        if self._fail():
+            with self._lock:
+                self.stats.errors += 1
+            return httpx.Response(503, json={"errorMessage": "mock error"})
+
+        query = params.get("query", "")
+        if path == _LOCAL_PATH:
+            start = int(params.get("start", 1))
+            display = int(params.get("display", 5))
+            items = self._local_items(query)[start - 1:start - 1 + display]
+        elif path == _BLOG_PATH:
+            items = self._blog_items(query)[:int(params.get("display", 10))]
+        else:
+            return httpx.Response(404)
+
+        response = httpx.Response(200, json={"total": len(items), "items": items})
+        with self._lock:
+            self.stats.bytes_received += len(response.content)
+        return response
+
+
+@contextmanager
+def _empty_exclusions():
+    """제외 목록은 빈 임시 DB를 사용합니다."""
+    with tempfile.TemporaryDirectory() as tmp:
+        with patch.object(db_module, "db", DatabaseManager(str(Path(tmp) / "bench.db"))):
+            yield
+
+
+@contextmanager
+def mock_naver_api(api: MockNaverApi):
+    """search 모듈의 httpx.get을 모의 API로 보냅니다."""
+    client = httpx.Client(transport=httpx.MockTransport(api))
+    with _empty_exclusions(), patch.object(search_module.httpx, "get", client.get):
+        try:
+            yield api
+        finally:
+            client.close()
+
+
+@contextmanager
+def replay_naver_api(cassette: Cassette):
+    """녹화된 카세트의 응답으로 검색합니다."""
+    with _empty_exclusions(), cassette:
+        yield cassette
+
+
+def build_cases(args: argparse.Namespace, api_cache: TTLCache | None) -> dict:
+    """측정할 시나리오 (이름 → 검색 한 번 실행 함수)."""
+    keywords = args.keywords or list(CUISINE_TYPES.values())
+    # 앱과 같이 지연 통계/브레이커 상태를 모든 검색이 공유
+    caller = ResilientCaller() if args.resilient else None
+
+    def searcher() -> RestaurantSearcher:
+        return RestaurantSearcher(
+            "bench-id",
+            "bench-secret",
+            center_lat=AREA_CENTER["lat"],
+            center_lng=AREA_CENTER["lng"],
+            api_cache=api_cache,
+            caller=caller,
+            max_pages=args.pages,
+            page_concurrency=args.page_concurrency,
+        )
+
+    def run_search(i: int):
+        return searcher().search(
+            AREA_CENTER["name"], keywords[i % len(keywords)], radius=args.radius,
+            timeout_budget=args.budget,
+        )
+
+    def run_expanded(i: int):
+        results, _ = searcher().search_with_expanded_radius(
+            AREA_CENTER["name"], keywords[i % len(keywords)], initial_radius=args.radius,
+            timeout_budget=args.budget,
+        )
+        return results
+
+    return {"search": run_search, "search_with_expanded_radius": run_expanded}
+
+
+def measure_allocations(func) -> dict:
+    """func(0) 한 번 실행하는 동안의 파이썬 메모리 할당 (tracemalloc)."""
+    tracemalloc.start()
+    try:
+        func(0)
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"alloc_current_kb": round(current / 1024, 1), "alloc_peak_kb": round(peak / 1024, 1)}
+
+
+def run(args: argparse.Namespace) -> dict:
+    results = {}
+    for name in ("search", "search_with_expanded_radius"):
+        if args.only and name not in args.only:
+            continue
+
+        # --cache면 반복 사이에 API 응답 캐시를 공유 (따뜻한 캐시), 아니면 매번 API 호출
+        api_cache = TTLCache(ttl=3600, max_bytes=64 * 1024 * 1024) if args.cache else None
+        if args.cassette:
+            cassette = Cassette(args.cassette, mode=MODE_REPLAY, speed=args.replay_speed)
+            with replay_naver_api(cassette):
+                func = build_cases(args, api_cache)[name]
+                timing = time_operation(func, args.iterations)
+                stats = {"replayed": cassette.replayed, "misses": cassette.misses}
+                allocations = measure_allocations(func)
+            calls = stats["replayed"]
+        else:
+            api = MockNaverApi(
+                latency_ms=args.latency_ms,
+                latency_sigma=args.latency_sigma,
+                error_rate=args.error_rate,
+                local_items=args.local_items,
+                blog_items=args.blog_items,
+                seed=args.seed,
+            )
+            with mock_naver_api(api):
+                func = build_cases(args, api_cache)[name]
+                timing = time_operation(func, args.iterations)
+                stats = asdict(api.stats)
+                allocations = measure_allocations(func)
+            calls = stats["local_calls"] + stats["blog_calls"]
+
+        results[name] = {
+            **timing,
+            **stats,
+            "api_calls_per_search": round(calls / args.iterations, 2),
+            **allocations,
+        }
+        print(
+            f"{name:<28} p50={timing['p50_ms']:>9.1f}ms p95={timing['p95_ms']:>9.1f}ms "
+            f"API {results[name]['api_calls_per_search']:>6.1f}회/검색 "
+            f"할당 최대 {allocations['alloc_peak_kb']:>8.1f}KB"
+        )
+
+    return {
+        "benchmark": "restaurant_search",
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "environment": {
+            "python": platform.python_version(),
+            "httpx": httpx.__version__,
+            "platform": platform.platform(),
+        },
+        "config": {
+            key: value for key, value in vars(args).items() if key not in ("output", "only")
+        },
+        "results": results,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="RestaurantSearcher 벤치마크 (모의 네이버 API)")
+    parser.add_argument("--iterations", type=int, default=30, help="시나리오별 검색 횟수")
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="API 응답 지연 중앙값 (ms)")
+    parser.add_argument("--latency-sigma", type=float, default=0.5, help="지연 로그정규분포 퍼짐")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="503 오류 비율 (0~1)")
+    parser.add_argument("--local-items", type=int, default=30, help="질의당 지역 검색 결과 수")
+    parser.add_argument("--blog-items", type=int, default=3, help="질의당 블로그 검색 결과 수")
+    parser.add_argument("--radius", type=int, default=1000, help="검색 반경 (m)")
+    parser.add_argument("--budget", type=float, default=SEARCH_TIMEOUT_BUDGET, help="검색 시간 예산 (초)")
+    parser.add_argument("--pages", type=int, default=1, help="지역×키워드당 최대 페이지 수")
+    parser.add_argument("--page-concurrency", type=int, default=1, help="동시에 요청할 페이지 수")
+    parser.add_argument("--resilient", action="store_true", help="재시도/헤지/서킷 브레이커 사용")
+    parser.add_argument("--cache", action="store_true", help="반복 사이에 API 응답 캐시 공유")
+    parser.add_argument("--cassette", help="모의 API 대신 재생할 카세트 파일")
+    parser.add_argument("--replay-speed", type=float, default=None,
+                        help="카세트 재생 속도 (1.0: 녹화 당시 응답 시간, 생략: 지연 없이)")
+    parser.add_argument("--keywords", nargs="*", help="검색 키워드 (기본: 모든 음식 종류)")
+    parser.add_argument("--seed", type=int, default=0, help="지연/오류 난수 시드")
+    parser.add_argument("--only", nargs="*", help="측정할 시나리오 이름만 지정")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    args = parser.parse_args(argv)
+
+    report = run(args)
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+        print(f"결과 저장: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
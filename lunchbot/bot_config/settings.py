@@ -76,8 +76,60 @@ NAVER_BLOG_SEARCH_API_URL = "https://openapi.naver.com/v1/search/blog.json"
 NAVER_PLACE_URL = "https://map.naver.com/v5/entry/place"
 NAVER_BOOKING_BASE_URL = "https://booking.naver.com"
 
+# 검색 한 번에 쓸 최대 시간 (초). 넘기면 그때까지 모은 결과만 보여 줌
+SEARCH_TIMEOUT_BUDGET = 8.0
+
+# 지역×키워드 검색의 추가 페이지 (기본 1: 첫 페이지만, 2 이상이면 사용)
+# 네이버 지역 검색 API는 start/display 상한이 있어 추가 페이지가 대부분 중복이고 호출 한도만 씀.
+# 켜면 한 번에 SEARCH_PAGE_CONCURRENCY 페이지씩 동시에 요청하고, 반경 안 새 후보가 없으면 멈춤
+SEARCH_MAX_PAGES = 1
+SEARCH_PAGE_CONCURRENCY = 2
+
+# 네이버 API 호출 복원력 (프로세스 내 모든 세션 공유)
+NAVER_API_MAX_ATTEMPTS = 3  # 일시적 오류(연결 실패, 5xx, 429) 재시도 포함 최대 시도 횟수
+NAVER_API_RETRY_BASE_DELAY = 0.2  # 초, 재시도 대기는 0 ~ base * 2^n 사이 무작위 (full jitter)
+NAVER_API_HEDGE = True  # 최근 p95보다 늦은 요청은 같은 요청을 하나 더 보내 먼저 온 응답 사용
+NAVER_API_BREAKER_THRESHOLD = 5  # 연속 실패가 이만큼 쌓이면 호출 차단
+NAVER_API_BREAKER_RESET = 30.0  # 초, 차단 후 이 시간이 지나면 시험 호출 하나 허용
+
+# 검색 결과 캐시 (프로세스 내 모든 세션 공유)
+# TTL이 지나도 MAX_AGE 전까지는 기존 결과를 바로 보여 주고 백그라운드에서 갱신
+SEARCH_CACHE_TTL = 10 * 60  # 초
+SEARCH_CACHE_MAX_AGE = 6 * 3600  # 초, 이보다 오래된 결과는 기다려서 새로 검색
+SEARCH_CACHE_MAX_BYTES = 16 * 1024 * 1024
+
+# 네이버 API 응답 캐시 (지역/블로그 검색 요청 단위)
+API_CACHE_TTL = 30 * 60
+API_CACHE_MAX_AGE = 24 * 3600
+API_CACHE_MAX_BYTES = 32 * 1024 * 1024
+
+# 점심시간 전 검색 캐시 미리 채우기
+PREWARM_ENABLED = True
+PREWARM_TIME = "11:00"
+PREWARM_WEEKDAYS = (0, 1, 2, 3, 4)  # 월~금
+PREWARM_REQUESTS_PER_SECOND = 5.0
+PREWARM_MAX_API_CALLS = 3000  # 1회 실행의 API 호출 한도 (일일 쿼터 25,000회 중)
+
+# 네이버 API/지도 트래픽 녹화·재생 (bot_utils.cassette)
+# "": 사용 안 함, "record": 요청/응답을 CASSETTE_PATH에 기록, "replay": 기록된 응답으로만 동작
+CASSETTE_MODE = ""
+CASSETTE_PATH = "data/cassettes/naver.jsonl.gz"
+CASSETTE_REPLAY_SPEED = 1.0  # 1.0: 녹화 당시 응답 시간 그대로, 10: 10배 빠르게, None: 지연 없이
+
 # 예약 이력 DB
 HISTORY_DB_PATH = "data/history.db"
 
+# 이력 분석용 Parquet 스냅샷 디렉터리
+ANALYTICS_SNAPSHOT_DIR = "data/analytics"
+
+# 네이버 지도 URL 파싱 캐시 (단축 URL → Place ID, Place ID → 식당 정보)
+PLACE_CACHE_DB_PATH = "data/place_cache.db"
+SHORT_URL_CACHE_TTL = 90 * 24 * 3600  # 단축 URL 매핑은 거의 바뀌지 않음
+PLACE_INFO_CACHE_TTL = 7 * 24 * 3600  # 상호/주소/카테고리는 가끔 바뀜
+
+# Slack 알림 아웃박스
+SLACK_COALESCE_WINDOW = 2.0  # 초, 이 시간 안에 같은 Webhook으로 쌓인 알림은 한 메시지로 전송
+SLACK_MAX_ATTEMPTS = 8  # 이 횟수만큼 실패하면 failed로 표시하고 포기
+
 # 즐겨찾기 파일
 FAVORITES_PATH = "data/favorites.json"
@@ -0,0 +1,209 @@
+"""이력 분석 모듈 (Parquet 스냅샷 + pandas 집계)
+
+운영 DB(SQLite)를 직접 스캔하지 않도록 search_history / favorites / exclusions를
+컬럼 지향 Parquet 스냅샷으로 떠두고, 리포트는 스냅샷만 읽어 벡터 연산으로 집계합니다.
+
+- search_history: 추가 전용이므로 high-water-mark id 이후 행만 새 파트 파일로 추가
+- favorites / exclusions: 삭제가 일어나는 작은 테이블이므로 매번 전체 재작성
+- 모든 파일은 임시 이름으로 쓴 뒤 os.replace로 교체하고, _meta.json을 마지막에 씀.
+  파트 파일을 쓴 직후 중단되면 high-water-mark보다 큰 파트가 남는데, 읽을 때 무시하고 다음 갱신에서 지움
+"""
+
+import json
+import os
+import sqlite3
+from dataclasses import dataclass
+from pathlib import Path
+
+import pandas as pd
+
+from bot_config.settings import HISTORY_DB_PATH, ANALYTICS_SNAPSHOT_DIR
+
+WEEKDAYS = ["월", "화", "수", "목", "금", "토", "일"]
+
+_HISTORY_QUERY = """
+    SELECT h.id, h.created_at, r.name AS restaurant_name, r.address,
+           h.cuisine_type, h.area, h.reservation_date, h.reservation_time,
+           h.party_size
+    FROM search_history h
+    JOIN restaurants r ON r.id = h.restaurant_id
+    WHERE h.id > ?
+    ORDER BY h.id
+"""
+
+_FAVORITES_QUERY = """
+    SELECT f.id, f.created_at, r.name AS restaurant_name, r.address, f.category
+    FROM favorites f
+    JOIN restaurants r ON r.id = f.restaurant_id
+"""
+
+_EXCLUSIONS_QUERY = """
+    SELECT e.id, e.created_at, r.name AS restaurant_name, r.address, e.reason
+    FROM exclusions e
+    JOIN restaurants r ON r.id = e.restaurant_id
+"""
+
+
+def _replace_atomically(path: Path, write) -> None:
+    """write(임시 경로)로 파일을 만든 뒤 한 번에 교체합니다. 읽는 쪽은 이전 파일이나 완성된 파일만 봅니다."""
+    tmp = path.with_name(f"{path.name}.tmp")
+    try:
+        write(tmp)
+        os.replace(tmp, path)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+def _part_last_id(part: Path) -> int:
+    """part-{첫 id}-{마지막 id}.parquet 파일의 마지막 id."""
+    return int(part.stem.rsplit("-", 1)[1])
+
+
+@dataclass
+class SnapshotStats:
+    """스냅샷 갱신 결과."""
+
+    new_history_rows: int
+    history_high_water_mark: int
+    favorites: int
+    exclusions: int
+
+
+class HistorySnapshot:
+    """SQLite 운영 DB의 Parquet 스냅샷을 관리하고 리포트를 계산합니다."""
+
+    def __init__(self, db_path: str = HISTORY_DB_PATH, snapshot_dir: str = ANALYTICS_SNAPSHOT_DIR):
+        self.db_path = db_path
+        self.snapshot_dir = Path(snapshot_dir)
+
+    @property
+    def _meta_path(self) -> Path:
+        return self.snapshot_dir / "_meta.json"
+
+    @property
+    def _history_dir(self) -> Path:
+        return self.snapshot_dir / "search_history"
+
+    def _read_meta(self) -> dict:
+        if not self._meta_path.exists():
+            return {}
+        return json.loads(self._meta_path.read_text(encoding="utf-8"))
+
+    @property
+    def high_water_mark(self) -> int:
+        """스냅샷에 반영된 마지막 search_history id."""
+        return int(self._read_meta().get("search_history_hwm", 0))
+
+    def _history_parts(self, hwm: int) -> list[Path]:
+        """high-water-mark까지 반영된 파트 파일 (메타 기록 전에 중단돼 남은 파트는 제외)."""
+        if not self._history_dir.exists():
+            return []
+        return sorted(p for p in self._history_dir.glob("part-*.parquet") if _part_last_id(p) <= hwm)
+
+    # ─── 스냅샷 갱신 ────────────────────────────────────────────
+    def refresh(self) -> SnapshotStats:
+        """운영 DB에서 새 이력만 읽어 스냅샷을 증분 갱신합니다."""
+        self._history_dir.mkdir(parents=True, exist_ok=True)
+        hwm = self.high_water_mark
+
+        # 읽기 전용 연결: 앱의 쓰기와 경합하지 않도록 짧게 읽고 바로 닫음
+        conn = sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True)
+        try:
+            history = pd.read_sql_query(_HISTORY_QUERY, conn, params=(hwm,))
+            favorites = pd.read_sql_query(_FAVORITES_QUERY, conn)
+            exclusions = pd.read_sql_query(_EXCLUSIONS_QUERY, conn)
+        finally:
+            conn.close()
+
+        # 지난 갱신이 메타 기록 전에 중단돼 남은 파트는 이번에 다시 읽었으므로 지움
+        for orphan in self._history_dir.glob("part-*.parquet"):
+            if _part_last_id(orphan) > hwm:
+                orphan.unlink()
+
+        if not history.empty:
+            new_hwm = int(history["id"].max())
+            part = self._history_dir / f"part-{hwm + 1:012d}-{new_hwm:012d}.parquet"
+            _replace_atomically(part, lambda tmp: history.to_parquet(tmp, index=False))
+            hwm = new_hwm
+
+        _replace_atomically(
+            self.snapshot_dir / "favorites.parquet", lambda tmp: favorites.to_parquet(tmp, index=False)
+        )
+        _replace_atomically(
+            self.snapshot_dir / "exclusions.parquet", lambda tmp: exclusions.to_parquet(tmp, index=False)
+        )
+
+        # 메타가 마지막: 여기까지 와야 새 파트가 읽기 대상이 됨
+        _replace_atomically(
+            self._meta_path,
+            lambda tmp: tmp.write_text(json.dumps({"search_history_hwm": hwm}), encoding="utf-8"),
+        )
+        return SnapshotStats(
+            new_history_rows=len(history),
+            history_high_water_mark=hwm,
+            favorites=len(favorites),
+            exclusions=len(exclusions),
+        )
+
+    # ─── 스냅샷 읽기 ────────────────────────────────────────────
+    def load_history(self) -> pd.DataFrame:
+        """스냅샷의 검색 이력을 파생 컬럼(요일/월)과 함께 반환합니다."""
+        parts = self._history_parts(self.high_water_mark)
+        if not parts:
+            return pd.DataFrame()
+        df = pd.concat([pd.read_parquet(p) for p in parts], ignore_index=True)
+
+        # "2026년 2월 16일 (월)" 형식의 예약일을 벡터 연산으로 분해
+        parsed = df["reservation_date"].fillna("").str.extract(
+            r"(?P<year>\d{4})년\s*(?P<month>\d{1,2})월\s*(?P<day>\d{1,2})일"
+        )
+        df["reservation_day"] = pd.to_datetime(parsed, errors="coerce")
+        df["weekday"] = pd.Categorical(
+            df["reservation_day"].dt.dayofweek.map(dict(enumerate(WEEKDAYS))),
+            categories=WEEKDAYS,
+            ordered=True,
+        )
+        df["month"] = df["reservation_day"].dt.strftime("%Y-%m")
+        return df
+
+    def load_favorites(self) -> pd.DataFrame:
+        path = self.snapshot_dir / "favorites.parquet"
+        return pd.read_parquet(path) if path.exists() else pd.DataFrame()
+
+    def load_exclusions(self) -> pd.DataFrame:
+        path = self.snapshot_dir / "exclusions.parquet"
+        return pd.read_parquet(path) if path.exists() else pd.DataFrame()
+
+    # ─── 리포트 ─────────────────────────────────────────────────
+    def cuisine_by_weekday(self) -> pd.DataFrame:
+        """요일(행) × 음식 종류(열)별 선택 횟수."""
+        df = self.load_history()
+        if df.empty:
+            return pd.DataFrame()
+        df = df.dropna(subset=["weekday"])
+        return pd.crosstab(df["weekday"], df["cuisine_type"].fillna(""))
+
+    def party_size_by_area_month(self) -> pd.DataFrame:
+        """지역 × 월별 평균 인원수."""
+        df = self.load_history()
+        if df.empty:
+            return pd.DataFrame()
+        df = df.dropna(subset=["month"])
+        df = df[df["party_size"] > 0]
+        return df.pivot_table(
+            index="month", columns="area", values="party_size", aggfunc="mean"
+        ).round(1)
+
+    def top_restaurants(self, limit: int = 10) -> pd.DataFrame:
+        """가장 많이 선택된 식당 순위."""
+        df = self.load_history()
+        if df.empty:
+            return pd.DataFrame()
+        counts = (
+            df.groupby(["restaurant_name", "address"], dropna=False)
+            .size()
+            .rename("count")
+            .reset_index()
+            .sort_values("count", ascending=False)
+        )
+        return counts.head(limit).reset_index(drop=True)
@@ -3,6 +3,8 @@
 검색 이력, 즐겨찾기, 제외 목록을 관리하는 중앙 DB 모듈입니다.
 """
 
+import hashlib
+import re
 import sqlite3
 import json
 from pathlib import Path
@@ -10,6 +12,7 @@ from datetime import datetime
 from dataclasses import dataclass
 
 from bot_config.settings import HISTORY_DB_PATH
+from bot_utils.geo import bounding_box, haversine_distances
 
 
 @dataclass
@@ -27,6 +30,33 @@ class SearchRecord:
     link: str
 
 
+def restaurant_key(name: str, address: str) -> str:
+    """
+    식당의 정규화된 식별 키를 만듭니다.
+
+    공백/대소문자 차이를 무시한 이름 + 주소의 해시값이며,
+    restaurants 테이블의 유니크 키로 사용됩니다.
+    """
+    def _normalize(text: str) -> str:
+        return re.sub(r"\s+", "", text or "").lower()
+
+    raw = f"{_normalize(name)}|{_normalize(address)}"
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def restaurant_keys(name: str, address: str, jibun_address: str = "") -> set[str]:
+    """
+    도로명 주소 키와 지번 주소 키를 함께 반환합니다.
+
+    지금은 도로명 주소를 우선해 식별하지만, 구버전 즐겨찾기/제외 목록은 지번 주소로
+    저장돼 있어 마이그레이션 후에도 지번 주소 키를 갖습니다. 조회할 때 둘 다 확인합니다.
+    """
+    keys = {restaurant_key(name, address)}
+    if jibun_address:
+        keys.add(restaurant_key(name, jibun_address))
+    return keys
+
+
 class DatabaseManager:
     def __init__(self, db_path: str = HISTORY_DB_PATH):
         self.db_path = db_path
@@ -37,14 +67,42 @@ class DatabaseManager:
         Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
         with sqlite3.connect(self.db_path) as conn:
             cursor = conn.cursor()
-            
+
+            # 식당 엔티티 테이블 (정규화된 식별 키 → 정수 ID)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS restaurants (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    identity_key TEXT NOT NULL UNIQUE,
+                    name TEXT NOT NULL,
+                    address TEXT
+                )
+            """)
+
+            # 좌표/보강 상태 컬럼 추가 (Migration)
+            cursor.execute("PRAGMA table_info(restaurants)")
+            columns = [info[1] for info in cursor.fetchall()]
+            for column, column_type in (
+                ("lat", "REAL"),
+                ("lng", "REAL"),
+                ("enriched_at", "TIMESTAMP"),
+                ("enrich_status", "TEXT"),
+            ):
+                if column not in columns:
+                    try:
+                        cursor.execute(f"ALTER TABLE restaurants ADD COLUMN {column} {column_type}")
+                    except Exception as e:
+                        print(f"[DB Migration Error] {e}")
+
+            # 구버전(이름/주소 텍스트 중복 저장) 테이블은 옆으로 치워두고 새 스키마로 옮김
+            legacy_tables = self._rename_legacy_tables(cursor)
+
             # 검색 이력 테이블
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS search_history (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    restaurant_name TEXT NOT NULL,
-                    address TEXT,
+                    restaurant_id INTEGER NOT NULL REFERENCES restaurants(id),
                     phone TEXT,
                     cuisine_type TEXT,
                     area TEXT,
@@ -54,50 +112,164 @@ class DatabaseManager:
                     link TEXT
                 )
             """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_search_history_restaurant
+                ON search_history (restaurant_id)
+            """)
 
             # 즐겨찾기 테이블
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS favorites (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    restaurant_name TEXT NOT NULL,
-                    address TEXT,
-                    memo TEXT
+                    restaurant_id INTEGER NOT NULL REFERENCES restaurants(id),
+                    memo TEXT,
+                    category TEXT
                 )
             """)
-            # 식당 이름 + 주소 복합 유니크 제약
+            # 식당당 하나의 즐겨찾기
             cursor.execute("""
-                CREATE UNIQUE INDEX IF NOT EXISTS idx_favorites_name_addr 
-                ON favorites (restaurant_name, address)
+                CREATE UNIQUE INDEX IF NOT EXISTS idx_favorites_restaurant
+                ON favorites (restaurant_id)
             """)
 
-            # 2. Add 'category' column if not exists (Migration)
-            cursor.execute("PRAGMA table_info(favorites)")
-            columns = [info[1] for info in cursor.fetchall()]
-            if "category" not in columns:
-                try:
-                    cursor.execute("ALTER TABLE favorites ADD COLUMN category TEXT")
-                except Exception as e:
-                    print(f"[DB Migration Error] {e}")
-
             # 제외 목록 테이블
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS exclusions (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    restaurant_name TEXT NOT NULL,
-                    address TEXT,
+                    restaurant_id INTEGER NOT NULL REFERENCES restaurants(id),
                     reason TEXT
                 )
             """)
-            # 식당 이름 + 주소 복합 유니크 제약
             cursor.execute("""
-                CREATE UNIQUE INDEX IF NOT EXISTS idx_exclusions_name_addr 
-                ON exclusions (restaurant_name, address)
+                CREATE UNIQUE INDEX IF NOT EXISTS idx_exclusions_restaurant
+                ON exclusions (restaurant_id)
             """)
 
+            if legacy_tables:
+                self._migrate_legacy_rows(cursor, legacy_tables)
+
+            self._init_spatial_index(cursor)
+
             conn.commit()
 
+    def _init_spatial_index(self, cursor):
+        """
+        식당 좌표용 R*Tree 인덱스를 만듭니다.
+        SQLite가 R*Tree 없이 빌드된 환경이면 (lat, lng) 일반 인덱스로 대신합니다.
+        """
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'restaurant_geo'")
+        exists = cursor.fetchone() is not None
+        try:
+            cursor.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS restaurant_geo USING rtree (
+                    id, min_lat, max_lat, min_lng, max_lng
+                )
+            """)
+            self._has_rtree = True
+        except sqlite3.OperationalError:
+            self._has_rtree = False
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_restaurants_lat_lng
+                ON restaurants (lat, lng)
+            """)
+            return
+
+        # 인덱스를 처음 만들 때만 기존 좌표를 채움
+        if not exists:
+            cursor.execute("""
+                INSERT INTO restaurant_geo (id, min_lat, max_lat, min_lng, max_lng)
+                SELECT id, lat, lat, lng, lng FROM restaurants
+                WHERE lat IS NOT NULL AND lng IS NOT NULL
+            """)
+
+    def _set_coordinates(self, cursor, restaurant_id: int, lat: float, lng: float):
+        """식당 좌표와 공간 인덱스를 함께 갱신합니다."""
+        cursor.execute(
+            "UPDATE restaurants SET lat = ?, lng = ? WHERE id = ?",
+            (lat, lng, restaurant_id),
+        )
+        if self._has_rtree:
+            cursor.execute(
+                "INSERT OR REPLACE INTO restaurant_geo (id, min_lat, max_lat, min_lng, max_lng) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (restaurant_id, lat, lat, lng, lng),
+            )
+
+    # ─── 마이그레이션 ────────────────────────────────────────────
+    _LEGACY_COLUMNS = {
+        "search_history": [
+            "phone", "cuisine_type", "area", "reservation_date",
+            "reservation_time", "party_size", "link",
+        ],
+        "favorites": ["memo", "category"],
+        "exclusions": ["reason"],
+    }
+
+    def _rename_legacy_tables(self, cursor) -> list[str]:
+        """restaurant_name 컬럼을 가진 구버전 테이블을 *_legacy 로 이름을 바꿉니다."""
+        renamed = []
+        for table in self._LEGACY_COLUMNS:
+            cursor.execute(f"PRAGMA table_info({table})")
+            columns = [info[1] for info in cursor.fetchall()]
+            if "restaurant_name" in columns and "restaurant_id" not in columns:
+                cursor.execute(f"ALTER TABLE {table} RENAME TO {table}_legacy")
+                renamed.append(table)
+        return renamed
+
+    def _migrate_legacy_rows(self, cursor, tables: list[str]):
+        """구버전 행을 restaurants 참조 형태로 복사한 뒤 구버전 테이블을 삭제합니다."""
+        for table in tables:
+            legacy = f"{table}_legacy"
+            cursor.execute(f"PRAGMA table_info({legacy})")
+            available = {info[1] for info in cursor.fetchall()}
+            # 'category' 처럼 나중에 추가된 컬럼은 구버전 DB에 없을 수 있음
+            extra = [c for c in self._LEGACY_COLUMNS[table] if c in available]
+
+            cursor.execute(
+                f"SELECT id, created_at, restaurant_name, address"
+                f"{''.join(', ' + c for c in extra)} FROM {legacy} ORDER BY id"
+            )
+            for row in cursor.fetchall():
+                row_id, created_at, name, address = row[:4]
+                restaurant_id = self._get_or_create_restaurant(cursor, name, address or "")
+                cursor.execute(
+                    f"INSERT OR IGNORE INTO {table} (id, created_at, restaurant_id"
+                    f"{''.join(', ' + c for c in extra)}) "
+                    f"VALUES (?, ?, ?{', ?' * len(extra)})",
+                    (row_id, created_at, restaurant_id, *row[4:]),
+                )
+            cursor.execute(f"DROP TABLE {legacy}")
+
+    # ─── 식당 엔티티 ─────────────────────────────────────────────
+    def _get_or_create_restaurant(self, cursor, name: str, address: str) -> int:
+        """식당 엔티티의 정수 ID를 반환합니다. 없으면 새로 만듭니다."""
+        key = restaurant_key(name, address)
+        cursor.execute(
+            "INSERT OR IGNORE INTO restaurants (identity_key, name, address) VALUES (?, ?, ?)",
+            (key, name, address),
+        )
+        cursor.execute("SELECT id FROM restaurants WHERE identity_key = ?", (key,))
+        return cursor.fetchone()[0]
+
+    def _find_restaurant_id(self, cursor, name: str, address: str) -> int | None:
+        cursor.execute(
+            "SELECT id FROM restaurants WHERE identity_key = ?",
+            (restaurant_key(name, address),),
+        )
+        row = cursor.fetchone()
+        return row[0] if row else None
+
+    def _stage_ids(self, cursor, restaurant_ids) -> None:
+        """일괄 작업 대상 식당 ID를 임시 테이블에 담습니다 (연결 종료 시 사라짐)."""
+        cursor.execute("CREATE TEMP TABLE IF NOT EXISTS bulk_ids (id INTEGER PRIMARY KEY)")
+        cursor.execute("DELETE FROM bulk_ids")
+        cursor.executemany(
+            "INSERT OR IGNORE INTO bulk_ids (id) VALUES (?)",
+            ((int(i),) for i in restaurant_ids),
+        )
+
     # ─── 검색 이력 ──────────────────────────────────────────────
     def save_search_result(
         self,
@@ -113,16 +285,16 @@ class DatabaseManager:
     ):
         with sqlite3.connect(self.db_path) as conn:
             cursor = conn.cursor()
+            restaurant_id = self._get_or_create_restaurant(cursor, restaurant_name, address)
             cursor.execute(
                 """
                 INSERT INTO search_history
-                    (restaurant_name, address, phone, cuisine_type, area,
+                    (restaurant_id, phone, cuisine_type, area,
                      reservation_date, reservation_time, party_size, link)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
                 """,
                 (
-                    restaurant_name,
-                    address,
+                    restaurant_id,
                     phone,
                     cuisine_type,
                     area,
@@ -139,41 +311,66 @@ class DatabaseManager:
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
             cursor.execute(
-                "SELECT * FROM search_history ORDER BY created_at DESC, id DESC LIMIT ?",
+                """
+                SELECT h.id, h.created_at, h.restaurant_id,
+                       r.name AS restaurant_name, r.address,
+                       h.phone, h.cuisine_type, h.area, h.reservation_date,
+                       h.reservation_time, h.party_size, h.link,
+                       EXISTS (SELECT 1 FROM favorites f WHERE f.restaurant_id = h.restaurant_id)
+                           AS is_favorite
+                FROM search_history h
+                JOIN restaurants r ON r.id = h.restaurant_id
+                ORDER BY h.created_at DESC, h.id DESC
+                LIMIT ?
+                """,
                 (limit,),
             )
             return [dict(row) for row in cursor.fetchall()]
 
     # ─── 즐겨찾기 ────────────────────────────────────────────────
+    _FAVORITES_SELECT = """
+        SELECT f.id, f.created_at, f.restaurant_id,
+               r.name AS restaurant_name, r.address, f.memo, f.category,
+               r.lat, r.lng
+        FROM favorites f
+        JOIN restaurants r ON r.id = f.restaurant_id
+    """
+
     def add_favorite(self, name: str, address: str, memo: str = "", category: str = "") -> bool:
         """즐겨찾기에 추가합니다. 이미 존재하면 무시합니다."""
         with sqlite3.connect(self.db_path) as conn:
             cursor = conn.cursor()
+            restaurant_id = self._get_or_create_restaurant(cursor, name, address)
             try:
                 cursor.execute(
-                    "INSERT INTO favorites (restaurant_name, address, memo, category) VALUES (?, ?, ?, ?)",
-                    (name, address, memo, category),
+                    "INSERT INTO favorites (restaurant_id, memo, category) VALUES (?, ?, ?)",
+                    (restaurant_id, memo, category),
                 )
                 conn.commit()
                 return True
             except sqlite3.IntegrityError:
                 return False
 
-    def remove_favorite(self, name: str, address: str):
+    def remove_favorite(self, name: str, address: str, jibun_address: str = ""):
+        keys = list(restaurant_keys(name, address, jibun_address))
         with sqlite3.connect(self.db_path) as conn:
             cursor = conn.cursor()
             cursor.execute(
-                "DELETE FROM favorites WHERE restaurant_name = ? AND address = ?",
-                (name, address),
+                "DELETE FROM favorites WHERE restaurant_id IN "
+                f"(SELECT id FROM restaurants WHERE identity_key IN ({', '.join('?' * len(keys))}))",
+                keys,
             )
             conn.commit()
 
-    def is_favorite(self, name: str, address: str) -> bool:
+    def is_favorite(self, name: str, address: str, jibun_address: str = "") -> bool:
+        """jibun_address를 주면 구버전(지번 주소) 키로 저장된 즐겨찾기도 찾습니다."""
+        keys = list(restaurant_keys(name, address, jibun_address))
         with sqlite3.connect(self.db_path) as conn:
             cursor = conn.cursor()
             cursor.execute(
-                "SELECT 1 FROM favorites WHERE restaurant_name = ? AND address = ?",
-                (name, address),
+                "SELECT 1 FROM favorites f JOIN restaurants r ON r.id = f.restaurant_id "
+                f"WHERE r.identity_key IN ({', '.join('?' * len(keys))})",
+                keys,
             )
             return cursor.fetchone() is not None
 
@@ -181,7 +378,48 @@ class DatabaseManager:
         with sqlite3.connect(self.db_path) as conn:
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
-            cursor.execute("SELECT * FROM favorites ORDER BY created_at DESC, id DESC")
+            cursor.execute(self._FAVORITES_SELECT + " ORDER BY f.created_at DESC, f.id DESC")
+            return [dict(row) for row in cursor.fetchall()]
+
+    # 목록 화면 정렬 옵션 (키 → ORDER BY 절)
+    _FAVORITE_SORTS = {
+        "recent": "f.created_at DESC, f.id DESC",
+        "oldest": "f.created_at ASC, f.id ASC",
+        "name": "r.name ASC, f.id DESC",
+        "category": "f.category ASC, r.name ASC",
+    }
+
+    def count_favorites(self, query: str = "") -> int:
+        """검색어에 맞는 즐겨찾기 개수를 반환합니다."""
+        pattern = f"%{query}%"
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT COUNT(*) FROM favorites f JOIN restaurants r ON r.id = f.restaurant_id "
+                "WHERE r.name LIKE ? OR r.address LIKE ? OR f.memo LIKE ?",
+                (pattern, pattern, pattern),
+            )
+            return cursor.fetchone()[0]
+
+    def get_favorites_page(
+        self,
+        query: str = "",
+        sort: str = "recent",
+        limit: int = 50,
+        offset: int = 0,
+    ) -> list[dict]:
+        """검색/정렬한 즐겨찾기 중 한 페이지만 반환합니다."""
+        pattern = f"%{query}%"
+        order = self._FAVORITE_SORTS.get(sort, self._FAVORITE_SORTS["recent"])
+        with sqlite3.connect(self.db_path) as conn:
+            conn.row_factory = sqlite3.Row
+            cursor = conn.cursor()
+            cursor.execute(
+                self._FAVORITES_SELECT
+                + " WHERE r.name LIKE ? OR r.address LIKE ? OR f.memo LIKE ?"
+                + f" ORDER BY {order} LIMIT ? OFFSET ?",
+                (pattern, pattern, pattern, limit, offset),
+            )
             return [dict(row) for row in cursor.fetchall()]
 
     # ─── 제외 목록 ──────────────────────────────────────────────
@@ -189,53 +427,239 @@ class DatabaseManager:
         """제외 목록에 추가합니다."""
         with sqlite3.connect(self.db_path) as conn:
             cursor = conn.cursor()
+            restaurant_id = self._get_or_create_restaurant(cursor, name, address)
             try:
                 cursor.execute(
-                    "INSERT INTO exclusions (restaurant_name, address, reason) VALUES (?, ?, ?)",
-                    (name, address, reason),
+                    "INSERT INTO exclusions (restaurant_id, reason) VALUES (?, ?)",
+                    (restaurant_id, reason),
                 )
                 conn.commit()
                 return True
             except sqlite3.IntegrityError:
                 return False
 
-    def remove_exclusion(self, name: str, address: str):
+    def remove_exclusion(self, name: str, address: str, jibun_address: str = ""):
+        keys = list(restaurant_keys(name, address, jibun_address))
         with sqlite3.connect(self.db_path) as conn:
             cursor = conn.cursor()
             cursor.execute(
-                "DELETE FROM exclusions WHERE restaurant_name = ? AND address = ?",
-                (name, address),
+                "DELETE FROM exclusions WHERE restaurant_id IN "
+                f"(SELECT id FROM restaurants WHERE identity_key IN ({', '.join('?' * len(keys))}))",
+                keys,
             )
             conn.commit()
 
-    def is_excluded(self, name: str, address: str) -> bool:
+    def is_excluded(self, name: str, address: str, jibun_address: str = "") -> bool:
+        """jibun_address를 주면 구버전(지번 주소) 키로 저장된 제외 식당도 찾습니다."""
+        keys = list(restaurant_keys(name, address, jibun_address))
         with sqlite3.connect(self.db_path) as conn:
             cursor = conn.cursor()
             cursor.execute(
-                "SELECT 1 FROM exclusions WHERE restaurant_name = ? AND address = ?",
-                (name, address),
+                "SELECT 1 FROM exclusions e JOIN restaurants r ON r.id = e.restaurant_id "
+                f"WHERE r.identity_key IN ({', '.join('?' * len(keys))})",
+                keys,
             )
             return cursor.fetchone() is not None
 
+    def get_excluded_keys(self) -> set[str]:
+        """
+        제외된 식당의 식별 키 집합을 반환합니다 (검색 결과 일괄 필터링용).
+        구버전 데이터까지 거르려면 restaurant_keys()의 키 중 하나라도 들어 있는지 확인합니다.
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT r.identity_key FROM exclusions e JOIN restaurants r ON r.id = e.restaurant_id"
+            )
+            return {row[0] for row in cursor.fetchall()}
+
+    _EXCLUSIONS_SELECT = """
+        SELECT e.id, e.created_at, e.restaurant_id,
+               r.name AS restaurant_name, r.address, e.reason
+        FROM exclusions e
+        JOIN restaurants r ON r.id = e.restaurant_id
+    """
+
+    _EXCLUSION_SORTS = {
+        "recent": "e.created_at DESC, e.id DESC",
+        "oldest": "e.created_at ASC, e.id ASC",
+        "name": "r.name ASC, e.id DESC",
+    }
+
     def get_exclusions(self) -> list[dict]:
         with sqlite3.connect(self.db_path) as conn:
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
-            cursor.execute("SELECT * FROM exclusions ORDER BY created_at DESC, id DESC")
+            cursor.execute(self._EXCLUSIONS_SELECT + " ORDER BY e.created_at DESC, e.id DESC")
             return [dict(row) for row in cursor.fetchall()]
 
+    def count_exclusions(self, query: str = "") -> int:
+        """검색어에 맞는 제외 식당 개수를 반환합니다."""
+        pattern = f"%{query}%"
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT COUNT(*) FROM exclusions e JOIN restaurants r ON r.id = e.restaurant_id "
+                "WHERE r.name LIKE ? OR r.address LIKE ? OR e.reason LIKE ?",
+                (pattern, pattern, pattern),
+            )
+            return cursor.fetchone()[0]
 
-    def search_favorites(self, query: str) -> list[dict]:
-        """즐겨찾기에서 검색합니다."""
+    def get_exclusions_page(
+        self,
+        query: str = "",
+        sort: str = "recent",
+        limit: int = 50,
+        offset: int = 0,
+    ) -> list[dict]:
+        """검색/정렬한 제외 식당 중 한 페이지만 반환합니다."""
+        pattern = f"%{query}%"
+        order = self._EXCLUSION_SORTS.get(sort, self._EXCLUSION_SORTS["recent"])
         with sqlite3.connect(self.db_path) as conn:
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
-            pattern = f"%{query}%"
             cursor.execute(
-                "SELECT * FROM favorites WHERE restaurant_name LIKE ? OR address LIKE ? OR memo LIKE ? ORDER BY created_at DESC, id DESC",
-                (pattern, pattern, pattern),
+                self._EXCLUSIONS_SELECT
+                + " WHERE r.name LIKE ? OR r.address LIKE ? OR e.reason LIKE ?"
+                + f" ORDER BY {order} LIMIT ? OFFSET ?",
+                (pattern, pattern, pattern, limit, offset),
             )
             return [dict(row) for row in cursor.fetchall()]
+
+    # ─── 일괄 작업 ──────────────────────────────────────────────
+    # 목록 화면에서 선택한 N건을 한 트랜잭션(연결 1회)으로 처리합니다.
+    def move_favorites_to_exclusions(self, restaurant_ids, reason: str = "즐겨찾기에서 이동됨") -> int:
+        """즐겨찾기를 제외 목록으로 옮기고 옮긴 개수를 반환합니다."""
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            self._stage_ids(cursor, restaurant_ids)
+            cursor.execute(
+                "INSERT OR IGNORE INTO exclusions (restaurant_id, reason) "
+                "SELECT restaurant_id, ? FROM favorites WHERE restaurant_id IN (SELECT id FROM bulk_ids)",
+                (reason,),
+            )
+            cursor.execute("DELETE FROM favorites WHERE restaurant_id IN (SELECT id FROM bulk_ids)")
+            return cursor.rowcount
+
+    def move_exclusions_to_favorites(self, restaurant_ids, memo: str = "제외 목록에서 복구됨") -> int:
+        """제외 식당을 즐겨찾기로 옮기고 옮긴 개수를 반환합니다."""
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            self._stage_ids(cursor, restaurant_ids)
+            cursor.execute(
+                "INSERT OR IGNORE INTO favorites (restaurant_id, memo, category) "
+                "SELECT restaurant_id, ?, '' FROM exclusions WHERE restaurant_id IN (SELECT id FROM bulk_ids)",
+                (memo,),
+            )
+            cursor.execute("DELETE FROM exclusions WHERE restaurant_id IN (SELECT id FROM bulk_ids)")
+            return cursor.rowcount
+
+    def remove_favorites(self, restaurant_ids) -> int:
+        """즐겨찾기 여러 건을 삭제하고 삭제한 개수를 반환합니다."""
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            self._stage_ids(cursor, restaurant_ids)
+            cursor.execute("DELETE FROM favorites WHERE restaurant_id IN (SELECT id FROM bulk_ids)")
+            return cursor.rowcount
+
+    def remove_exclusions(self, restaurant_ids) -> int:
+        """제외 식당 여러 건을 해제하고 해제한 개수를 반환합니다."""
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            self._stage_ids(cursor, restaurant_ids)
+            cursor.execute("DELETE FROM exclusions WHERE restaurant_id IN (SELECT id FROM bulk_ids)")
+            return cursor.rowcount
+
+    def tag_favorites(self, restaurant_ids, category: str) -> int:
+        """즐겨찾기 여러 건의 카테고리를 한 번에 바꾸고 바뀐 개수를 반환합니다."""
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            self._stage_ids(cursor, restaurant_ids)
+            cursor.execute(
+                "UPDATE favorites SET category = ? WHERE restaurant_id IN (SELECT id FROM bulk_ids)",
+                (category,),
+            )
+            return cursor.rowcount
+
+
+    def search_favorites(
+        self,
+        query: str,
+        center_lat: float | None = None,
+        center_lng: float | None = None,
+        radius_m: float | None = None,
+    ) -> list[dict]:
+        """
+        즐겨찾기에서 검색합니다.
+
+        중심점을 주면 좌표가 있는 식당은 distance_m을 계산해 가까운 순으로 정렬하고,
+        radius_m까지 주면 반경 밖 식당을 공간 인덱스로 걸러냅니다.
+        좌표가 없는 식당은 거리를 알 수 없으므로 항상 뒤에 붙습니다 (distance_m=None).
+        """
+        pattern = f"%{query}%"
+        text_filter = "(r.name LIKE ? OR r.address LIKE ? OR f.memo LIKE ?)"
+        order = " ORDER BY f.created_at DESC, f.id DESC"
+
+        with sqlite3.connect(self.db_path) as conn:
+            conn.row_factory = sqlite3.Row
+            cursor = conn.cursor()
+
+            if center_lat is None or center_lng is None:
+                cursor.execute(
+                    self._FAVORITES_SELECT + f" WHERE {text_filter}" + order,
+                    (pattern, pattern, pattern),
+                )
+                return [dict(row) for row in cursor.fetchall()]
+
+            # 1. 좌표가 있는 식당: 반경을 감싸는 사각형으로 후보를 좁힘
+            if radius_m:
+                min_lat, max_lat, min_lng, max_lng = bounding_box(center_lat, center_lng, radius_m)
+                if self._has_rtree:
+                    located_sql = (
+                        self._FAVORITES_SELECT
+                        + " JOIN restaurant_geo g ON g.id = r.id"
+                        " WHERE g.max_lat >= ? AND g.min_lat <= ? AND g.max_lng >= ? AND g.min_lng <= ?"
+                    )
+                else:
+                    located_sql = (
+                        self._FAVORITES_SELECT
+                        + " WHERE r.lat BETWEEN ? AND ? AND r.lng BETWEEN ? AND ?"
+                    )
+                cursor.execute(
+                    located_sql + f" AND {text_filter}",
+                    (min_lat, max_lat, min_lng, max_lng, pattern, pattern, pattern),
+                )
+            else:
+                cursor.execute(
+                    self._FAVORITES_SELECT + f" WHERE r.lat IS NOT NULL AND {text_filter}",
+                    (pattern, pattern, pattern),
+                )
+            located = [dict(row) for row in cursor.fetchall()]
+
+            # 2. 좌표가 없는 식당
+            cursor.execute(
+                self._FAVORITES_SELECT + f" WHERE r.lat IS NULL AND {text_filter}" + order,
+                (pattern, pattern, pattern),
+            )
+            unlocated = [dict(row) for row in cursor.fetchall()]
+
+        if located:
+            distances = haversine_distances(
+                center_lat,
+                center_lng,
+                [row["lat"] for row in located],
+                [row["lng"] for row in located],
+            )
+            for row, distance in zip(located, distances):
+                row["distance_m"] = float(distance)
+            if radius_m:
+                located = [row for row in located if row["distance_m"] <= radius_m]
+            located.sort(key=lambda row: row["distance_m"])
+
+        for row in unlocated:
+            row["distance_m"] = None
+
+        return located + unlocated
             
     def import_favorites(self, data: list[dict]) -> int:
         """
@@ -248,9 +672,12 @@ class DatabaseManager:
             cursor = conn.cursor()
             for item in data:
                 try:
+                    restaurant_id = self._get_or_create_restaurant(
+                        cursor, item.get("name"), item.get("address", "")
+                    )
                     cursor.execute(
-                        "INSERT INTO favorites (restaurant_name, address, memo, category) VALUES (?, ?, ?, ?)",
-                        (item.get("name"), item.get("address", ""), item.get("memo", ""), item.get("category", "")),
+                        "INSERT INTO favorites (restaurant_id, memo, category) VALUES (?, ?, ?)",
+                        (restaurant_id, item.get("memo", ""), item.get("category", "")),
                     )
                     count += 1
                 except sqlite3.IntegrityError:
@@ -259,5 +686,87 @@ class DatabaseManager:
         return count
 
 
+    # ─── 즐겨찾기 정보 보강 ──────────────────────────────────────
+    def get_unenriched_favorites(self, limit: int = 100, after_id: int = 0) -> list[dict]:
+        """
+        아직 보강(주소/카테고리/좌표)을 시도하지 않은 즐겨찾기를 id 순으로 반환합니다.
+        after_id로 이번 실행에서 이미 지나간 행(일시 실패 등)을 건너뜁니다.
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            conn.row_factory = sqlite3.Row
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                SELECT f.id, f.restaurant_id, r.name AS restaurant_name,
+                       r.address, f.category
+                FROM favorites f
+                JOIN restaurants r ON r.id = f.restaurant_id
+                WHERE r.enriched_at IS NULL AND f.id > ?
+                ORDER BY f.id
+                LIMIT ?
+                """,
+                (after_id, limit),
+            )
+            return [dict(row) for row in cursor.fetchall()]
+
+    def count_unenriched_favorites(self) -> int:
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT COUNT(*) FROM favorites f JOIN restaurants r ON r.id = f.restaurant_id "
+                "WHERE r.enriched_at IS NULL"
+            )
+            return cursor.fetchone()[0]
+
+    def save_enrichment(
+        self,
+        favorite_id: int,
+        restaurant_id: int,
+        status: str,
+        address: str = "",
+        category: str = "",
+        lat: float | None = None,
+        lng: float | None = None,
+    ):
+        """
+        보강 결과를 저장합니다. 비어 있던 값만 채우며, 주소가 새로 채워지면
+        식별 키도 다시 계산합니다 (같은 키의 식당이 이미 있으면 주소는 그대로 둠).
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                UPDATE restaurants
+                SET enriched_at = CURRENT_TIMESTAMP, enrich_status = ?
+                WHERE id = ?
+                """,
+                (status, restaurant_id),
+            )
+            if lat is not None and lng is not None:
+                self._set_coordinates(cursor, restaurant_id, lat, lng)
+
+            if address:
+                cursor.execute("SELECT name, address FROM restaurants WHERE id = ?", (restaurant_id,))
+                name, current_address = cursor.fetchone()
+                if not current_address:
+                    new_key = restaurant_key(name, address)
+                    cursor.execute(
+                        """
+                        UPDATE restaurants SET address = ?, identity_key = ?
+                        WHERE id = ? AND NOT EXISTS (
+                            SELECT 1 FROM restaurants WHERE identity_key = ?
+                        )
+                        """,
+                        (address, new_key, restaurant_id, new_key),
+                    )
+
+            if category:
+                cursor.execute(
+                    "UPDATE favorites SET category = ? WHERE id = ? AND COALESCE(category, '') = ''",
+                    (category, favorite_id),
+                )
+            conn.commit()
+
+
 # 전역 인스턴스
 db = DatabaseManager()
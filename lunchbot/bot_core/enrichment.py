@@ -0,0 +1,263 @@
+"""즐겨찾기 정보 보강 작업
+
+파일로 가져온 즐겨찾기는 카테고리/주소가 비어 있고 좌표가 없습니다.
+네이버 지역 검색 API로 식당을 찾아 카테고리, 주소(도로명 우선), WGS84 좌표를 채웁니다.
+
+- 아직 시도하지 않은 행(restaurants.enriched_at IS NULL)만 처리하므로 중단 후 재실행하면 이어서 진행
+- 네트워크 오류로 실패한 행은 표시하지 않고 남겨 두어 다음 실행에서 재시도
+- 같은 이름은 한 번만 조회 (실행 단위 캐시), 전체 호출은 RateLimiter로 제한
+- 주소를 이미 아는 행은 주소가 맞는 검색 결과만 사용 (같은 이름의 다른 지점이면 not_found)
+
+실행 (lunchbot 디렉터리에서):
+    NAVER_CLIENT_ID=... NAVER_CLIENT_SECRET=... python -m bot_core.enrichment
+"""
+
+import os
+import re
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+import httpx
+
+from bot_config.settings import NAVER_SEARCH_API_URL
+from bot_core.db import DatabaseManager, db as default_db
+from bot_core.search import _clean_html, item_coordinates
+from bot_utils.rate_limit import RateLimiter
+
+# 보강 결과 상태
+STATUS_OK = "ok"
+STATUS_NOT_FOUND = "not_found"
+
+
+@dataclass
+class EnrichmentStats:
+    """보강 작업 진행 현황."""
+
+    total: int = 0
+    processed: int = 0
+    enriched: int = 0
+    not_found: int = 0
+    failed: int = 0
+
+
+def _normalize(text: str) -> str:
+    return re.sub(r"\s+", "", text or "").lower()
+
+
+# 시/도 정식 명칭 → 약칭 (API는 "서울특별시", 가져온 파일은 "서울"처럼 섞여 있음)
+_REGION_ALIASES = {
+    "서울특별시": "서울",
+    "부산광역시": "부산",
+    "대구광역시": "대구",
+    "인천광역시": "인천",
+    "광주광역시": "광주",
+    "대전광역시": "대전",
+    "울산광역시": "울산",
+    "세종특별자치시": "세종",
+    "경기도": "경기",
+    "강원도": "강원",
+    "강원특별자치도": "강원",
+    "충청북도": "충북",
+    "충청남도": "충남",
+    "전라북도": "전북",
+    "전북특별자치도": "전북",
+    "전라남도": "전남",
+    "경상북도": "경북",
+    "경상남도": "경남",
+    "제주특별자치도": "제주",
+}
+
+
+def _normalize_address(address: str) -> str:
+    """시/도 명칭을 약칭으로 맞춘 뒤 공백/대소문자를 무시한 주소."""
+    parts = (address or "").split()
+    if parts:
+        parts[0] = _REGION_ALIASES.get(parts[0], parts[0])
+    return _normalize("".join(parts))
+
+
+def _match_item(items: list[dict], name: str, address: str = "") -> dict | None:
+    """
+    이름이 일치하는 검색 결과를 고릅니다.
+
+    주소를 알고 있으면 주소도 맞는 항목만 받습니다 (정확히 같으면 우선, 아니면 한쪽이 다른 쪽을 포함).
+    맞는 항목이 없으면 같은 이름의 다른 지점일 수 있으므로 None.
+    """
+    target = _normalize(name)
+    candidates = [
+        item for item in items
+        if target and target in _normalize(_clean_html(item.get("title", "")))
+    ]
+    if not candidates:
+        return None
+    if not address:
+        return candidates[0]
+
+    norm_addr = _normalize_address(address)
+    addresses = [
+        (item, [_normalize_address(item.get(k, "")) for k in ("roadAddress", "address")])
+        for item in candidates
+    ]
+    for item, item_addrs in addresses:
+        if norm_addr in item_addrs:
+            return item
+    for item, item_addrs in addresses:
+        if any(a and (norm_addr in a or a in norm_addr) for a in item_addrs):
+            return item
+    return None
+
+
+class FavoriteEnricher:
+    """즐겨찾기 테이블을 배치 단위로 보강합니다."""
+
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        database: DatabaseManager | None = None,
+        max_concurrency: int = 4,
+        requests_per_second: float = 8.0,
+        batch_size: int = 50,
+    ):
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.db = database or default_db
+        self.max_concurrency = max_concurrency
+        self.batch_size = batch_size
+        self.rate_limiter = RateLimiter(requests_per_second, burst=max_concurrency)
+        self.stats = EnrichmentStats()
+        self._cache: dict[str, list[dict]] = {}
+        self._cache_lock = threading.Lock()
+        self._stop = threading.Event()
+
+    def stop(self):
+        """진행 중인 배치를 마치고 멈추도록 요청합니다."""
+        self._stop.set()
+
+    def _lookup(self, client: httpx.Client, name: str) -> list[dict]:
+        """이름으로 지역 검색 API를 조회합니다 (실행 단위 캐시)."""
+        key = _normalize(name)
+        with self._cache_lock:
+            if key in self._cache:
+                return self._cache[key]
+
+        self.rate_limiter.acquire()
+        response = client.get(
+            NAVER_SEARCH_API_URL,
+            params={"query": name, "display": 5, "start": 1, "sort": "random"},
+        )
+        response.raise_for_status()
+        items = response.json().get("items", [])
+
+        with self._cache_lock:
+            self._cache[key] = items
+        return items
+
+    def _enrich_row(self, client: httpx.Client, row: dict) -> str | None:
+        """한 행을 보강하고 상태를 반환합니다. 일시적 오류면 None."""
+        try:
+            items = self._lookup(client, row["restaurant_name"])
+        except (httpx.HTTPError, ValueError) as e:
+            print(f"[Enrichment Error] {row['restaurant_name']}: {e}")
+            return None
+
+        item = _match_item(items, row["restaurant_name"], row["address"] or "")
+        if item is None:
+            self.db.save_enrichment(row["id"], row["restaurant_id"], STATUS_NOT_FOUND)
+            return STATUS_NOT_FOUND
+
+        coords = item_coordinates(item)
+        self.db.save_enrichment(
+            row["id"],
+            row["restaurant_id"],
+            STATUS_OK,
+            address=item.get("roadAddress") or item.get("address", ""),
+            category=_clean_html(item.get("category", "")),
+            lat=coords[0] if coords else None,
+            lng=coords[1] if coords else None,
+        )
+        return STATUS_OK
+
+    def run(self, limit: int | None = None) -> EnrichmentStats:
+        """보강되지 않은 즐겨찾기를 모두(또는 limit개) 처리합니다."""
+        self.stats = EnrichmentStats(total=self.db.count_unenriched_favorites())
+        if limit is not None:
+            self.stats.total = min(self.stats.total, limit)
+
+        headers = {
+            "X-Naver-Client-Id": self.client_id,
+            "X-Naver-Client-Secret": self.client_secret,
+        }
+        limits = httpx.Limits(max_connections=self.max_concurrency)
+        after_id = 0
+
+        with httpx.Client(headers=headers, timeout=10, limits=limits) as client, \
+                ThreadPoolExecutor(max_workers=self.max_concurrency) as pool:
+            while not self._stop.is_set() and self.stats.processed < self.stats.total:
+                size = min(self.batch_size, self.stats.total - self.stats.processed)
+                rows = self.db.get_unenriched_favorites(limit=size, after_id=after_id)
+                if not rows:
+                    break
+                after_id = rows[-1]["id"]
+
+                for status in pool.map(lambda row: self._enrich_row(client, row), rows):
+                    self.stats.processed += 1
+                    if status == STATUS_OK:
+                        self.stats.enriched += 1
+                    elif status == STATUS_NOT_FOUND:
+                        self.stats.not_found += 1
+                    else:
+                        self.stats.failed += 1
+
+        return self.stats
+
+
+# ─── 백그라운드 실행 ─────────────────────────────────────────
+_job_lock = threading.Lock()
+_current_job: tuple[FavoriteEnricher, threading.Thread] | None = None
+
+
+def start_background_enrichment(client_id: str, client_secret: str) -> FavoriteEnricher:
+    """
+    보강 작업을 데몬 스레드로 시작합니다. 이미 실행 중이면 기존 작업을 반환합니다.
+    Streamlit 세션이 바뀌어도 프로세스 안에서는 하나의 작업만 돕니다.
+    """
+    global _current_job
+    with _job_lock:
+        if _current_job and _current_job[1].is_alive():
+            return _current_job[0]
+
+        enricher = FavoriteEnricher(client_id, client_secret)
+        thread = threading.Thread(target=enricher.run, name="favorite-enrichment", daemon=True)
+        thread.start()
+        _current_job = (enricher, thread)
+        return enricher
+
+
+def get_background_enrichment() -> tuple[FavoriteEnricher, bool] | None:
+    """최근 백그라운드 작업과 실행 중 여부를 반환합니다."""
+    with _job_lock:
+        if _current_job is None:
+            return None
+        return _current_job[0], _current_job[1].is_alive()
+
+
+def main() -> int:
+    client_id = os.environ.get("NAVER_CLIENT_ID", "")
+    client_secret = os.environ.get("NAVER_CLIENT_SECRET", "")
+    if not client_id or not client_secret:
+        print("NAVER_CLIENT_ID / NAVER_CLIENT_SECRET 환경 변수가 필요합니다.")
+        return 1
+
+    stats = FavoriteEnricher(client_id, client_secret).run()
+    print(
+        f"처리 {stats.processed}/{stats.total} · 보강 {stats.enriched} · "
+        f"검색 실패 {stats.not_found} · 오류 {stats.failed}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
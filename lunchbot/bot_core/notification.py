@@ -1,17 +1,149 @@
-"""알림 발송 모듈 (Slack Webhook)"""
+"""알림 발송 모듈 (Slack Webhook)
 
-import json
+알림은 아웃박스 테이블에 기록만 하고, 실제 전송은 백그라운드 전송기(bot_core.outbox)가 맡습니다.
+여러 채널(부서 채널, 주최자 DM, 시설 채널 등)로 보낼 때는 대상마다 템플릿과 타임아웃을 지정할 수 있고,
+전송기는 서로 다른 Webhook을 동시에 보내므로 전체 지연은 가장 느린 대상 하나와 같습니다.
+"""
 
-import httpx
+from collections import Counter
+from dataclasses import dataclass
+
+from bot_core.outbox import NotificationOutbox, outbox as default_outbox, wake_outbox_sender
+
+
+# ─── 템플릿 ──────────────────────────────────────────────────
+def _default_template(ctx: dict) -> dict:
+    """헤더 + 항목별 필드로 된 기본 메시지."""
+    fields = [
+        {"type": "mrkdwn", "text": f"*식당:*\n{ctx['restaurant_name']}"},
+        {"type": "mrkdwn", "text": f"*주소:*\n{ctx['address']}"},
+        {"type": "mrkdwn", "text": f"*날짜:*\n{ctx['date_str']}"},
+        {"type": "mrkdwn", "text": f"*시간:*\n{ctx['time_str']}"},
+        {"type": "mrkdwn", "text": f"*인원:*\n{ctx['party_size']}명"},
+    ]
+
+    if ctx["phone"]:
+        fields.append({"type": "mrkdwn", "text": f"*전화:*\n{ctx['phone']}"})
+
+    return {
+        "text": f"부서점심 식당 선택 완료: {ctx['restaurant_name']}",
+        "blocks": [
+            {
+                "type": "header",
+                "text": {
+                    "type": "plain_text",
+                    "text": "\U0001f37d\ufe0f 부서점심 식당 선택 완료",
+                },
+            },
+            {"type": "section", "fields": fields},
+        ],
+    }
+
+
+def _compact_template(ctx: dict) -> dict:
+    """한 줄 요약 (개인 DM용)."""
+    text = (
+        f"\U0001f37d\ufe0f *{ctx['restaurant_name']}* · {ctx['date_str']} {ctx['time_str']} · "
+        f"{ctx['party_size']}명\n{ctx['address']}"
+    )
+    return {
+        "text": f"부서점심: {ctx['restaurant_name']}",
+        "blocks": [{"type": "section", "text": {"type": "mrkdwn", "text": text}}],
+    }
+
+
+def _facilities_template(ctx: dict) -> dict:
+    """시설/총무 채널용: 일정과 인원 위주."""
+    fields = [
+        {"type": "mrkdwn", "text": f"*일시:*\n{ctx['date_str']} {ctx['time_str']}"},
+        {"type": "mrkdwn", "text": f"*인원:*\n{ctx['party_size']}명"},
+        {"type": "mrkdwn", "text": f"*장소:*\n{ctx['restaurant_name']}"},
+    ]
+    return {
+        "text": f"부서점심 외부 식사 일정: {ctx['date_str']} {ctx['time_str']}",
+        "blocks": [
+            {"type": "section", "text": {"type": "mrkdwn", "text": "*부서점심 외부 식사 일정*"}},
+            {"type": "section", "fields": fields},
+        ],
+    }
+
+
+SLACK_TEMPLATES = {
+    "default": _default_template,
+    "compact": _compact_template,
+    "facilities": _facilities_template,
+}
+
+
+def build_search_result_payload(
+    restaurant_name: str,
+    address: str,
+    date_str: str,
+    time_str: str,
+    party_size: int,
+    phone: str = "",
+    template: str = "default",
+) -> dict:
+    """선택한 식당 정보를 Slack Block Kit 메시지로 만듭니다."""
+    ctx = {
+        "restaurant_name": restaurant_name,
+        "address": address,
+        "date_str": date_str,
+        "time_str": time_str,
+        "party_size": party_size,
+        "phone": phone,
+    }
+    return SLACK_TEMPLATES.get(template, _default_template)(ctx)
+
+
+# ─── 전송 대상 ───────────────────────────────────────────────
+@dataclass
+class SlackTarget:
+    """알림을 받을 Webhook 하나."""
+
+    webhook_url: str
+    name: str = ""
+    template: str = "default"
+    timeout: float = 10.0
+
+    @classmethod
+    def from_config(cls, config: dict) -> "SlackTarget":
+        """secrets.toml의 [[SLACK_TARGETS]] 항목에서 만듭니다."""
+        return cls(
+            webhook_url=config.get("webhook_url", ""),
+            name=config.get("name", ""),
+            template=config.get("template", "default"),
+            timeout=float(config.get("timeout", 10.0)),
+        )
+
+    @property
+    def key(self) -> str:
+        """dispatch_search_result 결과에서 쓰는 대상 식별자 (이름이 없으면 Webhook URL)."""
+        return self.name or self.webhook_url
 
 
 class SlackNotifier:
     """Slack Webhook을 통한 검색 결과 알림."""
 
-    def __init__(self, webhook_url: str):
+    def __init__(
+        self,
+        webhook_url: str = "",
+        outbox: NotificationOutbox | None = None,
+        targets: list[SlackTarget] | None = None,
+    ):
         self.webhook_url = webhook_url
+        self.outbox = outbox or default_outbox
+        self.targets = [t for t in (targets or []) if t.webhook_url]
+        if webhook_url:
+            self.targets.insert(0, SlackTarget(webhook_url, name="default"))
 
-    def send_search_result(
+        # 이름이 겹치면 대상별 결과({이름: 아웃박스 ID})에서 한쪽이 사라지므로 설정 오류로 처리
+        counts = Counter(t.key for t in self.targets)
+        duplicates = sorted(key for key, count in counts.items() if count > 1)
+        if duplicates:
+            raise ValueError(f"Slack 알림 대상 이름이 중복되었습니다: {', '.join(duplicates)}")
+
+    def dispatch_search_result(
         self,
         restaurant_name: str,
         address: str,
@@ -19,42 +151,44 @@ class SlackNotifier:
         time_str: str,
         party_size: int,
         phone: str = "",
-    ) -> bool:
-        """선택한 식당 정보를 Slack으로 전송합니다."""
-        if not self.webhook_url:
-            return False
+    ) -> dict[str, int]:
+        """모든 대상에 대한 알림을 대기열에 넣고 {대상 이름: 아웃박스 ID}를 반환합니다.
 
-        fields = [
-            {"type": "mrkdwn", "text": f"*식당:*\n{restaurant_name}"},
-            {"type": "mrkdwn", "text": f"*주소:*\n{address}"},
-            {"type": "mrkdwn", "text": f"*날짜:*\n{date_str}"},
-            {"type": "mrkdwn", "text": f"*시간:*\n{time_str}"},
-            {"type": "mrkdwn", "text": f"*인원:*\n{party_size}명"},
-        ]
-
-        if phone:
-            fields.append({"type": "mrkdwn", "text": f"*전화:*\n{phone}"})
-
-        payload = {
-            "blocks": [
-                {
-                    "type": "header",
-                    "text": {
-                        "type": "plain_text",
-                        "text": "\U0001f37d\ufe0f 부서점심 식당 선택 완료",
-                    },
-                },
-                {"type": "section", "fields": fields},
-            ]
-        }
+        전송 상태는 outbox.get_statuses(ids)로 대상별로 확인할 수 있습니다.
+        """
+        if not self.targets:
+            return {}
+
+        # 템플릿별 페이로드는 한 번만 만들어 같은 템플릿의 대상끼리 공유
+        payloads: dict[str, dict] = {}
+        for target in self.targets:
+            if target.template not in payloads:
+                payloads[target.template] = build_search_result_payload(
+                    restaurant_name, address, date_str, time_str, party_size, phone,
+                    template=target.template,
+                )
+
+        ids = self.outbox.enqueue_many([
+            (target.webhook_url, payloads[target.template], target.timeout)
+            for target in self.targets
+        ])
+        wake_outbox_sender()
+        return {target.key: notification_id for target, notification_id in zip(self.targets, ids)}
 
+    def send_search_result(
+        self,
+        restaurant_name: str,
+        address: str,
+        date_str: str,
+        time_str: str,
+        party_size: int,
+        phone: str = "",
+    ) -> bool:
+        """선택한 식당 정보를 전송 대기열에 넣습니다. 대기열에 들어가면 True."""
         try:
-            response = httpx.post(
-                self.webhook_url,
-                content=json.dumps(payload),
-                headers={"Content-Type": "application/json"},
-                timeout=10,
-            )
-            return response.status_code == 200
-        except Exception:
+            return bool(self.dispatch_search_result(
+                restaurant_name, address, date_str, time_str, party_size, phone
+            ))
+        except Exception as e:
+            print(f"[Slack Outbox Error] {e}")
             return False
@@ -0,0 +1,372 @@
+"""Slack 알림 아웃박스
+
+알림을 바로 보내지 않고 SQLite 테이블에 먼저 기록한 뒤, 백그라운드 스레드가 전송합니다.
+UI는 INSERT 한 번으로 끝나고, 네트워크 오류나 앱 재시작에도 알림이 사라지지 않습니다.
+
+- 전송: 하나의 httpx.AsyncClient(연결 풀)로 Webhook별 요청을 동시에 보냄
+- 재시도: 실패 시 지수 백오프, Slack 429 응답은 Retry-After 만큼 대기 (429도 최대 시도 횟수에 포함)
+- 묶음 전송: 짧은 시간 안에 같은 Webhook으로 쌓인 알림은 하나의 메시지(여러 섹션)로 합침
+- 영구 오류(잘못된 Webhook 등 4xx)는 재시도하지 않고 failed로 표시
+"""
+
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+import httpx
+
+from bot_config.settings import (
+    HISTORY_DB_PATH,
+    SLACK_COALESCE_WINDOW,
+    SLACK_MAX_ATTEMPTS,
+)
+
+# 전송 상태
+STATUS_PENDING = "pending"
+STATUS_SENT = "sent"
+STATUS_FAILED = "failed"
+
+# Slack 메시지 하나에 넣을 수 있는 블록 수 상한
+_MAX_BLOCKS_PER_MESSAGE = 50
+
+
+class NotificationOutbox:
+    """전송 대기 중인 알림을 보관하는 SQLite 테이블."""
+
+    def __init__(self, db_path: str = HISTORY_DB_PATH):
+        self.db_path = db_path
+        self._init_db()
+
+    def _init_db(self):
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS notification_outbox (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    webhook_url TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    status TEXT NOT NULL DEFAULT 'pending',
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    next_attempt_at REAL NOT NULL,
+                    sent_at REAL,
+                    last_error TEXT,
+                    timeout REAL
+                )
+            """)
+            cursor.execute("PRAGMA table_info(notification_outbox)")
+            if "timeout" not in {row[1] for row in cursor.fetchall()}:
+                cursor.execute("ALTER TABLE notification_outbox ADD COLUMN timeout REAL")
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_outbox_due "
+                "ON notification_outbox(status, next_attempt_at)"
+            )
+            conn.commit()
+
+    def enqueue(self, webhook_url: str, payload: dict, timeout: float | None = None) -> int:
+        """알림을 전송 대기열에 넣고 ID를 반환합니다."""
+        return self.enqueue_many([(webhook_url, payload, timeout)])[0]
+
+    def enqueue_many(self, messages: list[tuple[str, dict, float | None]]) -> list[int]:
+        """(Webhook, 페이로드, 타임아웃) 여러 건을 한 트랜잭션으로 넣고 ID 목록을 반환합니다.
+
+        같은 페이로드 객체는 한 번만 직렬화합니다.
+        """
+        now = time.time()
+        encoded: dict[int, str] = {}
+        ids = []
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            for webhook_url, payload, timeout in messages:
+                if id(payload) not in encoded:
+                    encoded[id(payload)] = json.dumps(payload, ensure_ascii=False)
+                cursor.execute(
+                    "INSERT INTO notification_outbox (webhook_url, payload, next_attempt_at, timeout) "
+                    "VALUES (?, ?, ?, ?)",
+                    (webhook_url, encoded[id(payload)], now, timeout),
+                )
+                ids.append(cursor.lastrowid)
+            conn.commit()
+        return ids
+
+    def get_due(self, now: float | None = None, limit: int = 500) -> list[dict]:
+        """지금 보낼 차례인 알림을 오래된 순서로 반환합니다."""
+        now = time.time() if now is None else now
+        with sqlite3.connect(self.db_path) as conn:
+            conn.row_factory = sqlite3.Row
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT id, webhook_url, payload, attempts, timeout FROM notification_outbox "
+                "WHERE status = ? AND next_attempt_at <= ? ORDER BY id LIMIT ?",
+                (STATUS_PENDING, now, limit),
+            )
+            rows = [dict(row) for row in cursor.fetchall()]
+        for row in rows:
+            row["payload"] = json.loads(row["payload"])
+        return rows
+
+    def next_due_at(self) -> float | None:
+        """대기 중인 알림 중 가장 이른 재시도 시각."""
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT MIN(next_attempt_at) FROM notification_outbox WHERE status = ?",
+                (STATUS_PENDING,),
+            )
+            return cursor.fetchone()[0]
+
+    def count_pending(self) -> int:
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT COUNT(*) FROM notification_outbox WHERE status = ?", (STATUS_PENDING,)
+            )
+            return cursor.fetchone()[0]
+
+    def mark_sent(self, ids: list[int]):
+        with sqlite3.connect(self.db_path) as conn:
+            conn.executemany(
+                "UPDATE notification_outbox SET status = ?, sent_at = ?, attempts = attempts + 1, "
+                "last_error = NULL WHERE id = ?",
+                [(STATUS_SENT, time.time(), i) for i in ids],
+            )
+            conn.commit()
+
+    def mark_retry(self, ids: list[int], next_attempt_at: float, error: str):
+        with sqlite3.connect(self.db_path) as conn:
+            conn.executemany(
+                "UPDATE notification_outbox SET attempts = attempts + 1, next_attempt_at = ?, "
+                "last_error = ? WHERE id = ?",
+                [(next_attempt_at, error, i) for i in ids],
+            )
+            conn.commit()
+
+    def mark_failed(self, ids: list[int], error: str):
+        with sqlite3.connect(self.db_path) as conn:
+            conn.executemany(
+                "UPDATE notification_outbox SET status = ?, attempts = attempts + 1, "
+                "last_error = ? WHERE id = ?",
+                [(STATUS_FAILED, error, i) for i in ids],
+            )
+            conn.commit()
+
+    def get_statuses(self, ids: list[int]) -> dict[int, str]:
+        """알림별 전송 상태(pending/sent/failed)를 반환합니다."""
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                f"SELECT id, status FROM notification_outbox WHERE id IN ({','.join('?' * len(ids))})",
+                list(ids),
+            )
+            return dict(cursor.fetchall())
+
+    def get(self, notification_id: int) -> dict | None:
+        with sqlite3.connect(self.db_path) as conn:
+            conn.row_factory = sqlite3.Row
+            cursor = conn.cursor()
+            cursor.execute("SELECT * FROM notification_outbox WHERE id = ?", (notification_id,))
+            row = cursor.fetchone()
+            return dict(row) if row else None
+
+
+def _merge_payloads(payloads: list[dict]) -> dict:
+    """여러 알림의 블록을 구분선으로 이어 하나의 메시지로 만듭니다."""
+    if len(payloads) == 1:
+        return payloads[0]
+    blocks: list[dict] = []
+    texts: list[str] = []
+    for payload in payloads:
+        if blocks:
+            blocks.append({"type": "divider"})
+        blocks.extend(payload.get("blocks", []))
+        if payload.get("text"):
+            texts.append(payload["text"])
+    merged = {"blocks": blocks}
+    if texts:
+        merged["text"] = "\n".join(texts)
+    return merged
+
+
+def _batches(rows: list[dict]) -> list[list[dict]]:
+    """같은 Webhook의 알림을 Slack 블록 수 상한 안에서 묶습니다."""
+    batches: list[list[dict]] = []
+    current: list[dict] = []
+    blocks = 0
+    for row in rows:
+        size = len(row["payload"].get("blocks", [])) + 1  # 구분선 포함
+        if current and blocks + size > _MAX_BLOCKS_PER_MESSAGE:
+            batches.append(current)
+            current, blocks = [], 0
+        current.append(row)
+        blocks += size
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _retry_after(response: httpx.Response) -> float | None:
+    try:
+        return max(0.0, float(response.headers["Retry-After"]))
+    except (KeyError, ValueError):
+        return None
+
+
+class OutboxSender:
+    """아웃박스를 비우는 백그라운드 전송기."""
+
+    def __init__(
+        self,
+        outbox: NotificationOutbox,
+        coalesce_window: float = SLACK_COALESCE_WINDOW,
+        max_attempts: int = SLACK_MAX_ATTEMPTS,
+        base_delay: float = 2.0,
+        max_delay: float = 600.0,
+        poll_interval: float = 30.0,
+        timeout: float = 10.0,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        self.outbox = outbox
+        self.coalesce_window = coalesce_window
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+        self.transport = transport
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+
+    def wake(self):
+        """새 알림이 들어왔음을 알립니다."""
+        self._wake.set()
+
+    def stop(self):
+        self._stop.set()
+        self._wake.set()
+
+    def _backoff(self, attempts: int) -> float:
+        return min(self.max_delay, self.base_delay * (2 ** attempts))
+
+    async def _deliver(self, client: httpx.AsyncClient, webhook_url: str, rows: list[dict]) -> int:
+        """한 Webhook으로 묶음 하나를 보내고 결과를 기록합니다. 전송한 알림 수를 반환."""
+        ids = [row["id"] for row in rows]
+        payload = _merge_payloads([row["payload"] for row in rows])
+        attempts = max(row["attempts"] for row in rows) + 1
+        # 대상별 타임아웃이 있으면 묶음 안에서 가장 긴 값을 사용
+        timeouts = [row["timeout"] for row in rows if row.get("timeout")]
+        timeout = max(timeouts) if timeouts else self.timeout
+
+        try:
+            response = await client.post(webhook_url, json=payload, timeout=timeout)
+        except httpx.HTTPError as e:
+            error = f"{type(e).__name__}: {e}"
+            response = None
+        else:
+            if response.status_code == 200:
+                self.outbox.mark_sent(ids)
+                return len(ids)
+            error = f"HTTP {response.status_code}: {response.text[:200]}"
+
+        rate_limited = response is not None and response.status_code == 429
+        if response is not None and 400 <= response.status_code < 500 and not rate_limited:
+            # 잘못된 Webhook/페이로드는 다시 보내도 실패
+            self.outbox.mark_failed(ids, error)
+        elif attempts >= self.max_attempts:
+            # 429도 시도로 셈: 계속 제한하는 Webhook의 알림이 대기열에 영원히 남지 않도록
+            self.outbox.mark_failed(ids, error)
+        elif rate_limited:
+            delay = _retry_after(response)
+            if delay is None:
+                delay = self._backoff(attempts)
+            self.outbox.mark_retry(ids, time.time() + delay, error)
+        else:
+            self.outbox.mark_retry(ids, time.time() + self._backoff(attempts), error)
+        print(f"[Slack Outbox] {len(ids)}건 전송 실패: {error}")
+        return 0
+
+    async def flush(self, client: httpx.AsyncClient) -> int:
+        """보낼 차례인 알림을 Webhook별로 묶어 동시에 전송합니다.
+
+        대상 Webhook이 여러 개여도 전체 소요 시간은 가장 느린 Webhook 하나의 시간과 같습니다.
+        """
+        by_webhook: dict[str, list[dict]] = {}
+        for row in self.outbox.get_due():
+            by_webhook.setdefault(row["webhook_url"], []).append(row)
+
+        tasks = [
+            self._deliver(client, webhook_url, batch)
+            for webhook_url, rows in by_webhook.items()
+            for batch in _batches(rows)
+        ]
+        return sum(await asyncio.gather(*tasks)) if tasks else 0
+
+    def new_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            timeout=self.timeout,
+            limits=httpx.Limits(max_connections=10, max_keepalive_connections=5),
+            transport=self.transport,
+        )
+
+    def _wait_seconds(self) -> float:
+        next_due = self.outbox.next_due_at()
+        if next_due is None:
+            return self.poll_interval
+        return min(self.poll_interval, max(0.0, next_due - time.time()))
+
+    def run(self):
+        """스레드 본체. 멈출 때까지 대기열을 비웁니다."""
+        loop = asyncio.new_event_loop()
+        client = self.new_client()
+        try:
+            while not self._stop.is_set():
+                woke = self._wake.wait(timeout=self._wait_seconds())
+                self._wake.clear()
+                if self._stop.is_set():
+                    break
+                if woke:
+                    # 짧은 시간에 몰려 들어오는 알림을 한 번에 묶어 보냄
+                    time.sleep(self.coalesce_window)
+                try:
+                    loop.run_until_complete(self.flush(client))
+                except Exception as e:
+                    print(f"[Slack Outbox Error] {e}")
+                    time.sleep(self.poll_interval)
+        finally:
+            loop.run_until_complete(client.aclose())
+            loop.close()
+
+
+# ─── 백그라운드 실행 ─────────────────────────────────────────
+outbox = NotificationOutbox()
+
+_sender_lock = threading.Lock()
+_sender: tuple[OutboxSender, threading.Thread] | None = None
+
+
+def start_outbox_sender() -> OutboxSender:
+    """전송 스레드를 시작합니다. 이미 실행 중이면 기존 전송기를 반환합니다.
+
+    시작하자마자 한 번 대기열을 확인하므로 이전 실행에서 남은 알림도 보냅니다.
+    """
+    global _sender
+    with _sender_lock:
+        if _sender and _sender[1].is_alive():
+            return _sender[0]
+
+        sender = OutboxSender(outbox)
+        thread = threading.Thread(target=sender.run, name="slack-outbox", daemon=True)
+        thread.start()
+        sender.wake()
+        _sender = (sender, thread)
+        return sender
+
+
+def wake_outbox_sender():
+    """실행 중인 전송 스레드가 있으면 깨웁니다."""
+    with _sender_lock:
+        if _sender and _sender[1].is_alive():
+            _sender[0].wake()
@@ -0,0 +1,200 @@
+"""점심시간 전 검색 캐시 미리 채우기
+
+점심 검색은 11:30~12:10에 몰리고, 거의 모두 고정된 조합
+(CUISINE_TYPES × BUDGET_KEYWORDS × RADIUS_OPTIONS + 자동 추천)입니다.
+정해진 시각(기본: 평일 11:00)에 이 조합을 미리 검색해 공용 캐시(search_cache / api_cache)를 채워 두면
+그날 첫 검색도 캐시에서 바로 응답합니다.
+
+- 반경만 다른 검색은 API 응답 캐시를 공유하므로 실제 API 호출은 (음식 × 예산) 조합 수에 비례
+- 초당 호출 수와 1회 실행의 총 API 호출 한도(RateLimiter quota)를 지킴. 한도에 닿으면 남은 조합은 건너뜀
+- 캐시는 사용자 검색과 공유하지만 동시 호출 합치기(SingleFlight)는 따로 써서 제한이 사용자에게 번지지 않음
+- 자동 추천 조합을 가장 먼저 채움
+- 캐시에 값이 있어도 동기로 다시 검색해 저장 (API 응답도 검색 캐시 TTL보다 오래됐으면 다시 받음)
+
+캐시는 프로세스 메모리에 있으므로 앱 캐시를 채우려면 앱 안에서 스케줄러를 실행해야 합니다.
+CLI는 한 번 실행해 호출 수/소요 시간을 확인하는 용도입니다 (lunchbot 디렉터리에서):
+    NAVER_CLIENT_ID=... NAVER_CLIENT_SECRET=... python -m bot_core.prewarm
+"""
+
+import os
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from itertools import product
+
+from bot_config.settings import (
+    AREA_CENTER,
+    BUDGET_KEYWORDS,
+    CUISINE_TYPES,
+    DEFAULT_RADIUS,
+    PREWARM_MAX_API_CALLS,
+    PREWARM_REQUESTS_PER_SECOND,
+    PREWARM_TIME,
+    PREWARM_WEEKDAYS,
+    RADIUS_OPTIONS,
+    SEARCH_MAX_PAGES,
+    SEARCH_PAGE_CONCURRENCY,
+)
+from bot_core.search import (
+    RestaurantSearcher,
+    api_cache as default_api_cache,
+    naver_api,
+    search_cache as default_search_cache,
+)
+from bot_utils.rate_limit import QuotaExceeded, RateLimiter
+from bot_utils.single_flight import SingleFlight
+from bot_utils.ttl_cache import TTLCache
+
+# 자동 추천 버튼이 보내는 검색 조건 (ui/pages/home.py의 render_auto_select_button과 동일)
+AUTO_SELECT_QUERY = {"cuisine_keyword": "맛집", "budget_keyword": "", "radius": DEFAULT_RADIUS}
+
+
+@dataclass
+class PrewarmStats:
+    """사전 캐시 작업 결과."""
+
+    total: int = 0
+    warmed: int = 0
+    skipped: int = 0
+    failed: int = 0
+    api_calls: int = 0
+    elapsed: float = 0.0
+
+
+def prewarm_queries() -> list[dict]:
+    """미리 채울 검색 조건 목록. 자동 추천이 먼저, 같은 키워드끼리 붙여서 API 캐시를 잘 재사용하도록."""
+    queries = [AUTO_SELECT_QUERY]
+    for cuisine_keyword, budget_keyword, radius in product(
+        CUISINE_TYPES.values(), BUDGET_KEYWORDS.values(), RADIUS_OPTIONS
+    ):
+        query = {"cuisine_keyword": cuisine_keyword, "budget_keyword": budget_keyword, "radius": radius}
+        if query not in queries:
+            queries.append(query)
+    return queries
+
+
+class Prewarmer:
+    """검색 조건 목록을 차례로 검색해 캐시를 채웁니다."""
+
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        cache: TTLCache | None = None,
+        api_cache: TTLCache | None = None,
+        requests_per_second: float = PREWARM_REQUESTS_PER_SECOND,
+        max_api_calls: int = PREWARM_MAX_API_CALLS,
+    ):
+        self.rate_limiter = RateLimiter(requests_per_second, burst=1, quota=max_api_calls)
+        self.searcher = RestaurantSearcher(
+            client_id,
+            client_secret,
+            center_lat=AREA_CENTER["lat"],
+            center_lng=AREA_CENTER["lng"],
+            cache=default_search_cache if cache is None else cache,
+            api_cache=default_api_cache if api_cache is None else api_cache,
+            rate_limiter=self.rate_limiter,
+            caller=naver_api,
+            max_pages=SEARCH_MAX_PAGES,
+            page_concurrency=SEARCH_PAGE_CONCURRENCY,
+            # 캐시는 공유하되 동시 호출 합치기는 따로: 사용자 검색이 사전 캐시 작업의 요청에 합류하면
+            # 초당 호출 제한으로 느려지고 호출 한도 초과(QuotaExceeded)까지 함께 받게 됨
+            flights=(SingleFlight(), SingleFlight()),
+            # 오래된 캐시를 돌려받고 백그라운드 갱신만 걸면 실제로는 채운 것이 없고, 갱신 스레드의
+            # QuotaExceeded는 삼켜져 한도에서 멈추지도 못함. 반드시 이 스레드에서 다시 불러옴
+            force_refresh=True,
+        )
+        self.stats = PrewarmStats()
+
+    def run(self, queries: list[dict] | None = None) -> PrewarmStats:
+        queries = queries or prewarm_queries()
+        self.stats = PrewarmStats(total=len(queries))
+        started = time.monotonic()
+
+        for i, query in enumerate(queries):
+            try:
+                self.searcher.search(
+                    AREA_CENTER["name"],
+                    query["cuisine_keyword"],
+                    radius=query["radius"],
+                    budget_keyword=query["budget_keyword"],
+                )
+                self.stats.warmed += 1
+            except QuotaExceeded:
+                self.stats.skipped = len(queries) - i
+                print(f"[Prewarm] API 호출 한도 도달, 남은 {self.stats.skipped}개 조합 건너뜀")
+                break
+            except Exception as e:
+                self.stats.failed += 1
+                print(f"[Prewarm Error] {query}: {e}")
+
+        self.stats.api_calls = self.rate_limiter.used
+        self.stats.elapsed = time.monotonic() - started
+        return self.stats
+
+
+def next_run_at(now: datetime, at: str = PREWARM_TIME, weekdays=PREWARM_WEEKDAYS) -> datetime:
+    """now 이후 가장 가까운 실행 시각."""
+    hour, minute = map(int, at.split(":"))
+    candidate = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    if candidate <= now:
+        candidate += timedelta(days=1)
+    while candidate.weekday() not in weekdays:
+        candidate += timedelta(days=1)
+    return candidate
+
+
+# ─── 백그라운드 실행 ─────────────────────────────────────────
+_scheduler_lock = threading.Lock()
+_scheduler: threading.Thread | None = None
+last_stats: PrewarmStats | None = None
+
+
+def _scheduler_loop(client_id: str, client_secret: str):
+    global last_stats
+    while True:
+        wait = (next_run_at(datetime.now()) - datetime.now()).total_seconds()
+        time.sleep(max(0.0, wait))
+        last_stats = Prewarmer(client_id, client_secret).run()
+        print(
+            f"[Prewarm] {last_stats.warmed}/{last_stats.total}개 조합, "
+            f"API {last_stats.api_calls}회, {last_stats.elapsed:.1f}초"
+        )
+
+
+def start_prewarm_scheduler(client_id: str, client_secret: str) -> threading.Thread:
+    """
+    사전 캐시 스케줄러를 데몬 스레드로 시작합니다. 이미 실행 중이면 기존 스레드를 반환합니다.
+    Streamlit 세션이 여러 개여도 프로세스 안에서는 하나만 돕니다.
+    """
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler and _scheduler.is_alive():
+            return _scheduler
+
+        _scheduler = threading.Thread(
+            target=_scheduler_loop, args=(client_id, client_secret), name="prewarm", daemon=True
+        )
+        _scheduler.start()
+        return _scheduler
+
+
+def main() -> int:
+    client_id = os.environ.get("NAVER_CLIENT_ID", "")
+    client_secret = os.environ.get("NAVER_CLIENT_SECRET", "")
+    if not client_id or not client_secret:
+        print("NAVER_CLIENT_ID / NAVER_CLIENT_SECRET 환경 변수가 필요합니다.")
+        return 1
+
+    stats = Prewarmer(client_id, client_secret).run()
+    print(
+        f"조합 {stats.warmed}/{stats.total} · 건너뜀 {stats.skipped} · 오류 {stats.failed} · "
+        f"API {stats.api_calls}회 · {stats.elapsed:.1f}초"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
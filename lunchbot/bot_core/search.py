@@ -5,13 +5,37 @@ https://developers.naver.com/docs/serviceapi/search/local/local.md
 """
 
 import re
-from dataclasses import dataclass, field
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
 from urllib.parse import quote
 
 import httpx
 
-from bot_config.settings import NAVER_SEARCH_API_URL, NAVER_BLOG_SEARCH_API_URL, AREA_CENTER, SEARCH_AREAS
-from bot_utils.geo import haversine_distance, format_distance, estimate_walking_time
+from bot_config.constants import LANDMARKS
+from bot_config.settings import (
+    NAVER_SEARCH_API_URL,
+    NAVER_BLOG_SEARCH_API_URL,
+    AREA_CENTER,
+    SEARCH_AREAS,
+    SEARCH_CACHE_TTL,
+    SEARCH_CACHE_MAX_AGE,
+    SEARCH_CACHE_MAX_BYTES,
+    API_CACHE_TTL,
+    API_CACHE_MAX_AGE,
+    API_CACHE_MAX_BYTES,
+    NAVER_API_MAX_ATTEMPTS,
+    NAVER_API_RETRY_BASE_DELAY,
+    NAVER_API_HEDGE,
+    NAVER_API_BREAKER_THRESHOLD,
+    NAVER_API_BREAKER_RESET,
+)
+from bot_utils.geo import haversine_distance, haversine_matrix, format_distance, estimate_walking_time
+from bot_utils.rate_limit import RateLimiter
+from bot_utils.resilience import CircuitBreaker, CircuitOpenError, ResilientCaller
+from bot_utils.single_flight import SingleFlight
+from bot_utils.ttl_cache import TTLCache
 
 
 @dataclass
@@ -42,6 +66,22 @@ class Restaurant:
     distance_text: str = ""
     walking_time: str = ""
     blog_reviews: list[BlogReview] = field(default_factory=list)
+    landmark_distances: dict[str, float] = field(default_factory=dict)  # 모임 장소별 거리 (미터)
+
+    def at_landmark(self, landmark: str) -> "Restaurant":
+        """
+        거리/도보 시간을 다른 모임 장소 기준으로 바꾼 사본을 반환합니다.
+        해당 장소까지의 거리를 모르면 자기 자신을 그대로 반환합니다.
+        """
+        distance = self.landmark_distances.get(landmark)
+        if distance is None:
+            return self
+        return replace(
+            self,
+            distance_m=distance,
+            distance_text=format_distance(distance),
+            walking_time=estimate_walking_time(distance),
+        )
 
     def to_dict(self) -> dict:
         return {
@@ -57,6 +97,7 @@ class Restaurant:
             "distance_m": self.distance_m,
             "distance_text": self.distance_text,
             "walking_time": self.walking_time,
+            "landmark_distances": dict(self.landmark_distances),
             "blog_reviews": [
                 {"title": r.title, "link": r.link, "snippet": r.snippet}
                 for r in self.blog_reviews
@@ -89,6 +130,158 @@ def _is_reasonable_korea_coordinate(lat: float, lng: float) -> bool:
     return 33.0 <= lat <= 39.5 and 124.0 <= lng <= 132.0
 
 
+def item_coordinates(item: dict) -> tuple[float, float] | None:
+    """
+    검색 API 항목의 mapx/mapy를 WGS84 (위도, 경도)로 변환합니다.
+    좌표가 없거나 대한민국 범위를 벗어나면 None을 반환합니다.
+    """
+    try:
+        raw_x = item.get("mapx", 0)
+        raw_y = item.get("mapy", 0)
+        mapx = int(raw_x) if raw_x else 0
+        mapy = int(raw_y) if raw_y else 0
+    except (TypeError, ValueError):
+        return None
+
+    if mapx <= 0 or mapy <= 0:
+        return None
+
+    # 2023.08 이후: WGS84 좌표 (정수형, 10^7 배율)
+    # 예: mapx=1269873882 → lng=126.9873882
+    if mapx > 1000000:
+        lng = mapx / 1e7
+        lat = mapy / 1e7
+    else:
+        # 혹시 구형 KATEC 좌표가 오면 근사 변환
+        lat, lng = _katec_to_wgs84(mapx, mapy)
+
+    if _is_reasonable_korea_coordinate(lat, lng):
+        return lat, lng
+    return None
+
+
+def attach_landmark_distances(
+    restaurants: list[Restaurant],
+    landmarks: dict[str, dict] = LANDMARKS,
+) -> None:
+    """
+    각 식당에 모든 모임 장소(LANDMARKS)까지의 거리를 한 번의 행렬 연산으로 채웁니다.
+    좌표가 없는 식당(lat/lng가 0)은 건너뜁니다.
+    """
+    located = [r for r in restaurants if r.lat and r.lng]
+    if not located or not landmarks:
+        return
+
+    names = list(landmarks)
+    matrix = haversine_matrix(
+        [r.lat for r in located],
+        [r.lng for r in located],
+        [landmarks[n]["lat"] for n in names],
+        [landmarks[n]["lng"] for n in names],
+    )
+    for restaurant, row in zip(located, matrix):
+        restaurant.landmark_distances = dict(zip(names, row.tolist()))
+
+
+class SearchResults(list):
+    """
+    검색 결과 Restaurant 리스트. 시간 예산을 넘겨 일부를 생략했으면 partial과 생략 지역을 함께 담습니다.
+    지역은 모두 검색했지만 블로그 리뷰/가격 조회를 건너뛴 경우에도 partial=True (skipped_areas는 비어 있음).
+    """
+
+    def __init__(
+        self,
+        restaurants=(),
+        partial: bool = False,
+        skipped_areas=(),
+        elapsed: float = 0.0,
+    ):
+        super().__init__(restaurants)
+        self.partial = partial
+        self.skipped_areas = list(skipped_areas)
+        self.elapsed = elapsed
+
+    def with_items(self, restaurants) -> "SearchResults":
+        """같은 부분 결과 정보로 목록만 바꾼 복사본."""
+        return SearchResults(restaurants, self.partial, self.skipped_areas, self.elapsed)
+
+
+# 지역 검색 한 페이지의 항목 수 (_search_single_area의 display 기본값)
+_AREA_PAGE_SIZE = 5
+
+# 요청 하나의 기본 타임아웃과, 시간 예산이 이보다 적게 남으면 요청을 보내지 않는 하한 (초)
+_REQUEST_TIMEOUT = 10.0
+_MIN_REQUEST_TIMEOUT = 0.2
+
+
+def _request_timeout(deadline: float | None, limit: float = _REQUEST_TIMEOUT) -> float | None:
+    """남은 시간 예산에 맞춘 요청 타임아웃. 예산이 바닥났으면 None."""
+    if deadline is None:
+        return limit
+    remaining = deadline - time.monotonic()
+    if remaining < _MIN_REQUEST_TIMEOUT:
+        return None
+    return min(limit, remaining)
+
+
+# 지역/블로그 검색 실패로 보고 빈 결과로 대신하는 오류
+_API_ERRORS = (httpx.HTTPError, ValueError, TimeoutError, CircuitOpenError)
+
+
+def _is_retryable(error: BaseException) -> bool:
+    """잠시 후 다시 시도하면 성공할 수 있는 오류인지: 연결/타임아웃, 5xx, 429."""
+    if isinstance(error, httpx.TransportError):
+        return True
+    if isinstance(error, httpx.HTTPStatusError):
+        status = error.response.status_code
+        return status >= 500 or status == 429
+    return False
+
+
+def _is_complete(results: SearchResults) -> bool:
+    """캐시할 만한 결과인지: 비어 있지 않고 생략된 부분이 없음."""
+    return bool(results) and not results.partial
+
+
+# 모든 세션이 공유하는 캐시 (같은 조건의 검색/API 요청은 다시 부르지 않음)
+# 만료 후에도 max_age 전까지는 기존 값을 바로 쓰고 백그라운드에서 갱신 (stale-while-revalidate)
+search_cache = TTLCache(
+    ttl=SEARCH_CACHE_TTL, max_age=SEARCH_CACHE_MAX_AGE, max_bytes=SEARCH_CACHE_MAX_BYTES
+)
+api_cache = TTLCache(ttl=API_CACHE_TTL, max_age=API_CACHE_MAX_AGE, max_bytes=API_CACHE_MAX_BYTES)
+
+# 동시에 들어온 같은 검색 / 같은 API 호출은 한 번만 실행하고 결과를 나눠 가짐
+search_flight = SingleFlight()
+api_flight = SingleFlight()
+
+# 네이버 API 재시도/헤지 요청/서킷 브레이커. 지연 통계와 장애 상태를 모든 세션이 공유
+naver_api = ResilientCaller(
+    breaker=CircuitBreaker(NAVER_API_BREAKER_THRESHOLD, NAVER_API_BREAKER_RESET),
+    max_attempts=NAVER_API_MAX_ATTEMPTS,
+    base_delay=NAVER_API_RETRY_BASE_DELAY,
+    hedge=NAVER_API_HEDGE,
+)
+
+
+def search_cache_key(
+    cuisine_keyword: str,
+    budget_keyword: str,
+    center_lat: float,
+    center_lng: float,
+    radius: int,
+    display: int,
+) -> tuple:
+    """검색 조건을 정규화한 캐시 키. 키워드 공백/대소문자, 1m 미만 좌표 차이는 무시합니다."""
+    return (
+        " ".join(cuisine_keyword.split()).lower(),
+        " ".join(budget_keyword.split()).lower(),
+        round(center_lat, 5),
+        round(center_lng, 5),
+        int(radius),
+        int(display),
+    )
+
+
 class RestaurantSearcher:
     """네이버 검색 API로 맛집을 검색하는 클래스."""
 
@@ -98,11 +291,35 @@ class RestaurantSearcher:
         client_secret: str,
         center_lat: float | None = None,
         center_lng: float | None = None,
+        cache: TTLCache | None = None,
+        api_cache: TTLCache | None = None,
+        rate_limiter: RateLimiter | None = None,
+        caller: ResilientCaller | None = None,
+        max_pages: int = 1,
+        page_concurrency: int = 1,
+        flights: tuple[SingleFlight, SingleFlight] | None = None,
+        force_refresh: bool = False,
     ):
         self.client_id = client_id
         self.client_secret = client_secret
         self.center_lat = center_lat or AREA_CENTER["lat"]
         self.center_lng = center_lng or AREA_CENTER["lng"]
+        # None이면 캐시하지 않음. 앱에서는 공용 search_cache / api_cache를 넘김
+        self.cache = cache
+        self.api_cache = api_cache
+        # 실제 API 요청(캐시 미스) 전에 토큰을 얻음. 사전 캐시 작업의 속도/호출 한도 제한용
+        self.rate_limiter = rate_limiter
+        # None이면 요청을 한 번만 보냄. 앱에서는 공용 naver_api를 넘김
+        self.caller = caller
+        # 지역×키워드마다 가져올 최대 페이지 수와 동시에 요청할 페이지 수 (앱은 settings 값 사용)
+        self.max_pages = max(1, max_pages)
+        self.page_concurrency = max(1, page_concurrency)
+        # (검색, API 요청) 단위 동시 호출 합치기. 기본은 모든 세션이 공유하는 search_flight/api_flight.
+        # 속도/호출 한도(rate_limiter)가 걸린 검색기는 별도 그룹을 써야 다른 세션이 그 제한을 물려받지 않음
+        self.search_flight, self.api_flight = flights or (search_flight, api_flight)
+        # True면 검색 캐시를 건너뛰고 동기로 다시 검색해 저장하며, API 캐시도 검색 캐시 TTL보다
+        # 오래된 응답은 다시 받음 (사전 캐시 작업용: 오래된 값을 돌려주고 백그라운드 갱신만 걸지 않도록)
+        self.force_refresh = force_refresh
 
     @property
     def _api_headers(self) -> dict[str, str]:
@@ -111,27 +328,52 @@ class RestaurantSearcher:
             "X-Naver-Client-Secret": self.client_secret,
         }
 
+    def _get_items(self, url: str, params: dict, timeout: float = _REQUEST_TIMEOUT) -> list[dict]:
+        """
+        검색 API를 호출해 items를 반환합니다. 동시에 같은 요청이 있으면 그 응답을 함께 씁니다.
+        다른 호출의 응답을 timeout초 안에 받지 못하면 TimeoutError.
+
+        caller가 있으면 재시도/헤지 요청을 모두 timeout 안에서 하고,
+        API 장애로 차단 중이면 CircuitOpenError (API 캐시에 지난 응답이 있으면 그것을 반환).
+        """
+        def request(attempt_timeout: float) -> list[dict]:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            response = httpx.get(
+                url, params=params, headers=self._api_headers, timeout=attempt_timeout
+            )
+            response.raise_for_status()
+            return response.json().get("items", [])
+
+        def fetch() -> list[dict]:
+            if self.caller is None:
+                return request(timeout)
+            return self.caller.call(request, timeout, _is_retryable)
+
+        key = (url, tuple(sorted(params.items())))
+        if self.api_cache is None:
+            return self.api_flight.do(key, fetch, timeout=timeout)
+        return self.api_cache.get_or_load(
+            key, fetch, flight=self.api_flight, timeout=timeout, stale_if_error=(CircuitOpenError,),
+            refresh_older_than=SEARCH_CACHE_TTL if self.force_refresh else None,
+        )
+
     def _fetch_blog_reviews(
         self,
         restaurant_name: str,
         review_count: int = 3,
+        timeout: float = _REQUEST_TIMEOUT,
     ) -> list[BlogReview]:
         """식당 블로그 리뷰를 가져옵니다."""
+        params = {
+            "query": f"{restaurant_name} 후기",
+            "display": review_count,
+            "start": 1,
+            "sort": "sim",
+        }
         try:
-            response = httpx.get(
-                NAVER_BLOG_SEARCH_API_URL,
-                params={
-                    "query": f"{restaurant_name} 후기",
-                    "display": review_count,
-                    "start": 1,
-                    "sort": "sim",
-                },
-                headers=self._api_headers,
-                timeout=10,
-            )
-            response.raise_for_status()
-            items = response.json().get("items", [])
-        except (httpx.HTTPError, ValueError):
+            items = self._get_items(NAVER_BLOG_SEARCH_API_URL, params, timeout)
+        except _API_ERRORS:
             return []
 
         reviews: list[BlogReview] = []
@@ -146,7 +388,7 @@ class RestaurantSearcher:
 
         return reviews
 
-    def search_blog_for_price(self, restaurant_name: str) -> str:
+    def search_blog_for_price(self, restaurant_name: str, timeout: float = 2.0) -> str:
         """
         블로그 검색 API를 이용하여 식당의 메뉴 가격 정보를 추정합니다.
         
@@ -156,52 +398,36 @@ class RestaurantSearcher:
         Returns:
             str: 추정된 가격 정보 (예: "11,000원") 또는 빈 문자열
         """
-        query = f"{restaurant_name} 메뉴판 가격"
         params = {
-            "query": query,
+            "query": f"{restaurant_name} 메뉴판 가격",
             "display": 5,
-            "sort": "sim"
+            "start": 1,
+            "sort": "sim",
         }
-        
+        # 지역/블로그 리뷰 검색과 같은 경로 (API 캐시, 동시 요청 합치기, 재시도/서킷 브레이커)
         try:
-            res = httpx.get(
-                NAVER_BLOG_SEARCH_API_URL,
-                headers=self.headers,
-                params=params,
-                timeout=2.0 # 빠른 응답 요구
-            )
-            
-            if res.status_code == 200:
-                data = res.json()
-                items = data.get("items", [])
-                
-                prices = []
-                for item in items:
-                    description = item.get("description", "")
-                    # HTML 태그 제거 및 텍스트 정제
-                    text = re.sub(r"<[^>]+>", "", description)
-                    
-                    # 가격 패턴 찾기 (숫자 + 원) - 예: 10,000원, 11000원
-                    # 너무 작은 숫자나 배달비 제외, 4자리 이상 숫자
-                    matches = re.findall(r'([0-9,]{3,})원', text)
-                    for m in matches:
-                        price = int(m.replace(",", ""))
-                        if 3000 <= price <= 300000: # 합리적인 범위
-                            prices.append(price)
-                            
-                if prices:
-                    # 가장 빈번하게 등장한 가격 또는 평균값? 
-                    # 보통 대표 메뉴 가격이 많이 언급됨.
-                    # 최빈값 찾기
-                    from collections import Counter
-                    most_common = Counter(prices).most_common(1)
-                    if most_common:
-                        return f"{most_common[0][0]:,}원"
-            
-        except Exception as e:
-            print(f"[ERROR] Blog search failed: {e}")
-            
-        return ""
+            items = self._get_items(NAVER_BLOG_SEARCH_API_URL, params, timeout)
+        except _API_ERRORS as e:
+            print(f"[ERROR] Blog search failed: {e!r}")
+            return ""
+
+        prices = []
+        for item in items:
+            # HTML 태그 제거 및 텍스트 정제
+            text = _clean_html(item.get("description", ""))
+
+            # 가격 패턴 찾기 (숫자 + 원) - 예: 10,000원, 11000원
+            # 너무 작은 숫자나 배달비 제외, 4자리 이상 숫자
+            for m in re.findall(r"([0-9][0-9,]{2,})원", text):
+                price = int(m.replace(",", ""))
+                if 3000 <= price <= 300000:  # 합리적인 범위
+                    prices.append(price)
+
+        if not prices:
+            return ""
+        # 보통 대표 메뉴 가격이 가장 많이 언급되므로 최빈값 사용
+        most_common = Counter(prices).most_common(1)
+        return f"{most_common[0][0]:,}원"
 
     def _search_single_area(
         self,
@@ -209,30 +435,91 @@ class RestaurantSearcher:
         cuisine_keyword: str,
         budget_keyword: str = "",
         display: int = 5,
+        timeout: float = _REQUEST_TIMEOUT,
+        raise_errors: bool = False,
+        start: int = 1,
     ) -> list[dict]:
-        """단일 지역으로 네이버 API를 호출, raw items을 반환합니다."""
+        """
+        단일 지역으로 네이버 API를 호출, raw items을 반환합니다.
+        호출에 실패하면 빈 리스트 (raise_errors=True면 예외를 그대로 던짐).
+        """
         parts = [area_name, cuisine_keyword]
         if budget_keyword:
             parts.append(budget_keyword)
         query = " ".join(parts)
 
+        params = {
+            "query": query,
+            "display": min(display, 10),
+            "start": start,
+            "sort": "comment",
+        }
         try:
-            response = httpx.get(
-                NAVER_SEARCH_API_URL,
-                params={
-                    "query": query,
-                    "display": min(display, 10),
-                    "start": 1,
-                    "sort": "comment",
-                },
-                headers=self._api_headers,
-                timeout=10,
-            )
-            response.raise_for_status()
-            return response.json().get("items", [])
-        except (httpx.HTTPError, ValueError):
+            return self._get_items(NAVER_SEARCH_API_URL, params, timeout)
+        except _API_ERRORS:
+            if raise_errors:
+                raise
             return []
 
+    def _is_within(self, item: dict, radius: int) -> bool:
+        """좌표가 확인되고 중심에서 radius 안에 있는 항목인지."""
+        coords = item_coordinates(item)
+        if coords is None:
+            return False
+        return haversine_distance(self.center_lat, self.center_lng, *coords) <= radius
+
+    def _fetch_more_pages(
+        self,
+        area_name: str,
+        cuisine_keyword: str,
+        budget_keyword: str,
+        radius: int,
+        known_names: set[str],
+        deadline: float | None = None,
+    ) -> list[dict]:
+        """
+        첫 페이지 다음 페이지들을 page_concurrency개씩 동시에 요청해 새 항목만 반환합니다.
+
+        다음 경우에 멈춥니다.
+        - 한 번에 요청한 페이지들에서 반경 안의 새 후보가 하나도 없음
+        - 페이지가 꽉 차지 않음 (마지막 페이지) 또는 요청 실패
+        - max_pages 도달 또는 시간 예산 소진
+        """
+        known = set(known_names)
+        extra: list[dict] = []
+        page = 1
+        while page < self.max_pages:
+            timeout = _request_timeout(deadline)
+            if timeout is None:
+                break
+            starts = [
+                1 + (page + i) * _AREA_PAGE_SIZE
+                for i in range(min(self.page_concurrency, self.max_pages - page))
+            ]
+            page += len(starts)
+            with ThreadPoolExecutor(max_workers=len(starts)) as pool:
+                pages = list(pool.map(
+                    lambda start: self._search_single_area(
+                        area_name, cuisine_keyword, budget_keyword, timeout=timeout, start=start
+                    ),
+                    starts,
+                ))
+
+            new_in_radius = 0
+            for items in pages:
+                for item in items:
+                    name = _clean_html(item.get("title", ""))
+                    if not name or name in known:
+                        continue
+                    known.add(name)
+                    extra.append(item)
+                    if self._is_within(item, radius):
+                        new_in_radius += 1
+
+            if not new_in_radius or any(len(items) < _AREA_PAGE_SIZE for items in pages):
+                break
+        return extra
+
     def search(
         self,
         area_name: str,
@@ -240,7 +527,9 @@ class RestaurantSearcher:
         radius: int = 1000,
         display: int = 10,
         budget_keyword: str = "",
-    ) -> list[Restaurant]:
+        timeout_budget: float | None = None,
+        deadline: float | None = None,
+    ) -> SearchResults:
         """
         여러 지역명으로 네이버 검색 API를 호출하고 결과를 병합합니다.
 
@@ -250,10 +539,57 @@ class RestaurantSearcher:
             radius: 검색 반경 (미터)
             display: 결과 표시 개수
             budget_keyword: 예산 관련 키워드 (예: "저렴한 가성비")
+            timeout_budget: 전체 검색에 쓸 최대 시간 (초). None이면 제한 없음
+            deadline: time.monotonic() 기준 마감 시각 (timeout_budget보다 우선)
 
         Returns:
-            Restaurant 리스트 (중복 제거, 거리순 정렬)
+            SearchResults (중복 제거, 거리순 정렬).
+            시간 예산을 넘기면 그때까지 모은 결과를 partial=True, skipped_areas와 함께 반환
+            (블로그 리뷰/가격 조회만 생략했어도 partial=True라서 캐시되지 않음)
         """
+        if deadline is None and timeout_budget is not None:
+            deadline = time.monotonic() + timeout_budget
+
+        key = search_cache_key(
+            cuisine_keyword, budget_keyword, self.center_lat, self.center_lng, radius, display
+        )
+        def run() -> SearchResults:
+            return self._search_uncached(cuisine_keyword, radius, display, budget_keyword, deadline)
+
+        # 같은 검색이 진행 중이면 남은 예산만큼만 기다림
+        wait = None if deadline is None else deadline - time.monotonic()
+        try:
+            if self.cache is None:
+                results = self.search_flight.do(key, run, timeout=wait)
+            else:
+                # 빈 결과(API 오류일 수 있음)와 부분 결과는 캐시하지 않음
+                results = self.cache.get_or_load(
+                    key, run, flight=self.search_flight, cacheable=_is_complete, timeout=wait,
+                    refresh_older_than=0 if self.force_refresh else None,
+                )
+
+                # 캐시된 뒤에 제외한 식당은 빼고 반환
+                from bot_core.db import db, restaurant_keys
+
+                excluded_keys = db.get_excluded_keys()
+                results = results.with_items(
+                    r for r in results
+                    if restaurant_keys(r.name, r.road_address or r.address, r.address).isdisjoint(excluded_keys)
+                )
+        except TimeoutError:
+            return SearchResults(partial=True, skipped_areas=SEARCH_AREAS)
+
+        # 세션마다 결과를 수정해도 캐시 원본이 바뀌지 않도록 복사본 반환
+        return results.with_items(replace(r) for r in results)
+
+    def _search_uncached(
+        self,
+        cuisine_keyword: str,
+        radius: int,
+        display: int,
+        budget_keyword: str,
+        deadline: float | None = None,
+    ) -> SearchResults:
         # 여러 지역으로 검색하여 raw items 수집
         all_items: list[dict] = []
         seen_names: set[str] = set()
@@ -261,25 +597,56 @@ class RestaurantSearcher:
         # "양식 파스타 스테이크" 처럼 공백으로 구분된 키워드를 분리하여 각각 검색
         keywords = cuisine_keyword.split()
 
+        # 시간 예산이 바닥났거나, 응답 전에 예산이 끝났거나, 재시도 후에도 API 호출이 실패한 지역
+        started = time.monotonic()
+        skipped_areas: list[str] = []
+
         for area in SEARCH_AREAS:
             for kw in keywords:
-                items = self._search_single_area(area, kw, budget_keyword)
+                timeout = _request_timeout(deadline)
+                if timeout is None:
+                    if area not in skipped_areas:
+                        skipped_areas.append(area)
+                    continue
+                try:
+                    items = self._search_single_area(
+                        area, kw, budget_keyword, timeout=timeout, raise_errors=True
+                    )
+                except _API_ERRORS as e:
+                    print(f"[Search Error] {area} {kw}: {e!r}")
+                    items = []
+                    if area not in skipped_areas:
+                        skipped_areas.append(area)
+                if not items and _request_timeout(deadline) is None and area not in skipped_areas:
+                    skipped_areas.append(area)
+
+                # 첫 페이지가 꽉 찼으면 다음 페이지도 (반경 안 새 후보가 나오는 동안)
+                if self.max_pages > 1 and len(items) >= _AREA_PAGE_SIZE:
+                    first_page_names = {_clean_html(item.get("title", "")) for item in items}
+                    items = items + self._fetch_more_pages(
+                        area, kw, budget_keyword, radius, seen_names | first_page_names, deadline
+                    )
                 for item in items:
                     name = _clean_html(item.get("title", ""))
                     if name and name not in seen_names:
                         seen_names.add(name)
                         all_items.append(item)
 
-        from bot_core.db import db
+        from bot_core.db import db, restaurant_keys
+
+        # 제외 목록은 한 번만 읽어서 식별 키 집합으로 비교
+        excluded_keys = db.get_excluded_keys()
 
         restaurants = []
+        located_ids: set[int] = set()
         for item in all_items:
             title = _clean_html(item.get("title", ""))
             address = item.get("address", "")
 
-            # 제외된 식당 필터링
             # 제외된 식당 필터링 (사용자 설정)
-            if db.is_excluded(title, address):
+            # 카드/이력과 동일하게 도로명 주소 우선으로 식별 (구버전 지번 주소 키도 확인)
+            keys = restaurant_keys(title, item.get("roadAddress") or address, address)
+            if not keys.isdisjoint(excluded_keys):
                 continue
             
             # 업종 필터링 (카페, 술집 등 제외)
@@ -291,28 +658,10 @@ class RestaurantSearcher:
 
             lat, lng = self.center_lat, self.center_lng
             distance = 0.0
-            try:
-                raw_x = item.get("mapx", 0)
-                raw_y = item.get("mapy", 0)
-                mapx = int(raw_x) if raw_x else 0
-                mapy = int(raw_y) if raw_y else 0
-
-                if mapx > 0 and mapy > 0:
-                    # 2023.08 이후: WGS84 좌표 (정수형, 10^7 배율)
-                    # 예: mapx=1269873882 → lng=126.9873882
-                    if mapx > 1000000:
-                        converted_lng = mapx / 1e7
-                        converted_lat = mapy / 1e7
-                    else:
-                        # 혹시 구형 KATEC 좌표가 오면 근사 변환
-                        converted_lng = 123.76 + (mapx * 1.0e-5)
-                        converted_lat = 32.85 + (mapy * 8.8e-6)
-
-                    if _is_reasonable_korea_coordinate(converted_lat, converted_lng):
-                        lat, lng = converted_lat, converted_lng
-                        distance = haversine_distance(self.center_lat, self.center_lng, lat, lng)
-            except (TypeError, ValueError):
-                pass
+            coords = item_coordinates(item)
+            if coords:
+                lat, lng = coords
+                distance = haversine_distance(self.center_lat, self.center_lng, lat, lng)
 
             restaurant = Restaurant(
                 name=title,
@@ -332,12 +681,10 @@ class RestaurantSearcher:
             if restaurant.name:
                 restaurant.map_url = f"https://map.naver.com/v5/search/{quote(restaurant.name)}"
 
-            # 블로그 리뷰
-            restaurant.blog_reviews = self._fetch_blog_reviews(restaurant.name)
-
             restaurants.append(restaurant)
+            if coords:
+                located_ids.add(id(restaurant))
 
-        # 거리 필터링
         # 거리 필터링
         filtered = [r for r in restaurants if r.distance_m <= radius]
 
@@ -350,12 +697,35 @@ class RestaurantSearcher:
             restaurants.sort(key=lambda r: r.distance_m)
             final_results = restaurants[:display]
 
-        # 최종 결과에 대해 가격 정보 채우기 (API 호출 최소화)
+        # 좌표가 확인된 식당만 모임 장소별 거리 계산
+        attach_landmark_distances([r for r in final_results if id(r) in located_ids])
+
+        # 블로그 리뷰는 반경/개수로 거른 최종 결과만 (시간 예산이 남았을 때만)
+        details_skipped = False
         for r in final_results:
-             if not r.price:
-                 r.price = self.search_blog_for_price(r.name)
+            timeout = _request_timeout(deadline)
+            if timeout is None:
+                details_skipped = True
+            else:
+                r.blog_reviews = self._fetch_blog_reviews(r.name, timeout=timeout)
 
-        return final_results
+        # 최종 결과에 대해 가격 정보 채우기 (API 호출 최소화)
+        for r in final_results:
+            if r.price:
+                continue
+            timeout = _request_timeout(deadline, limit=2.0)
+            if timeout is None:
+                details_skipped = True
+            else:
+                r.price = self.search_blog_for_price(r.name, timeout=timeout)
+
+        return SearchResults(
+            final_results,
+            # 리뷰/가격을 빠뜨린 결과가 완전한 결과로 캐시되지 않도록 함께 표시
+            partial=bool(skipped_areas) or details_skipped,
+            skipped_areas=skipped_areas,
+            elapsed=time.monotonic() - started,
+        )
 
     def search_with_expanded_radius(
         self,
@@ -363,18 +733,24 @@ class RestaurantSearcher:
         cuisine_keyword: str,
         initial_radius: int = 1000,
         max_radius: int = 2000,
-    ) -> tuple[list[Restaurant], int]:
+        timeout_budget: float | None = None,
+        deadline: float | None = None,
+    ) -> tuple[SearchResults, int]:
         """
         검색 결과가 부족하면 반경을 자동 확대합니다 (최대 2km).
+        시간 예산은 모든 시도에 걸쳐 하나로 적용됩니다.
 
         Returns:
             (식당 리스트, 최종 사용된 반경)
         """
+        if deadline is None and timeout_budget is not None:
+            deadline = time.monotonic() + timeout_budget
+
         for radius in [initial_radius, min(initial_radius * 2, max_radius)]:
-            results = self.search(area_name, cuisine_keyword, radius)
+            results = self.search(area_name, cuisine_keyword, radius, deadline=deadline)
             if results:
                 return results, radius
 
         # 최대 반경으로 마지막 시도
-        results = self.search(area_name, cuisine_keyword, radius=max_radius)
+        results = self.search(area_name, cuisine_keyword, radius=max_radius, deadline=deadline)
         return results, max_radius
@@ -0,0 +1,278 @@
+"""네이버 API/지도 트래픽 녹화·재생 (cassette)
+
+검색이 느리거나 결과가 이상했던 순간을 그대로 재현하려면 그때의 API 응답이 필요합니다.
+녹화 모드는 RestaurantSearcher(httpx.get)와 URL 파서(requests)가 주고받은 요청/응답을
+gzip으로 압축한 JSON Lines 파일에 기록하고, 재생 모드는 네트워크 없이 같은 응답을 돌려줍니다.
+
+- 요청 식별: 메서드 + URL (쿼리 파라미터는 정렬). 요청 헤더는 저장하지 않으므로 API 키가 남지 않음
+- 같은 요청이 여러 번 녹화됐으면 녹화 순서대로 돌려주고, 다 쓰면 마지막 응답을 반복
+- 재생 지연: speed=None이면 즉시, 1.0이면 녹화 당시 응답 시간 그대로, 10이면 10배 빠르게
+- 녹화에 없는 요청은 연결 오류(httpx.ConnectError / requests.ConnectionError)로 처리하고 misses에 셈
+- 단축 URL의 redirect는 요청마다 따로 녹화되므로 재생해도 같은 경로를 따라감
+
+설치하면 프로세스 전체의 httpx.get과 requests 세션이 카세트를 거칩니다.
+    with Cassette("data/cassettes/slow.jsonl.gz", mode="replay", speed=1.0):
+        searcher.search(...)
+"""
+
+import gzip
+import io
+import json
+import threading
+import time
+from collections import defaultdict, deque
+from pathlib import Path
+from unittest.mock import patch
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import httpx
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+MODE_RECORD = "record"
+MODE_REPLAY = "replay"
+
+# 응답에서 저장할 헤더 (본문 해석과 redirect에 필요한 것만)
+_KEPT_HEADERS = ("content-type", "location", "retry-after")
+
+# 본문을 풀어서 넘기므로 응답을 다시 만들 때 빼야 하는 헤더 (압축 방식/원래 길이)
+_ENCODING_HEADERS = ("content-encoding", "content-length", "transfer-encoding")
+
+# 녹화 항목을 이만큼 모을 때마다 파일에 덧붙임 (gzip 멤버 하나)
+_FLUSH_EVERY = 50
+
+
+def request_key(method: str, url: str) -> str:
+    """메서드와 쿼리 파라미터를 정렬한 URL로 된 요청 식별자."""
+    parts = urlsplit(str(url))
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return f"{method.upper()} {urlunsplit((parts.scheme, parts.netloc, parts.path, query, ''))}"
+
+
+def _encode_body(body: bytes) -> str:
+    # 본문은 대부분 UTF-8 텍스트(JSON/HTML). 깨진 바이트도 그대로 되돌릴 수 있게 surrogateescape
+    return body.decode("utf-8", errors="surrogateescape")
+
+
+def _decode_body(text: str) -> bytes:
+    return text.encode("utf-8", errors="surrogateescape")
+
+
+def _decoded_headers(headers) -> list[tuple[str, str]]:
+    """압축을 푼 본문과 함께 돌려줄 헤더. 그대로 두면 클라이언트가 풀린 본문을 다시 풀려고 함."""
+    return [(k, v) for k, v in headers.items() if k.lower() not in _ENCODING_HEADERS]
+
+
+def load_cassette(path: str | Path) -> list[dict]:
+    """카세트 파일의 녹화 항목을 순서대로 읽습니다."""
+    entries = []
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                entries.append(json.loads(line))
+    return entries
+
+
+class CassetteMiss(LookupError):
+    """재생 중 녹화에 없는 요청."""
+
+
+class Cassette:
+    """요청/응답 녹화·재생기. 컨텍스트 매니저로 쓰거나 install()/uninstall()을 직접 호출합니다."""
+
+    def __init__(
+        self,
+        path: str | Path,
+        mode: str = MODE_REPLAY,
+        speed: float | None = None,
+        transport: httpx.BaseTransport | None = None,
+        adapter: BaseAdapter | None = None,
+    ):
+        if mode not in (MODE_RECORD, MODE_REPLAY):
+            raise ValueError(f"알 수 없는 카세트 모드: {mode}")
+        self.path = Path(path)
+        self.mode = mode
+        self.speed = speed
+        # 녹화 시 실제로 요청을 보낼 httpx 전송 계층 / requests 어댑터 (테스트에서 교체)
+        self._transport = transport or httpx.HTTPTransport()
+        self._adapter = adapter or HTTPAdapter()
+        self._lock = threading.Lock()
+        self._pending: list[dict] = []
+        self._replay: dict[str, deque[dict]] = defaultdict(deque)
+        self._patches = []
+        self._client: httpx.Client | None = None
+        self.recorded = 0
+        self.replayed = 0
+        self.misses = 0
+
+        if mode == MODE_REPLAY:
+            for entry in load_cassette(self.path):
+                self._replay[entry["key"]].append(entry)
+        else:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    # ─── 녹화 ─────────────────────────────────────────────────
+    def record(self, method: str, url: str, status: int, headers, body: bytes, elapsed: float):
+        entry = {
+            "key": request_key(method, url),
+            "status": status,
+            "headers": {k: v for k, v in headers.items() if k.lower() in _KEPT_HEADERS},
+            "body": _encode_body(body),
+            "elapsed": round(elapsed, 4),
+        }
+        with self._lock:
+            self._pending.append(entry)
+            self.recorded += 1
+            if len(self._pending) >= _FLUSH_EVERY:
+                self._flush_locked()
+
+    def flush(self):
+        """모은 녹화 항목을 파일에 덧붙입니다."""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        if not self._pending:
+            return
+        lines = "".join(json.dumps(e, ensure_ascii=False) + "\n" for e in self._pending)
+        with gzip.open(self.path, "at", encoding="utf-8") as f:
+            f.write(lines)
+        self._pending = []
+
+    # ─── 재생 ─────────────────────────────────────────────────
+    def lookup(self, method: str, url: str) -> dict:
+        """녹화된 응답을 찾아 (speed에 맞춰 기다린 뒤) 반환합니다. 없으면 CassetteMiss."""
+        key = request_key(method, url)
+        with self._lock:
+            queue = self._replay.get(key)
+            if not queue:
+                self.misses += 1
+                raise CassetteMiss(key)
+            entry = queue.popleft() if len(queue) > 1 else queue[0]
+            self.replayed += 1
+        if self.speed:
+            time.sleep(entry["elapsed"] / self.speed)
+        return entry
+
+    # ─── 설치 ─────────────────────────────────────────────────
+    def install(self) -> "Cassette":
+        """프로세스 전체의 httpx.get과 requests 세션이 카세트를 거치도록 합니다."""
+        self._client = httpx.Client(transport=_CassetteTransport(self))
+        adapter = _CassetteAdapter(self)
+        self._patches = [
+            patch.object(httpx, "get", self._client.get),
+            patch.object(requests.Session, "get_adapter", lambda session, url: adapter),
+        ]
+        for p in self._patches:
+            p.start()
+        return self
+
+    def uninstall(self):
+        for p in reversed(self._patches):
+            p.stop()
+        self._patches = []
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+        if self.mode == MODE_RECORD:
+            self.flush()
+
+    def __enter__(self) -> "Cassette":
+        return self.install()
+
+    def __exit__(self, *exc):
+        self.uninstall()
+
+
+class _CassetteTransport(httpx.BaseTransport):
+    """httpx 요청을 녹화하거나 재생합니다."""
+
+    def __init__(self, cassette: Cassette):
+        self.cassette = cassette
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        cassette = self.cassette
+        if cassette.mode == MODE_REPLAY:
+            try:
+                entry = cassette.lookup(request.method, str(request.url))
+            except CassetteMiss as e:
+                raise httpx.ConnectError(f"카세트에 없는 요청: {e}", request=request)
+            return httpx.Response(
+                entry["status"], headers=entry["headers"], content=_decode_body(entry["body"])
+            )
+
+        started = time.monotonic()
+        response = cassette._transport.handle_request(request)
+        body = response.read()
+        response.close()
+        cassette.record(
+            request.method, str(request.url), response.status_code, response.headers, body,
+            time.monotonic() - started,
+        )
+        return httpx.Response(response.status_code, headers=_decoded_headers(response.headers), content=body)
+
+
+class _CassetteAdapter(BaseAdapter):
+    """requests 요청을 녹화하거나 재생합니다 (redirect는 세션이 단계별로 다시 보냄)."""
+
+    def __init__(self, cassette: Cassette):
+        super().__init__()
+        self.cassette = cassette
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        cassette = self.cassette
+        if cassette.mode == MODE_REPLAY:
+            try:
+                entry = cassette.lookup(request.method, request.url)
+            except CassetteMiss as e:
+                raise requests.ConnectionError(f"카세트에 없는 요청: {e}", request=request)
+            return self._build_response(request, entry["status"], entry["headers"], _decode_body(entry["body"]))
+
+        started = time.monotonic()
+        response = cassette._adapter.send(
+            request, stream=stream, timeout=timeout, verify=verify, cert=cert, proxies=proxies
+        )
+        body = response.content
+        cassette.record(
+            request.method, request.url, response.status_code, response.headers, body,
+            time.monotonic() - started,
+        )
+        return self._build_response(request, response.status_code, _decoded_headers(response.headers), body)
+
+    def _build_response(self, request, status: int, headers, body: bytes) -> requests.Response:
+        response = requests.Response()
+        response.status_code = status
+        response.headers = CaseInsensitiveDict(headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.raw = io.BytesIO(body)
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        return response
+
+    def close(self):
+        pass
+
+
+# ─── 앱 전역 카세트 ──────────────────────────────────────────
+_installed_lock = threading.Lock()
+_installed: Cassette | None = None
+
+
+def install_cassette(path: str | Path, mode: str, speed: float | None = None) -> Cassette:
+    """
+    앱 프로세스에 카세트를 한 번만 설치합니다. 이미 설치돼 있으면 기존 카세트를 반환합니다.
+    녹화 모드면 프로세스 종료 시 남은 항목을 저장합니다.
+    """
+    global _installed
+    with _installed_lock:
+        if _installed is not None:
+            return _installed
+        _installed = Cassette(path, mode=mode, speed=speed).install()
+        if mode == MODE_RECORD:
+            import atexit
+
+            atexit.register(_installed.flush)
+        return _installed
@@ -2,6 +2,11 @@
 
 from math import radians, cos, sin, asin, sqrt
 
+import numpy as np
+
+EARTH_RADIUS_M = 6371000  # 지구 반경 (미터)
+METERS_PER_DEGREE_LAT = 111320  # 위도 1도당 거리 (미터)
+
 
 def haversine_distance(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
     """
@@ -14,7 +19,7 @@ def haversine_distance(lat1: float, lng1: float, lat2: float, lng2: float) -> fl
     Returns:
         거리 (미터)
     """
-    R = 6371000  # 지구 반경 (미터)
+    R = EARTH_RADIUS_M
 
     lat1, lng1, lat2, lng2 = map(radians, [lat1, lng1, lat2, lng2])
 
@@ -48,3 +53,40 @@ def estimate_walking_time(distance_m: float) -> str:
     if minutes < 1:
         return "1분 미만"
     return f"도보 {int(minutes)}분"
+
+
+def haversine_matrix(lats, lngs, target_lats, target_lngs) -> np.ndarray:
+    """
+    여러 좌표(n개)와 여러 기준점(m개) 사이의 거리를 한 번에 계산합니다 (벡터 연산).
+
+    Returns:
+        (n, m) 거리 행렬 (미터)
+    """
+    lat1 = np.radians(np.asarray(lats, dtype=float))[:, None]
+    lng1 = np.radians(np.asarray(lngs, dtype=float))[:, None]
+    lat2 = np.radians(np.asarray(target_lats, dtype=float))[None, :]
+    lng2 = np.radians(np.asarray(target_lngs, dtype=float))[None, :]
+
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lng2 - lng1) / 2) ** 2
+    return EARTH_RADIUS_M * 2 * np.arcsin(np.sqrt(a))
+
+
+def haversine_distances(center_lat: float, center_lng: float, lats, lngs) -> np.ndarray:
+    """
+    한 중심점에서 여러 좌표까지의 거리를 한 번에 계산합니다 (벡터 연산).
+
+    Args:
+        center_lat, center_lng: 중심점 위도/경도
+        lats, lngs: 대상 위도/경도 배열 (같은 길이)
+
+    Returns:
+        거리 배열 (미터)
+    """
+    return haversine_matrix(lats, lngs, [center_lat], [center_lng])[:, 0]
+
+
+def bounding_box(lat: float, lng: float, radius_m: float) -> tuple[float, float, float, float]:
+    """중심점 반경을 감싸는 (최소 위도, 최대 위도, 최소 경도, 최대 경도)를 반환합니다."""
+    dlat = radius_m / METERS_PER_DEGREE_LAT
+    dlng = radius_m / (METERS_PER_DEGREE_LAT * cos(radians(lat)))
+    return lat - dlat, lat + dlat, lng - dlng, lng + dlng
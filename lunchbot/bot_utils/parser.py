@@ -1,98 +1,274 @@
 """데이터 파싱 및 유틸리티"""
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from html.parser import HTMLParser
+
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
 import re
 import json
+import sqlite3
 import streamlit as st
 
-def parse_naver_map_url(url: str) -> dict | None:
+from bot_utils.place_cache import PlaceCache, place_cache
+
+_MOBILE_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (iPhone; CPU iPhone OS 14_6 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.0 Mobile/15E148 Safari/604.1"
+}
+
+_PLACE_ID_PATTERNS = [r'place/(\d+)', r'restaurant/(\d+)', r'id=(\d+)', r'pinId=(\d+)']
+
+_STREAM_CHUNK_SIZE = 16 * 1024
+
+_URL_RE = re.compile(r"https?://[^\s,\"'<>]+")
+
+
+def _new_session(pool_size: int = 10) -> requests.Session:
+    """커넥션 풀 크기를 동시 실행 수에 맞춘 세션을 만듭니다."""
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update(_MOBILE_HEADERS)
+    return session
+
+
+def _expand_short_url(session: requests.Session, url: str) -> tuple[str, str | None]:
+    """단축 URL의 redirect를 따라가 최종 URL과 Place ID를 반환합니다. 오류 응답이면 HTTPError."""
+    res = session.get(url, timeout=10, allow_redirects=True)
+    res.raise_for_status()
+    final_url = res.url
+
+    for pattern in _PLACE_ID_PATTERNS:
+        match = re.search(pattern, final_url)
+        if match:
+            return final_url, match.group(1)
+    return final_url, None
+
+
+def _stream_place_html(session: requests.Session, place_id: str) -> Iterator[str]:
     """
-    네이버 지도 URL에서 식당 이름, 주소, 카테고리를 추출합니다.
-    redirect URL을 추적하여 Place ID를 얻고, 모바일 페이지를 스크래핑하거나
-    실패 시 네이버 검색 API를 통해 보정합니다.
+    모바일 플레이스 페이지 HTML을 청크 단위로 내보냅니다.
+    소비자가 중간에 멈추면(generator close) 나머지 본문은 받지 않고 연결을 닫습니다.
     """
-    headers = {
-        "User-Agent": "Mozilla/5.0 (iPhone; CPU iPhone OS 14_6 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.0 Mobile/15E148 Safari/604.1"
-    }
-    
-    try:
-        # 1. Expand Short URL & Extract Place ID
-        session = requests.Session()
-        res = session.get(url, headers=headers, timeout=10, allow_redirects=True)
+    mobile_url = f"https://m.place.naver.com/restaurant/{place_id}/home"
+    with session.get(mobile_url, timeout=5, stream=True) as m_res:
         # UTF-8 강제
-        res.encoding = "utf-8"
-        final_url = res.url
-        
-        place_id = None
-        patterns = [r'place/(\d+)', r'restaurant/(\d+)', r'id=(\d+)', r'pinId=(\d+)']
-        for pattern in patterns:
-            match = re.search(pattern, final_url)
-            if match:
-                place_id = match.group(1)
+        m_res.encoding = "utf-8"
+        yield from m_res.iter_content(chunk_size=_STREAM_CHUNK_SIZE, decode_unicode=True)
+
+
+class _PlaceMetaParser(HTMLParser):
+    """
+    og:title / og:description 메타 태그와 application/ld+json 스크립트만 수집하는
+    증분 HTML 파서. 필요한 값을 모두 찾으면 done이 True가 됩니다.
+    """
+
+    _LD_TYPES = ("Restaurant", "CafeOrCoffeeShop", "Place")
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.og_title: str | None = None
+        self.og_description: str | None = None
+        self.ld_places: list[dict] = []
+        self._ld_buffer: list[str] | None = None
+
+    @property
+    def done(self) -> bool:
+        return self.og_title is not None and self.og_description is not None and bool(self.ld_places)
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "meta":
+            attrs = dict(attrs)
+            prop = attrs.get("property")
+            if prop == "og:title" and self.og_title is None:
+                self.og_title = attrs.get("content") or ""
+            elif prop == "og:description" and self.og_description is None:
+                self.og_description = attrs.get("content") or ""
+        elif tag == "script" and dict(attrs).get("type") == "application/ld+json":
+            self._ld_buffer = []
+
+    def handle_data(self, data):
+        if self._ld_buffer is not None:
+            self._ld_buffer.append(data)
+
+    def handle_endtag(self, tag):
+        if tag == "script" and self._ld_buffer is not None:
+            try:
+                js = json.loads("".join(self._ld_buffer))
+                if isinstance(js, dict) and js.get("@type") in self._LD_TYPES:
+                    self.ld_places.append(js)
+            except ValueError:
+                pass
+            self._ld_buffer = None
+
+
+def _extract_place_info(html: str | Iterable[str]) -> dict:
+    """
+    플레이스 페이지 HTML(문자열 또는 청크 스트림)에서 이름, 주소, 카테고리를 추출합니다.
+    전체 DOM을 만들지 않고, 필요한 메타/JSON-LD를 모두 찾는 즉시 읽기를 멈춥니다.
+    """
+    chunks = [html] if isinstance(html, str) else html
+    parser = _PlaceMetaParser()
+    try:
+        for chunk in chunks:
+            parser.feed(chunk)
+            if parser.done:
                 break
-        
-        name = ""
-        category = ""
-        address = ""
-        
+    finally:
+        # 스트림이면 남은 본문 다운로드를 중단
+        if hasattr(chunks, "close"):
+            chunks.close()
+
+    category = ""
+    address = ""
+
+    # Name from OG Title
+    # "부민옥 : 네이버" -> "부민옥"
+    name = (parser.og_title or "").split(":")[0].strip()
+    
+    # JSON-LD for Address & Category
+    for js in parser.ld_places:
+        if not name: name = js.get("name", "")
+        if not category: category = js.get("servesCuisine", "")
+        if not address and isinstance(js.get("address"), dict):
+            address = js["address"].get("streetAddress", "")
+    
+    # Fallback Address from OG Description if needed
+    if not address:
+        desc = parser.og_description or ""
+        if "|" in desc:
+            address = desc.split("|")[0].strip()
+
+    return {"name": name, "address": address, "category": category}
+
+
+def _finalize_place_info(url: str, info: dict) -> dict | None:
+    """검색 API로 빠진 카테고리/주소를 보완하고 최종 결과를 만듭니다."""
+    name = info.get("name", "")
+    category = info.get("category", "")
+    address = info.get("address", "")
+
+    # Search API Fallback for Category/Address if Name exists but details missing
+    if name and (not category or not address):
+        api_info = _search_naver_api(name)
+        if api_info:
+            if not category: category = api_info.get("category", "")
+            if not address: address = api_info.get("address", "")
+
+    if name:
+        return {
+            "name": name,
+            "address": address,
+            "category": category, # New field
+            "url": url
+        }
+    return None
+
+
+def _resolve_place(
+    session: requests.Session,
+    url: str,
+    cache: PlaceCache,
+) -> dict | None:
+    """
+    캐시를 먼저 확인하고, 없는 단계만 네트워크로 채웁니다.
+    일시적인 실패(로그인/동의 페이지로의 redirect, 검색 API 보정 실패 등)는 캐시하지 않습니다.
+    """
+    # 1. Expand Short URL & Extract Place ID
+    cached_url = cache.get_short_url(url)
+    if cached_url:
+        _, place_id = cached_url
+    else:
+        final_url, place_id = _expand_short_url(session, url)
         if place_id:
-            # 2. Scrape Mobile Page
-            mobile_url = f"https://m.place.naver.com/restaurant/{place_id}/home"
-            m_res = session.get(mobile_url, headers=headers, timeout=5)
-            m_res.encoding = "utf-8"
-            soup = BeautifulSoup(m_res.text, "html.parser")
-            
-            # Name from OG Title
-            og_title = soup.find("meta", property="og:title")
-            raw_title = og_title["content"] if og_title else ""
-            # "부민옥 : 네이버" -> "부민옥"
-            name = raw_title.split(":")[0].strip()
-            
-            # JSON-LD for Address & Category
-            scripts = soup.find_all("script", type="application/ld+json")
-            for s in scripts:
-                try:
-                    js = json.loads(s.string)
-                    if "@type" in js and js["@type"] in ["Restaurant", "CafeOrCoffeeShop", "Place"]:
-                         if not name: name = js.get("name", "")
-                         if not category: category = js.get("servesCuisine", "")
-                         if not address: address = js.get("address", {}).get("streetAddress", "")
-                except:
-                    pass
-            
-            # Fallback Address from OG Description if needed
-            if not address:
-                og_desc = soup.find("meta", property="og:description")
-                desc = og_desc["content"] if og_desc else ""
-                if "|" in desc:
-                    address = desc.split("|")[0].strip()
-
-        # 3. Fallback: If scraping failed to get Name, use basic extraction
-        if not name and "naver.com" in url:
-             # Basic fallback (old logic)
-             pass
-
-        # 4. Search API Fallback for Category/Address if Name exists but details missing
-        if name and (not category or not address):
-            api_info = _search_naver_api(name)
-            if api_info:
-                if not category: category = api_info.get("category", "")
-                if not address: address = api_info.get("address", "")
-        
-        if name:
-            return {
-                "name": name,
-                "address": address,
-                "category": category, # New field
-                "url": url
-            }
-            
+            cache.put_short_url(url, final_url, place_id)
+
+    # 이미 아는 장소면 네트워크 호출 없이 반환
+    if place_id:
+        cached_place = cache.get_place(place_id)
+        if cached_place:
+            return {**cached_place, "url": url}
+
+    # 2. Scrape Mobile Page
+    info = {}
+    if place_id:
+        info = _extract_place_info(_stream_place_html(session, place_id))
+
+    # 3. Search API Fallback
+    result = _finalize_place_info(url, info)
+    # 카테고리/주소를 다 채운 결과만 캐시 (보정 API가 실패했으면 다음에 다시 시도)
+    if result and place_id and result["category"] and result["address"]:
+        cache.put_place(place_id, result)
+    return result
+
+
+def parse_naver_map_url(
+    url: str,
+    session: requests.Session | None = None,
+    cache: PlaceCache | None = None,
+) -> dict | None:
+    """
+    네이버 지도 URL에서 식당 이름, 주소, 카테고리를 추출합니다.
+    redirect URL을 추적하여 Place ID를 얻고, 모바일 페이지를 스크래핑하거나
+    실패 시 네이버 검색 API를 통해 보정합니다. 결과는 place_cache에 저장됩니다.
+    """
+    try:
+        return _resolve_place(session or _new_session(pool_size=1), url, cache or place_cache)
     except Exception as e:
         print(f"[Parser Error] {e}")
         
     return None
 
+
+def extract_urls(text: str) -> list[str]:
+    """붙여넣은 텍스트에서 URL만 순서대로 중복 없이 뽑아냅니다."""
+    return list(dict.fromkeys(_URL_RE.findall(text or "")))
+
+
+def parse_naver_map_urls(
+    urls: list[str],
+    max_concurrency: int = 8,
+    cache: PlaceCache | None = None,
+) -> Iterator[tuple[str, dict | None]]:
+    """
+    여러 네이버 지도 URL을 동시에 파싱하고, 끝나는 순서대로 (url, 결과)를 내보냅니다.
+
+    Args:
+        urls: 파싱할 URL 목록 (중복은 한 번만 처리)
+        max_concurrency: 동시에 진행할 네트워크 요청 수 (세션 커넥션 풀 크기와 동일)
+        cache: URL/장소 캐시 (기본값: 전역 place_cache)
+
+    Yields:
+        (url, 파싱 결과 또는 None)
+    """
+    unique_urls = list(dict.fromkeys(u.strip() for u in urls if u and u.strip()))
+    if not unique_urls:
+        return
+
+    cache = cache or place_cache
+    # 가져오기 배치마다 만료된 캐시 항목 정리 (파일이 끝없이 커지지 않도록)
+    try:
+        cache.purge_expired()
+    except sqlite3.Error as e:
+        print(f"[Place Cache Error] {e}")
+    session = _new_session(pool_size=max_concurrency)
+
+    def _resolve(url: str) -> dict | None:
+        try:
+            return _resolve_place(session, url, cache)
+        except Exception as e:
+            print(f"[Parser Error] {url}: {e}")
+            return None
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_concurrency) as io_pool:
+            futures = {io_pool.submit(_resolve, url): url for url in unique_urls}
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+    finally:
+        session.close()
+
 def _search_naver_api(query: str) -> dict | None:
     """네이버 검색 API를 통해 카테고리와 주소를 보완합니다."""
     try:
@@ -126,52 +302,118 @@ def _search_naver_api(query: str) -> dict | None:
         pass
     return None
 
+# 표준 컬럼 → 허용하는 컬럼명 (앞쪽이 우선)
+_UPLOAD_COLUMN_ALIASES = {
+    "name": ["name", "식당명"],
+    "address": ["address", "주소"],
+    "memo": ["memo", "메모"],
+    "category": ["category", "카테고리", "업종"],
+}
+
+UPLOAD_CHUNK_SIZE = 50_000
+
+
+def _resolve_upload_columns(columns) -> dict[str, str] | None:
+    """
+    헤더에서 표준 컬럼별 실제 컬럼명을 한 번만 찾아 반환합니다.
+    필수 컬럼(name)이 없으면 None.
+    """
+    available = set(columns)
+    resolved = {}
+    for target, aliases in _UPLOAD_COLUMN_ALIASES.items():
+        for alias in aliases:
+            if alias in available:
+                resolved[target] = alias
+                break
+    return resolved if "name" in resolved else None
+
+
+def _normalize_upload_frame(df: pd.DataFrame, columns: dict[str, str]) -> list[dict]:
+    """컬럼 단위 벡터 연산으로 공백/NaN을 정리하고 레코드 리스트로 변환합니다."""
+    out = pd.DataFrame(index=df.index)
+    for target in _UPLOAD_COLUMN_ALIASES:
+        if target not in columns:
+            out[target] = ""
+            continue
+        col = df[columns[target]]
+        col = col.where(col.notna(), "").astype(str).str.strip()
+        # 문자열로 저장된 'nan'도 빈 값으로 취급
+        out[target] = col.mask(col.str.lower() == "nan", "")
+
+    out = out[out["name"] != ""]
+    return out.to_dict("records")
+
+
+def _iter_csv_frames(uploaded_file, chunksize: int) -> Iterator[pd.DataFrame]:
+    yield from pd.read_csv(uploaded_file, dtype=str, chunksize=chunksize)
+
+
+def _iter_xlsx_frames(uploaded_file, chunksize: int) -> Iterator[pd.DataFrame]:
+    """openpyxl read_only 모드로 행을 스트리밍하여 chunksize 단위 DataFrame을 만듭니다."""
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(uploaded_file, read_only=True, data_only=True)
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        header = [str(c) if c is not None else "" for c in header]
+
+        batch = []
+        for row in rows:
+            batch.append(row[:len(header)])
+            if len(batch) >= chunksize:
+                yield pd.DataFrame(batch, columns=header, dtype=object)
+                batch = []
+        if batch:
+            yield pd.DataFrame(batch, columns=header, dtype=object)
+    finally:
+        workbook.close()
+
+
+def iter_uploaded_file(uploaded_file, chunksize: int = UPLOAD_CHUNK_SIZE) -> Iterator[list[dict]]:
+    """
+    업로드된 파일(CSV/Excel)을 chunksize 행 단위 레코드 배치로 나누어 내보냅니다.
+    기대 컬럼: name(필수), address, memo, category
+    필수 컬럼이 없거나 지원하지 않는 형식이면 아무것도 내보내지 않습니다.
+    """
+    filename = uploaded_file.name.lower()
+    if filename.endswith('.csv'):
+        frames = _iter_csv_frames(uploaded_file, chunksize)
+    elif filename.endswith('.xlsx'):
+        frames = _iter_xlsx_frames(uploaded_file, chunksize)
+    elif filename.endswith('.xls'):
+        # 구형 xls는 openpyxl 스트리밍을 지원하지 않음
+        frames = iter([pd.read_excel(uploaded_file, dtype=str)])
+    else:
+        return
+
+    columns = None
+    for df in frames:
+        # 컬럼 이름 정규화 (소문자, 공백 제거)
+        df.columns = [str(c).lower().strip() for c in df.columns]
+        if columns is None:
+            columns = _resolve_upload_columns(df.columns)
+            if columns is None:
+                return
+
+        records = _normalize_upload_frame(df, columns)
+        if records:
+            yield records
+
+
 def parse_uploaded_file(uploaded_file) -> list[dict]:
     """
     업로드된 파일(CSV/Excel)을 파싱하여 딕셔너리 리스트로 반환합니다.
     기대 컬럼: name(필수), address, memo, category
     """
     try:
-        if uploaded_file.name.endswith('.csv'):
-            df = pd.read_csv(uploaded_file)
-        elif uploaded_file.name.endswith(('.xls', '.xlsx')):
-            df = pd.read_excel(uploaded_file)
-        else:
-            return []
-            
-        # 컬럼 이름 정규화 (소문자, 공백 제거)
-        df.columns = [str(c).lower().strip() for c in df.columns]
-        
-        # 필수 컬럼 확인
-        if 'name' not in df.columns and '식당명' not in df.columns:
-            return []
-            
-        # 이름 컬럼 매핑
-        name_col = 'name' if 'name' in df.columns else '식당명'
-        addr_col = 'address' if 'address' in df.columns else '주소'
-        memo_col = 'memo' if 'memo' in df.columns else '메모'
-        cat_col = 'category' if 'category' in df.columns else '카테고리'
-        if cat_col not in df.columns: cat_col = '업종' # Alias
-        
         results = []
-        for _, row in df.iterrows():
-            name = str(row[name_col]).strip()
-            if not name or name.lower() == 'nan':
-                continue
-                
-            address = str(row[addr_col]).strip() if addr_col in df.columns and str(row[addr_col]).lower() != 'nan' else ""
-            memo = str(row[memo_col]).strip() if memo_col in df.columns and str(row[memo_col]).lower() != 'nan' else ""
-            category = str(row[cat_col]).strip() if cat_col in df.columns and str(row[cat_col]).lower() != 'nan' else ""
-
-            results.append({
-                "name": name,
-                "address": address,
-                "memo": memo,
-                "category": category
-            })
-            
+        for batch in iter_uploaded_file(uploaded_file):
+            results.extend(batch)
         return results
-        
+
     except Exception as e:
         print(f"[File Parse Error] {e}")
         return []
@@ -0,0 +1,115 @@
+"""네이버 지도 URL 파싱 캐시
+
+같은 단축 URL과 같은 장소가 반복해서 들어오므로 두 단계로 캐시합니다.
+
+1. 단축 URL → (최종 URL, Place ID)         : redirect 추적 생략
+2. Place ID → {name, address, category}    : 모바일 페이지 다운로드/파싱, 검색 API 보정 생략
+
+각 단계는 별도의 TTL을 가지며 SQLite 파일에 영구 저장됩니다.
+"""
+
+import sqlite3
+import time
+from pathlib import Path
+
+from bot_config.settings import (
+    PLACE_CACHE_DB_PATH,
+    SHORT_URL_CACHE_TTL,
+    PLACE_INFO_CACHE_TTL,
+)
+
+
+class PlaceCache:
+    def __init__(
+        self,
+        db_path: str = PLACE_CACHE_DB_PATH,
+        short_url_ttl: float = SHORT_URL_CACHE_TTL,
+        place_ttl: float = PLACE_INFO_CACHE_TTL,
+    ):
+        self.db_path = db_path
+        self.short_url_ttl = short_url_ttl
+        self.place_ttl = place_ttl
+        self._init_db()
+
+    def _init_db(self):
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS short_urls (
+                    url TEXT PRIMARY KEY,
+                    final_url TEXT NOT NULL,
+                    place_id TEXT,
+                    cached_at REAL NOT NULL
+                )
+            """)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS places (
+                    place_id TEXT PRIMARY KEY,
+                    name TEXT NOT NULL,
+                    address TEXT,
+                    category TEXT,
+                    cached_at REAL NOT NULL
+                )
+            """)
+            conn.commit()
+
+    # ─── 1단계: 단축 URL ─────────────────────────────────────────
+    def get_short_url(self, url: str) -> tuple[str, str] | None:
+        """유효한 캐시가 있으면 (최종 URL, Place ID)를 반환합니다. Place ID 없이 저장된 행은 무시."""
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                SELECT final_url, place_id FROM short_urls
+                WHERE url = ? AND cached_at >= ? AND place_id IS NOT NULL
+                """,
+                (url, time.time() - self.short_url_ttl),
+            )
+            row = cursor.fetchone()
+            return (row[0], row[1]) if row else None
+
+    def put_short_url(self, url: str, final_url: str, place_id: str):
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO short_urls (url, final_url, place_id, cached_at) VALUES (?, ?, ?, ?)",
+                (url, final_url, place_id, time.time()),
+            )
+            conn.commit()
+
+    # ─── 2단계: 장소 정보 ────────────────────────────────────────
+    def get_place(self, place_id: str) -> dict | None:
+        """유효한 캐시가 있으면 {name, address, category}를 반환합니다."""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.row_factory = sqlite3.Row
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT name, address, category FROM places WHERE place_id = ? AND cached_at >= ?",
+                (place_id, time.time() - self.place_ttl),
+            )
+            row = cursor.fetchone()
+            return dict(row) if row else None
+
+    def put_place(self, place_id: str, info: dict):
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO places (place_id, name, address, category, cached_at) VALUES (?, ?, ?, ?, ?)",
+                (place_id, info["name"], info.get("address", ""), info.get("category", ""), time.time()),
+            )
+            conn.commit()
+
+    def purge_expired(self) -> int:
+        """만료된 항목을 삭제하고 삭제 건수를 반환합니다."""
+        now = time.time()
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute("DELETE FROM short_urls WHERE cached_at < ?", (now - self.short_url_ttl,))
+            deleted = cursor.rowcount
+            cursor.execute("DELETE FROM places WHERE cached_at < ?", (now - self.place_ttl,))
+            deleted += cursor.rowcount
+            conn.commit()
+        return deleted
+
+
+# 전역 인스턴스
+place_cache = PlaceCache()
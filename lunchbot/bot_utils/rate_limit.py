@@ -0,0 +1,46 @@
+"""요청 속도 제한 유틸리티"""
+
+import threading
+import time
+
+
+class QuotaExceeded(Exception):
+    """RateLimiter의 총 호출 한도를 모두 사용했습니다."""
+
+
+class RateLimiter:
+    """
+    스레드 안전한 토큰 버킷.
+
+    초당 rate개의 토큰이 채워지고 최대 burst개까지 쌓입니다.
+    acquire()는 토큰을 얻을 때까지 대기합니다.
+    quota를 주면 총 quota번까지만 허용하고 이후 acquire()는 QuotaExceeded를 던집니다.
+    """
+
+    def __init__(self, rate: float, burst: int = 1, quota: int | None = None):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.quota = quota
+        self.used = 0
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self):
+        """토큰 하나를 소비합니다. 없으면 채워질 때까지 기다립니다."""
+        while True:
+            with self._lock:
+                if self.quota is not None and self.used >= self.quota:
+                    raise QuotaExceeded(f"호출 한도 {self.quota}회를 모두 사용했습니다.")
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    self.used += 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
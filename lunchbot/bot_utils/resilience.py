@@ -0,0 +1,230 @@
+"""외부 API 호출 복원력 도구
+
+- 재시도: 일시적 오류(연결 실패, 타임아웃, 5xx, 429)만 최대 max_attempts번, full jitter 지수 백오프
+- 헤지 요청: 응답이 최근 p95 지연보다 늦으면 같은 요청을 하나 더 보내고 먼저 성공한 응답을 사용
+- 서킷 브레이커: 연속 실패가 쌓이면 일정 시간 호출을 막고 즉시 실패 (캐시가 있으면 캐시로 대체)
+
+모든 시도와 대기는 호출자가 준 전체 timeout 안에서만 일어납니다.
+시도별 타임아웃은 제출할 때가 아니라 시도가 실제로 시작될 때 남은 시간으로 정합니다
+(공용 스레드 풀이 밀려 대기열에서 기다린 시간도 예산에서 빠짐).
+늦게 도착한 헤지 요청의 응답은 버려집니다 (요청 자체는 자신의 타임아웃까지 진행).
+"""
+
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable
+
+# 남은 시간이 이보다 적으면 새 시도를 시작하지 않음 (초)
+_MIN_ATTEMPT_TIMEOUT = 0.2
+
+
+class CircuitOpenError(Exception):
+    """서킷 브레이커가 열려 있어 호출하지 않았습니다."""
+
+
+class _NoTimeLeft(TimeoutError):
+    """시도를 시작할 때 이미 시간 예산이 (거의) 바닥났습니다. API 상태와는 무관."""
+
+
+class CircuitBreaker:
+    """
+    연속 실패 횟수 기반 서킷 브레이커.
+
+    closed → (연속 failure_threshold번 실패) → open → (reset_timeout초 후) → half-open
+    half-open에서는 시험 호출 하나만 허용하고, 성공하면 closed, 실패하면 다시 open.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                return self.HALF_OPEN
+            return self._state
+
+    def allow(self) -> bool:
+        """지금 호출해도 되는지. half-open이면 시험 호출 하나만 허용."""
+        with self._lock:
+            if self._state == self.OPEN:
+                if time.monotonic() - self._opened_at < self.reset_timeout:
+                    return False
+                self._state = self.HALF_OPEN
+                self._trial_in_flight = False
+            if self._state == self.HALF_OPEN:
+                if self._trial_in_flight:
+                    return False
+                self._trial_in_flight = True
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._trial_in_flight = False
+
+    def release(self):
+        """허용받은 호출을 보내지 못했을 때 half-open 시험 호출 자리를 돌려줍니다."""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+                self._trial_in_flight = False
+
+
+class LatencyTracker:
+    """최근 성공 응답 지연 시간(초)을 모아 백분위수를 계산합니다."""
+
+    def __init__(self, window: int = 200, min_samples: int = 20):
+        self.min_samples = min_samples
+        self._samples: deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float):
+        with self._lock:
+            self._samples.append(seconds)
+
+    def percentile(self, q: float) -> float | None:
+        """표본이 충분하지 않으면 None."""
+        with self._lock:
+            if len(self._samples) < self.min_samples:
+                return None
+            ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def p95(self) -> float | None:
+        return self.percentile(0.95)
+
+
+class ResilientCaller:
+    """재시도 + 헤지 요청 + 서킷 브레이커를 적용해 함수를 호출합니다.
+
+    여러 세션이 하나의 인스턴스를 공유해야 지연 통계와 브레이커 상태가 의미가 있습니다.
+    """
+
+    def __init__(
+        self,
+        breaker: CircuitBreaker | None = None,
+        latency: LatencyTracker | None = None,
+        max_attempts: int = 3,
+        base_delay: float = 0.2,
+        max_delay: float = 2.0,
+        hedge: bool = True,
+        min_hedge_delay: float = 0.05,
+        max_workers: int = 16,
+    ):
+        self.breaker = breaker or CircuitBreaker()
+        self.latency = latency or LatencyTracker()
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.hedge = hedge
+        self.min_hedge_delay = min_hedge_delay
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="hedge")
+        # 카운터는 여러 세션 스레드와 헤지 스레드가 함께 올림
+        self._counter_lock = threading.Lock()
+        self.attempts = 0
+        self.retries = 0
+        self.hedged = 0
+        self.rejected = 0
+
+    def _count(self, name: str):
+        with self._counter_lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def _timed(self, fn: Callable[[float], Any], deadline: float) -> Any:
+        """deadline까지 남은 시간을 타임아웃으로 fn을 호출합니다 (시작 시점 기준)."""
+        started = time.monotonic()
+        timeout = deadline - started
+        if timeout < _MIN_ATTEMPT_TIMEOUT:
+            raise _NoTimeLeft("시도를 시작하기 전에 시간 예산이 끝났습니다.")
+        result = fn(timeout)
+        self.latency.record(time.monotonic() - started)
+        return result
+
+    def _attempt(self, fn: Callable[[float], Any], deadline: float) -> Any:
+        """한 번 시도. p95보다 늦어지면 같은 요청을 하나 더 보내 먼저 성공한 쪽을 씁니다."""
+        self._count("attempts")
+        p95 = self.latency.p95() if self.hedge else None
+        if p95 is None:
+            return self._timed(fn, deadline)
+
+        hedge_after = max(p95, self.min_hedge_delay)
+        if hedge_after + _MIN_ATTEMPT_TIMEOUT >= deadline - time.monotonic():
+            return self._timed(fn, deadline)
+
+        first = self._pool.submit(self._timed, fn, deadline)
+        done, _ = wait([first], timeout=hedge_after)
+        if done:
+            return first.result()
+
+        self._count("hedged")
+        second = self._pool.submit(self._timed, fn, deadline)
+        pending = {first, second}
+        error: BaseException | None = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    return future.result()
+                error = future.exception()
+        raise error
+
+    def call(
+        self,
+        fn: Callable[[float], Any],
+        timeout: float,
+        is_retryable: Callable[[BaseException], bool],
+    ) -> Any:
+        """
+        fn(시도별 타임아웃)을 호출합니다.
+
+        is_retryable(e)가 True인 오류만 재시도하고 브레이커 실패로 셉니다.
+        그 밖의 오류(4xx 등)는 API가 살아 있다는 뜻이므로 성공으로 기록하고 그대로 던집니다.
+        브레이커가 열려 있으면 CircuitOpenError.
+        """
+        deadline = time.monotonic() + timeout
+        for attempt in range(self.max_attempts):
+            if not self.breaker.allow():
+                self._count("rejected")
+                raise CircuitOpenError("API 호출이 일시적으로 차단되었습니다.")
+
+            try:
+                result = self._attempt(fn, deadline)
+            except _NoTimeLeft:
+                # 요청을 보내지 못했으므로 브레이커에 성공/실패로 기록하지 않음
+                self.breaker.release()
+                raise
+            except Exception as e:
+                if not is_retryable(e):
+                    self.breaker.record_success()
+                    raise
+                self.breaker.record_failure()
+                delay = random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+                remaining = deadline - time.monotonic() - delay
+                if attempt + 1 >= self.max_attempts or remaining < _MIN_ATTEMPT_TIMEOUT:
+                    raise
+                self._count("retries")
+                time.sleep(delay)
+            else:
+                self.breaker.record_success()
+                return result
@@ -0,0 +1,71 @@
+"""동시 중복 호출 합치기 (single-flight)
+
+같은 키로 동시에 들어온 호출 중 하나만 실제로 실행하고, 나머지는 그 결과를 기다렸다가 함께 받습니다.
+캐시가 비어 있는 순간 여러 세션이 동시에 같은 검색을 하면 캐시만으로는 중복 호출을 막지 못하므로,
+실행 중인 호출을 공유해 API 호출을 한 번으로 줄입니다.
+
+결과는 concurrent.futures.Future로 공유하므로 스레드(do)와 asyncio(do_async) 호출자가 섞여도 합쳐집니다.
+실행 중 예외가 나면 기다리던 호출자도 같은 예외를 받습니다.
+기다리는 쪽은 timeout을 줄 수 있으며, 그 안에 끝나지 않으면 TimeoutError를 받습니다 (실행은 계속됨).
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Hashable
+
+
+class SingleFlight:
+    """키별로 실행 중인 호출을 하나로 합칩니다."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, Future] = {}
+        self.executed = 0  # 실제로 실행한 횟수
+        self.shared = 0    # 다른 호출의 결과를 받아 간 횟수
+
+    def _join(self, key: Hashable) -> tuple[Future, bool]:
+        """(공유 Future, 내가 실행해야 하는지)를 반환합니다."""
+        with self._lock:
+            future = self._calls.get(key)
+            if future is not None:
+                self.shared += 1
+                return future, False
+            future = Future()
+            self._calls[key] = future
+            self.executed += 1
+            return future, True
+
+    def _finish(self, key: Hashable):
+        with self._lock:
+            self._calls.pop(key, None)
+
+    def do(self, key: Hashable, fn: Callable[[], Any], timeout: float | None = None) -> Any:
+        """fn()을 실행하거나, 같은 키로 실행 중인 호출의 결과를 (최대 timeout초) 기다립니다."""
+        future, leader = self._join(key)
+        if not leader:
+            return future.result(timeout)
+        try:
+            result = fn()
+        except BaseException as e:
+            self._finish(key)
+            future.set_exception(e)
+            raise
+        self._finish(key)
+        future.set_result(result)
+        return result
+
+    async def do_async(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """do()의 asyncio 버전. 기다리는 동안 이벤트 루프를 막지 않습니다."""
+        future, leader = self._join(key)
+        if not leader:
+            return await asyncio.wrap_future(future)
+        try:
+            result = await fn()
+        except BaseException as e:
+            self._finish(key)
+            future.set_exception(e)
+            raise
+        self._finish(key)
+        future.set_result(result)
+        return result
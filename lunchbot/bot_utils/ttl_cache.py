@@ -0,0 +1,206 @@
+"""프로세스 공용 TTL + LRU 캐시
+
+Streamlit은 세션마다 스크립트를 다시 실행하지만 모듈은 프로세스에 한 번만 로드되므로,
+모듈 전역 캐시는 모든 세션이 공유합니다. 여러 세션 스레드가 동시에 접근하므로 잠금으로 보호합니다.
+
+- TTL: 저장 후 ttl초가 지나면 만료
+- 메모리 상한: 값의 크기(pickle 길이로 추정) 합이 max_bytes를 넘으면 가장 오래 안 쓴 항목부터 제거
+- stale-while-revalidate (get_or_load): ttl이 지났어도 max_age 이내면 기존 값을 바로 돌려주고
+  백그라운드에서 키당 한 번만 갱신. max_age가 지나면 호출자가 직접(동기로) 다시 불러옴
+- stale-if-error (get_or_load): 다시 불러오다 지정한 예외가 나면 max_age가 지난 값이라도 남아 있으면 반환
+- 강제 갱신 (get_or_load의 refresh_older_than): 그보다 오래된 값은 바로 쓰지 않고 동기로 다시 불러옴
+"""
+
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable
+
+
+def _pickled_size(value: Any) -> int:
+    try:
+        return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return 1024
+
+
+@dataclass
+class _Entry:
+    value: Any
+    stored_at: float
+    size: int
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    stale_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+
+class TTLCache:
+    """스레드 안전한 TTL + 메모리 상한 LRU 캐시."""
+
+    def __init__(
+        self,
+        ttl: float,
+        max_bytes: int,
+        max_age: float | None = None,
+        sizeof=_pickled_size,
+    ):
+        self.ttl = ttl
+        # ttl ~ max_age 사이의 항목은 get_or_load에서 오래된 값으로 제공 (None이면 사용 안 함)
+        self.max_age = max(ttl, max_age) if max_age is not None else ttl
+        self.max_bytes = max_bytes
+        self._sizeof = sizeof
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._stats = CacheStats()
+        self._refreshing: set[Hashable] = set()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """만료되지 않은 값을 반환합니다. 없으면 default."""
+        with self._lock:
+            entry = self._entries.get(key)
+            age = time.monotonic() - entry.stored_at if entry is not None else None
+            if entry is None or age > self.ttl:
+                # 오래된 값은 get_or_load에서 쓸 수 있도록 max_age까지 남겨 둠
+                if entry is not None and age > self.max_age:
+                    self._remove(key)
+                self._stats.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self._stats.hits += 1
+            return entry.value
+
+    def get_or_load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Any],
+        flight=None,
+        cacheable: Callable[[Any], bool] | None = None,
+        timeout: float | None = None,
+        stale_if_error: tuple[type[BaseException], ...] = (),
+        refresh_older_than: float | None = None,
+    ) -> Any:
+        """
+        캐시 값을 반환하고, 없거나 오래됐으면 loader()로 불러와 저장합니다.
+
+        - 신선(ttl 이내): 바로 반환
+        - 오래됨(ttl ~ max_age): 기존 값을 바로 반환하고 백그라운드 스레드에서 갱신
+        - 없음/max_age 초과: loader()를 직접 실행
+
+        flight(SingleFlight)를 주면 같은 키의 동시 로딩(백그라운드 갱신 포함)을 하나로 합칩니다.
+        cacheable(value)가 False인 결과는 저장하지 않습니다.
+        timeout은 다른 호출의 로딩을 기다릴 최대 시간입니다 (SingleFlight.do 참고).
+        stale_if_error의 예외로 로딩이 실패하면 max_age가 지난 값이라도 대신 반환합니다
+        (그 값은 새 값으로 바뀔 때까지 지우지 않음).
+        refresh_older_than초보다 오래된 값은 ttl 이내여도 없는 것으로 보고 loader()를 직접 실행합니다
+        (0이면 항상 다시 불러옴). 기존 값은 새 값으로 바뀔 때까지 다른 호출자에게 그대로 제공됩니다.
+        """
+        fallback = None
+        with self._lock:
+            entry = self._entries.get(key)
+            age = time.monotonic() - entry.stored_at if entry is not None else None
+            if entry is not None and age > self.max_age:
+                if stale_if_error:
+                    fallback = entry
+                else:
+                    self._remove(key)
+                entry = None
+
+            if entry is not None and refresh_older_than is not None and age > refresh_older_than:
+                if stale_if_error:
+                    fallback = entry
+                entry = None
+
+            if entry is not None and age <= self.ttl:
+                self._entries.move_to_end(key)
+                self._stats.hits += 1
+                return entry.value
+
+            refresh = False
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._stats.stale_hits += 1
+                refresh = key not in self._refreshing
+                if refresh:
+                    self._refreshing.add(key)
+            else:
+                self._stats.misses += 1
+
+        def load() -> Any:
+            value = loader()
+            if cacheable is None or cacheable(value):
+                self.set(key, value)
+            return value
+
+        run = (lambda: flight.do(key, load, timeout=timeout)) if flight is not None else load
+
+        if entry is None:
+            try:
+                return run()
+            except stale_if_error:
+                if fallback is None:
+                    raise
+                with self._lock:
+                    self._stats.stale_hits += 1
+                return fallback.value
+        if refresh:
+            threading.Thread(
+                target=self._refresh, args=(key, run), name="cache-refresh", daemon=True
+            ).start()
+        return entry.value
+
+    def _refresh(self, key: Hashable, run: Callable[[], Any]):
+        try:
+            run()
+        except Exception as e:
+            print(f"[Cache Refresh Error] {e}")
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def set(self, key: Hashable, value: Any):
+        size = self._sizeof(value)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = _Entry(value, time.monotonic(), size)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self._stats.evictions += 1
+
+    def _remove(self, key: Hashable):
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._stats.hits,
+                stale_hits=self._stats.stale_hits,
+                misses=self._stats.misses,
+                evictions=self._stats.evictions,
+                entries=len(self._entries),
+                bytes=self._bytes,
+            )
@@ -0,0 +1,87 @@
+"""이력 분석 스냅샷 테스트"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+
+from bot_core.analytics import HistorySnapshot
+from bot_core.db import DatabaseManager
+
+
+@pytest.fixture
+def seeded(tmp_path):
+    db = DatabaseManager(str(tmp_path / "history.db"))
+    db.save_search_result("부민옥", "서울 중구", cuisine_type="한식", area="광화문",
+                          reservation_date="2026년 2월 16일 (월)", party_size=6)
+    db.save_search_result("진진", "서울 마포구", cuisine_type="중식", area="광화문",
+                          reservation_date="2026년 2월 23일 (월)", party_size=10)
+    db.add_favorite("부민옥", "서울 중구")
+    snapshot = HistorySnapshot(db.db_path, str(tmp_path / "analytics"))
+    return db, snapshot
+
+
+def test_incremental_refresh(seeded):
+    db, snapshot = seeded
+
+    stats = snapshot.refresh()
+    assert stats.new_history_rows == 2
+    assert stats.favorites == 1
+
+    # 변경이 없으면 새 파트를 만들지 않음
+    assert snapshot.refresh().new_history_rows == 0
+
+    db.save_search_result("부민옥", "서울 중구", cuisine_type="한식", area="광화문",
+                          reservation_date="2026년 3월 3일 (화)", party_size=4)
+    stats = snapshot.refresh()
+    assert stats.new_history_rows == 1
+    assert len(snapshot.load_history()) == 3
+
+
+def test_reports(seeded):
+    _, snapshot = seeded
+    snapshot.refresh()
+
+    by_weekday = snapshot.cuisine_by_weekday()
+    assert by_weekday.loc["월", "한식"] == 1
+    assert by_weekday.loc["월", "중식"] == 1
+
+    party = snapshot.party_size_by_area_month()
+    assert party.loc["2026-02", "광화문"] == 8.0
+
+    top = snapshot.top_restaurants()
+    assert len(top) == 2
+
+
+def test_reports_without_snapshot(tmp_path):
+    snapshot = HistorySnapshot(str(tmp_path / "none.db"), str(tmp_path / "analytics"))
+    assert snapshot.high_water_mark == 0
+    assert snapshot.cuisine_by_weekday().empty
+
+
+def test_interrupted_refresh_leaves_readable_snapshot(seeded, monkeypatch):
+    db, snapshot = seeded
+    snapshot.refresh()
+    db.save_search_result("부민옥", "서울 중구", cuisine_type="한식", area="광화문",
+                          reservation_date="2026년 3월 3일 (화)", party_size=4)
+
+    # 새 파트를 쓴 뒤 메타를 쓰다가 중단된 상황
+    def fail(*args, **kwargs):
+        raise OSError("disk full")
+
+    with monkeypatch.context() as m:
+        m.setattr(Path, "write_text", fail)
+        with pytest.raises(OSError):
+            snapshot.refresh()
+
+    # 메타에 기록되지 않은 파트는 읽지 않고, 임시 파일도 남지 않음
+    assert snapshot.high_water_mark == 2
+    assert len(snapshot.load_history()) == 2
+    assert not list(snapshot.snapshot_dir.rglob("*.tmp"))
+
+    # 다음 갱신은 남은 파트를 대체하고 중복 없이 이어서 반영
+    assert snapshot.refresh().new_history_rows == 1
+    assert sorted(snapshot.load_history()["id"]) == [1, 2, 3]
+    assert len(list((snapshot.snapshot_dir / "search_history").glob("part-*.parquet"))) == 2
@@ -0,0 +1,68 @@
+"""벤치마크 하네스 스모크 테스트 (작은 데이터셋)"""
+
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks import bench_db
+
+
+def test_bench_db_smoke(tmp_path):
+    output = tmp_path / "bench.json"
+    bench_db.main([
+        "--history", "200", "--favorites", "50", "--exclusions", "20",
+        "--iterations", "5", "--output", str(output),
+    ])
+
+    report = json.loads(output.read_text(encoding="utf-8"))
+    assert report["dataset"]["history"] == 200
+    assert {"is_favorite", "get_search_history", "import_favorites"} <= set(report["results"])
+    assert {
+        "search_favorites_radius", "get_favorites_page", "count_exclusions",
+        "move_favorites_to_exclusions", "tag_favorites", "get_unenriched_favorites", "save_enrichment",
+    } <= set(report["results"])
+    for stats in report["results"].values():
+        assert stats["p50_ms"] <= stats["p99_ms"]
+        assert stats["ops_per_sec"] > 0
+
+
+def test_bench_search_smoke(tmp_path):
+    from benchmarks import bench_search
+
+    output = tmp_path / "bench_search.json"
+    bench_search.main([
+        "--iterations", "2", "--latency-ms", "0", "--local-items", "12",
+        "--pages", "3", "--page-concurrency", "2", "--resilient", "--output", str(output),
+    ])
+
+    report = json.loads(output.read_text(encoding="utf-8"))
+    assert set(report["results"]) == {"search", "search_with_expanded_radius"}
+    for stats in report["results"].values():
+        assert stats["local_calls"] > 0 and stats["blog_calls"] > 0
+        assert stats["bytes_received"] > 0
+        assert stats["alloc_peak_kb"] > 0
+        assert stats["p50_ms"] <= stats["p99_ms"]
+
+
+def test_mock_naver_api_pages_and_errors():
+    import httpx
+
+    from benchmarks.bench_search import MockNaverApi
+    from bot_config.settings import NAVER_SEARCH_API_URL
+
+    api = MockNaverApi(local_items=7)
+    with httpx.Client(transport=httpx.MockTransport(api)) as client:
+        first = client.get(NAVER_SEARCH_API_URL, params={"query": "명동 한식", "start": 1, "display": 5})
+        second = client.get(NAVER_SEARCH_API_URL, params={"query": "명동 한식", "start": 6, "display": 5})
+        again = client.get(NAVER_SEARCH_API_URL, params={"query": "명동 한식", "start": 1, "display": 5})
+
+    assert len(first.json()["items"]) == 5 and len(second.json()["items"]) == 2
+    assert first.json() == again.json()  # 같은 질의는 항상 같은 결과
+    assert api.stats.local_calls == 3
+
+    failing = MockNaverApi(error_rate=1.0)
+    with httpx.Client(transport=httpx.MockTransport(failing)) as client:
+        assert client.get(NAVER_SEARCH_API_URL, params={"query": "x"}).status_code == 503
+    assert failing.stats.errors == 1
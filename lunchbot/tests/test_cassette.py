@@ -0,0 +1,165 @@
+"""네이버 API/지도 트래픽 녹화·재생 테스트"""
+
+import gzip
+import io
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import httpx
+import requests
+from requests.adapters import BaseAdapter
+
+from bot_config.settings import NAVER_SEARCH_API_URL
+from bot_core.search import RestaurantSearcher
+from bot_utils import parser
+from bot_utils.cassette import MODE_RECORD, MODE_REPLAY, Cassette, load_cassette, request_key
+from bot_utils.place_cache import PlaceCache
+
+_ITEM = {
+    "title": "<b>녹화 식당</b>",
+    "address": "서울 중구",
+    "roadAddress": "서울 중구 무교로 1",
+    "mapx": "1269783000",
+    "mapy": "375682000",
+    "category": "한식",
+}
+
+PLACE_HTML = """
+<html><head>
+<meta property="og:title" content="부민옥 : 네이버">
+<meta property="og:description" content="서울 중구 다동길 24 | 한식">
+<script type="application/ld+json">
+{"@type": "Restaurant", "name": "부민옥", "servesCuisine": "한식",
+ "address": {"streetAddress": "서울 중구 다동길 24"}}
+</script>
+</head><body></body></html>
+"""
+
+
+def _naver_api(calls: list):
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(str(request.url))
+        if request.url.path == httpx.URL(NAVER_SEARCH_API_URL).path:
+            return httpx.Response(200, json={"items": [_ITEM]})
+        return httpx.Response(200, json={"items": []})
+
+    return httpx.MockTransport(handler)
+
+
+class _FakeWeb(BaseAdapter):
+    """단축 URL → 302 → 플레이스 페이지를 흉내 내는 requests 어댑터."""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+
+    def send(self, request, **kwargs):
+        self.calls.append(request.url)
+        response = requests.Response()
+        response.request = request
+        response.url = request.url
+        if request.url.startswith("https://naver.me/"):
+            response.status_code = 302
+            response.headers["Location"] = "https://map.naver.com/p/entry/place/11"
+            response.raw = io.BytesIO(b"")
+        else:
+            response.status_code = 200
+            response.headers["Content-Type"] = "text/html; charset=utf-8"
+            response.raw = io.BytesIO(PLACE_HTML.encode("utf-8"))
+        return response
+
+    def close(self):
+        pass
+
+
+def test_search_record_then_replay_offline(tmp_path, monkeypatch):
+    monkeypatch.setattr("bot_core.db.db.get_excluded_keys", lambda: set())
+    path = tmp_path / "naver.jsonl.gz"
+    calls = []
+
+    with Cassette(path, mode=MODE_RECORD, transport=_naver_api(calls)) as recorder:
+        recorded = RestaurantSearcher("id", "top-secret").search("광화문", "한식")
+    assert recorder.recorded == len(calls) > 0
+
+    # 압축된 JSON Lines, 요청 헤더(API 키)는 저장하지 않음
+    assert path.read_bytes()[:2] == b"\x1f\x8b"
+    assert "top-secret" not in gzip.decompress(path.read_bytes()).decode("utf-8")
+    assert len(load_cassette(path)) == len(calls)
+
+    calls.clear()
+    with Cassette(path, mode=MODE_REPLAY) as player:
+        replayed = RestaurantSearcher("id", "").search("광화문", "한식")
+    assert calls == []
+    assert player.misses == 0
+    assert [r.to_dict() for r in replayed] == [r.to_dict() for r in recorded]
+
+    # 녹화에 없는 요청은 연결 오류로 처리 (검색은 빈 결과)
+    with Cassette(path, mode=MODE_REPLAY) as player:
+        assert RestaurantSearcher("id", "").search("광화문", "중식") == []
+    assert player.misses > 0
+
+
+def test_parser_redirects_record_then_replay(tmp_path, monkeypatch):
+    monkeypatch.setattr(parser, "_search_naver_api", lambda query: None)
+    path = tmp_path / "parser.jsonl.gz"
+    web = _FakeWeb()
+
+    with Cassette(path, mode=MODE_RECORD, adapter=web):
+        recorded = parser.parse_naver_map_url(
+            "https://naver.me/abc", cache=PlaceCache(str(tmp_path / "record.db"))
+        )
+    assert recorded["name"] == "부민옥"
+    assert len(web.calls) == 3  # 단축 URL, redirect 대상, 모바일 페이지
+
+    with Cassette(path, mode=MODE_REPLAY) as player:
+        replayed = parser.parse_naver_map_url(
+            "https://naver.me/abc", cache=PlaceCache(str(tmp_path / "replay.db"))
+        )
+    assert replayed == recorded
+    assert player.replayed == 3 and player.misses == 0
+
+
+def test_record_and_replay_gzip_response(tmp_path):
+    """네이버 API처럼 gzip으로 압축된 응답도 풀린 본문으로 녹화·재생되어야 한다."""
+    path = tmp_path / "gzip.jsonl.gz"
+    body = b'{"items": [{"title": "gzip"}]}'
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200,
+            headers={"Content-Type": "application/json", "Content-Encoding": "gzip"},
+            content=gzip.compress(body),
+        )
+
+    with Cassette(path, mode=MODE_RECORD, transport=httpx.MockTransport(handler)):
+        recorded = httpx.get(NAVER_SEARCH_API_URL, params={"query": "a"})
+    assert recorded.json() == {"items": [{"title": "gzip"}]}
+    assert "content-encoding" not in recorded.headers
+
+    with Cassette(path, mode=MODE_REPLAY) as player:
+        replayed = httpx.get(NAVER_SEARCH_API_URL, params={"query": "a"})
+    assert replayed.content == body
+    assert player.misses == 0
+
+
+def test_replay_order_and_timing(tmp_path):
+    path = tmp_path / "timing.jsonl.gz"
+    recorder = Cassette(path, mode=MODE_RECORD)
+    url = "https://openapi.naver.com/v1/search/local.json?start=1&query=a"
+    recorder.record("GET", url, 503, {}, b"", elapsed=0.2)
+    recorder.record("GET", url, 200, {"Content-Type": "application/json"}, b"{}", elapsed=0.2)
+    recorder.flush()
+
+    # 쿼리 순서가 달라도 같은 요청, 녹화 순서대로 응답하고 마지막 응답은 반복
+    player = Cassette(path, mode=MODE_REPLAY)
+    same = "https://openapi.naver.com/v1/search/local.json?query=a&start=1"
+    assert request_key("get", same) == request_key("GET", url)
+    assert [player.lookup("GET", same)["status"] for _ in range(3)] == [503, 200, 200]
+
+    fast = Cassette(path, mode=MODE_REPLAY, speed=10)
+    started = time.monotonic()
+    fast.lookup("GET", url)
+    assert 0.02 <= time.monotonic() - started < 0.15
@@ -40,3 +40,188 @@ def test_import_favorites(test_db):
     favs = test_db.get_favorites()
     assert len(favs) == 2
     assert favs[0]["restaurant_name"] == "Imported 2" # ORDER BY DESC
+
+def test_restaurant_identity_is_normalized(test_db):
+    test_db.add_favorite("맛있는 국밥", "서울 중구 세종대로 1")
+
+    # 공백/대소문자 차이는 같은 식당으로 취급
+    assert test_db.is_favorite("맛있는국밥", "서울 중구  세종대로 1")
+    assert not test_db.add_favorite("맛있는  국밥", "서울 중구 세종대로 1")
+
+    test_db.add_exclusion("맛있는 국밥", "서울 중구 세종대로 1")
+    test_db.save_search_result("맛있는 국밥", "서울 중구 세종대로 1", party_size=4)
+
+    # 세 테이블이 같은 식당 엔티티를 참조
+    fav_id = test_db.get_favorites()[0]["restaurant_id"]
+    assert test_db.get_exclusions()[0]["restaurant_id"] == fav_id
+    history = test_db.get_search_history()
+    assert history[0]["restaurant_id"] == fav_id
+    assert history[0]["is_favorite"] == 1
+
+
+def test_excluded_keys_match_restaurant_key(test_db):
+    from bot_core.db import restaurant_key
+
+    test_db.add_exclusion("별로인집", "서울 종로구 종로 1")
+    assert restaurant_key("별로인집", "서울 종로구 종로 1") in test_db.get_excluded_keys()
+
+
+def test_legacy_schema_migration(tmp_path):
+    db_path = tmp_path / "legacy.db"
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("""
+            CREATE TABLE favorites (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                restaurant_name TEXT NOT NULL,
+                address TEXT,
+                memo TEXT
+            )
+        """)
+        conn.execute("""
+            CREATE TABLE exclusions (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                restaurant_name TEXT NOT NULL,
+                address TEXT,
+                reason TEXT
+            )
+        """)
+        conn.execute("INSERT INTO favorites (restaurant_name, address, memo) VALUES ('부민옥', '서울 중구', '육개장')")
+        conn.execute("INSERT INTO exclusions (restaurant_name, address, reason) VALUES ('부민옥', '서울 중구', '휴업')")
+
+    db = DatabaseManager(str(db_path))
+
+    favs = db.get_favorites()
+    assert favs[0]["restaurant_name"] == "부민옥"
+    assert favs[0]["memo"] == "육개장"
+    assert db.is_excluded("부민옥", "서울 중구")
+    assert db.get_exclusions()[0]["restaurant_id"] == favs[0]["restaurant_id"]
+
+    # 재초기화해도 데이터가 유지되어야 함
+    db = DatabaseManager(str(db_path))
+    assert len(db.get_favorites()) == 1
+
+
+def test_legacy_jibun_keyed_exclusion_still_matches(tmp_path):
+    """구버전 검색 결과 화면은 지번 주소로 저장했으므로, 도로명 우선으로 바뀐 뒤에도 찾아야 한다."""
+    from bot_core.db import restaurant_keys
+
+    db_path = tmp_path / "legacy_jibun.db"
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("""
+            CREATE TABLE exclusions (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                restaurant_name TEXT NOT NULL,
+                address TEXT,
+                reason TEXT
+            )
+        """)
+        conn.execute(
+            "INSERT INTO exclusions (restaurant_name, address, reason) "
+            "VALUES ('을지면옥', '서울 중구 입정동 177-1', '사용자 선택')"
+        )
+
+    db = DatabaseManager(str(db_path))
+    road, jibun = "서울 중구 충무로14길 2-1", "서울 중구 입정동 177-1"
+
+    assert not db.is_excluded("을지면옥", road)
+    assert db.is_excluded("을지면옥", road, jibun)
+    assert not restaurant_keys("을지면옥", road, jibun).isdisjoint(db.get_excluded_keys())
+
+    db.remove_exclusion("을지면옥", road, jibun)
+    assert db.get_exclusions() == []
+
+
+def _add_located_favorite(db, name, lat, lng):
+    db.add_favorite(name, f"{name} 주소")
+    fav = db.search_favorites(name)[0]
+    db.save_enrichment(fav["id"], fav["restaurant_id"], "ok", lat=lat, lng=lng)
+
+
+def test_search_favorites_by_distance(test_db):
+    center = (37.5700, 126.9768)
+    _add_located_favorite(test_db, "가까운집", 37.5705, 126.9768)   # 약 55m
+    _add_located_favorite(test_db, "중간집", 37.5750, 126.9768)     # 약 550m
+    _add_located_favorite(test_db, "먼집", 37.5900, 126.9768)       # 약 2.2km
+    test_db.add_favorite("좌표없는집", "어딘가")
+
+    results = test_db.search_favorites("", center_lat=center[0], center_lng=center[1])
+    assert [r["restaurant_name"] for r in results] == ["가까운집", "중간집", "먼집", "좌표없는집"]
+    assert results[0]["distance_m"] == pytest.approx(55.6, abs=1)
+    assert results[-1]["distance_m"] is None
+
+    results = test_db.search_favorites("", center_lat=center[0], center_lng=center[1], radius_m=1000)
+    assert [r["restaurant_name"] for r in results] == ["가까운집", "중간집", "좌표없는집"]
+
+    results = test_db.search_favorites("중간", center_lat=center[0], center_lng=center[1], radius_m=1000)
+    assert [r["restaurant_name"] for r in results] == ["중간집"]
+
+
+def test_spatial_index_backfilled_on_upgrade(tmp_path):
+    db_path = str(tmp_path / "geo.db")
+    db = DatabaseManager(db_path)
+    _add_located_favorite(db, "가까운집", 37.5705, 126.9768)
+
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("DROP TABLE restaurant_geo")
+
+    db = DatabaseManager(db_path)
+    results = db.search_favorites("", center_lat=37.5700, center_lng=126.9768, radius_m=500)
+    assert [r["restaurant_name"] for r in results] == ["가까운집"]
+
+
+def test_favorites_pagination(test_db):
+    test_db.import_favorites([
+        {"name": f"식당{i:02d}", "address": f"주소{i}", "category": "한식" if i % 2 else "중식"}
+        for i in range(25)
+    ])
+
+    assert test_db.count_favorites() == 25
+    assert test_db.count_favorites("식당1") == 10  # 식당1, 식당10~19
+
+    page = test_db.get_favorites_page(sort="name", limit=10, offset=10)
+    assert [r["restaurant_name"] for r in page] == [f"식당{i:02d}" for i in range(10, 20)]
+
+    page = test_db.get_favorites_page(query="식당2", sort="name", limit=10)
+    assert [r["restaurant_name"] for r in page] == [f"식당{i:02d}" for i in range(20, 25)]
+
+    # 알 수 없는 정렬 키는 최신순으로 대체
+    assert test_db.get_favorites_page(sort="'; DROP TABLE favorites; --", limit=1)[0]["restaurant_name"] == "식당24"
+
+
+def test_exclusions_pagination(test_db):
+    for i in range(5):
+        test_db.add_exclusion(f"제외{i}", "", reason="맛없음" if i < 3 else "멀어요")
+
+    assert test_db.count_exclusions("멀어요") == 2
+    page = test_db.get_exclusions_page(sort="name", limit=2, offset=1)
+    assert [r["restaurant_name"] for r in page] == ["제외1", "제외2"]
+
+
+def test_bulk_move_and_delete(test_db):
+    test_db.import_favorites([{"name": f"식당{i}", "address": f"주소{i}"} for i in range(5)])
+    ids = [r["restaurant_id"] for r in test_db.get_favorites_page(sort="name", limit=3)]
+
+    assert test_db.move_favorites_to_exclusions(ids) == 3
+    assert test_db.count_favorites() == 2
+    assert test_db.count_exclusions() == 3
+    assert test_db.is_excluded("식당0", "주소0")
+
+    assert test_db.move_exclusions_to_favorites(ids[:1]) == 1
+    assert test_db.is_favorite("식당0", "주소0")
+    assert test_db.remove_exclusions(ids) == 2
+    assert test_db.count_exclusions() == 0
+
+    assert test_db.remove_favorites([ids[0], 999]) == 1
+    assert test_db.count_favorites() == 2
+
+
+def test_bulk_tag_favorites(test_db):
+    test_db.import_favorites([{"name": f"식당{i}", "address": ""} for i in range(3)])
+    ids = [r["restaurant_id"] for r in test_db.get_favorites()]
+
+    assert test_db.tag_favorites(ids[:2], "회식") == 2
+    categories = sorted(r["category"] for r in test_db.get_favorites())
+    assert categories == ["", "회식", "회식"]
@@ -0,0 +1,106 @@
+"""즐겨찾기 정보 보강 테스트"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import httpx
+import pytest
+
+from bot_core.db import DatabaseManager
+from bot_core.enrichment import FavoriteEnricher, _match_item
+
+
+class MockResponse:
+    def __init__(self, payload, status_code=200):
+        self._payload = payload
+        self.status_code = status_code
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise httpx.HTTPStatusError("error", request=None, response=None)
+
+    def json(self):
+        return self._payload
+
+
+ITEMS = {
+    "부민옥": [{
+        "title": "<b>부민옥</b>",
+        "address": "서울특별시 중구 다동 164",
+        "roadAddress": "서울특별시 중구 다동길 24-12",
+        "category": "한식>국밥",
+        "mapx": "1269797000",
+        "mapy": "375681000",
+    }],
+}
+
+
+@pytest.fixture
+def test_db(tmp_path):
+    return DatabaseManager(str(tmp_path / "test.db"))
+
+
+@pytest.fixture
+def api_calls(monkeypatch):
+    calls = []
+
+    def mock_get(self, url, params=None, **kwargs):
+        calls.append(params["query"])
+        if params["query"] == "오류식당":
+            return MockResponse({}, status_code=500)
+        return MockResponse({"items": ITEMS.get(params["query"], [])})
+
+    monkeypatch.setattr(httpx.Client, "get", mock_get)
+    return calls
+
+
+def test_match_item_prefers_address():
+    items = [
+        {"title": "진진 본점", "address": "서울 마포구 서교동 1"},
+        {"title": "진진", "roadAddress": "서울 마포구 잔다리로 123"},
+    ]
+    assert _match_item(items, "진진", "서울 마포구 잔다리로 123") is items[1]
+    assert _match_item(items, "진진") is items[0]
+    assert _match_item(items, "없는집") is None
+
+
+def test_match_item_same_name_branches():
+    items = [
+        {"title": "부민옥 강남점", "roadAddress": "서울특별시 강남구 테헤란로 1", "mapx": "1270276000"},
+        {"title": "부민옥", "roadAddress": "서울특별시 중구 다동길 24-12", "address": "서울특별시 중구 다동 164"},
+    ]
+    # 약칭/일부만 적힌 주소도 시/도 명칭을 맞춰 비교
+    assert _match_item(items, "부민옥", "서울 중구 다동길 24-12") is items[1]
+    assert _match_item(items, "부민옥", "서울 중구 다동 164") is items[1]
+    # 주소를 아는데 어느 지점과도 맞지 않으면 다른 지점 좌표를 쓰지 않음
+    assert _match_item(items, "부민옥", "부산 해운대구 해운대로 1") is None
+
+
+def test_enrich_favorites(test_db, api_calls):
+    test_db.import_favorites([
+        {"name": "부민옥"},
+        {"name": "없는식당"},
+        {"name": "오류식당"},
+    ])
+
+    stats = FavoriteEnricher("id", "secret", database=test_db, requests_per_second=1000).run()
+    assert (stats.enriched, stats.not_found, stats.failed) == (1, 1, 1)
+
+    fav = test_db.search_favorites("부민옥")[0]
+    assert fav["address"] == "서울특별시 중구 다동길 24-12"
+    assert fav["category"] == "한식>국밥"
+    assert fav["lat"] == pytest.approx(37.5681)
+    assert fav["lng"] == pytest.approx(126.9797)
+
+    # 주소가 채워지면 식별 키도 갱신되어 새 주소로 조회 가능
+    assert test_db.is_favorite("부민옥", "서울특별시 중구 다동길 24-12")
+
+    # 일시 오류 행만 남아 재시도 대상이 됨
+    remaining = test_db.get_unenriched_favorites()
+    assert [r["restaurant_name"] for r in remaining] == ["오류식당"]
+
+    api_calls.clear()
+    FavoriteEnricher("id", "secret", database=test_db, requests_per_second=1000).run()
+    assert api_calls == ["오류식당"]
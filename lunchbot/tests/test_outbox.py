@@ -0,0 +1,166 @@
+"""Slack 알림 아웃박스 테스트"""
+
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import httpx
+import pytest
+
+from bot_core.notification import SlackNotifier, SlackTarget, build_search_result_payload
+from bot_core.outbox import (
+    STATUS_FAILED,
+    STATUS_PENDING,
+    STATUS_SENT,
+    NotificationOutbox,
+    OutboxSender,
+)
+
+HOOK_A = "https://hooks.slack.com/services/A"
+HOOK_B = "https://hooks.slack.com/services/B"
+
+
+@pytest.fixture
+def outbox(tmp_path):
+    return NotificationOutbox(str(tmp_path / "outbox.db"))
+
+
+def _payload(name: str) -> dict:
+    return build_search_result_payload(name, "서울 중구", "2026년 2월 16일 (월)", "12:00", 6)
+
+
+def _flush(sender: OutboxSender) -> int:
+    async def run():
+        async with sender.new_client() as client:
+            return await sender.flush(client)
+    return asyncio.run(run())
+
+
+def test_notifier_enqueues(outbox):
+    notifier = SlackNotifier(HOOK_A, outbox=outbox)
+    assert notifier.send_search_result("테스트", "서울", "2026-02-16", "12:00", 10) is True
+    assert outbox.count_pending() == 1
+
+
+def test_coalesces_per_webhook(outbox):
+    posts = []
+
+    def handler(request: httpx.Request):
+        posts.append((str(request.url), json.loads(request.content)))
+        return httpx.Response(200, text="ok")
+
+    for name in ("식당1", "식당2", "식당3"):
+        outbox.enqueue(HOOK_A, _payload(name))
+    outbox.enqueue(HOOK_B, _payload("식당4"))
+
+    sender = OutboxSender(outbox, transport=httpx.MockTransport(handler))
+    assert _flush(sender) == 4
+    assert outbox.count_pending() == 0
+
+    by_url = dict(posts)
+    assert len(posts) == 2
+    # 알림 3건 = 블록 2개씩 + 구분선 2개
+    assert len(by_url[HOOK_A]["blocks"]) == 8
+    assert len(by_url[HOOK_B]["blocks"]) == 2
+    assert outbox.get(1)["status"] == STATUS_SENT
+
+
+def test_rate_limited_respects_retry_after(outbox):
+    def handler(request):
+        return httpx.Response(429, headers={"Retry-After": "30"}, text="rate_limited")
+
+    notification_id = outbox.enqueue(HOOK_A, _payload("식당"))
+    sender = OutboxSender(outbox, transport=httpx.MockTransport(handler))
+    assert _flush(sender) == 0
+
+    row = outbox.get(notification_id)
+    assert row["status"] == STATUS_PENDING
+    assert row["attempts"] == 1
+    assert row["next_attempt_at"] == pytest.approx(time.time() + 30, abs=5)
+    assert outbox.get_due() == []
+
+
+def test_rate_limited_forever_eventually_fails(outbox):
+    def handler(request):
+        return httpx.Response(429, headers={"Retry-After": "0"}, text="rate_limited")
+
+    notification_id = outbox.enqueue(HOOK_A, _payload("식당"))
+    sender = OutboxSender(outbox, max_attempts=3, transport=httpx.MockTransport(handler))
+
+    for _ in range(3):
+        _flush(sender)
+    row = outbox.get(notification_id)
+    assert row["status"] == STATUS_FAILED
+    assert row["attempts"] == 3
+    assert "429" in row["last_error"]
+
+
+def test_server_error_backs_off_then_gives_up(outbox):
+    def handler(request):
+        return httpx.Response(500, text="oops")
+
+    notification_id = outbox.enqueue(HOOK_A, _payload("식당"))
+    sender = OutboxSender(outbox, max_attempts=2, base_delay=0, transport=httpx.MockTransport(handler))
+
+    _flush(sender)
+    assert outbox.get(notification_id)["status"] == STATUS_PENDING
+    _flush(sender)
+    row = outbox.get(notification_id)
+    assert row["status"] == STATUS_FAILED
+    assert row["attempts"] == 2
+    assert "500" in row["last_error"]
+
+
+def test_invalid_webhook_is_not_retried(outbox):
+    def handler(request):
+        return httpx.Response(404, text="no_service")
+
+    notification_id = outbox.enqueue(HOOK_A, _payload("식당"))
+    _flush(OutboxSender(outbox, transport=httpx.MockTransport(handler)))
+    assert outbox.get(notification_id)["status"] == STATUS_FAILED
+
+
+def test_fan_out_to_targets(outbox):
+    targets = [
+        SlackTarget("https://hooks.slack.com/services/DM", name="dm", template="compact", timeout=3),
+        SlackTarget("https://hooks.slack.com/services/FAC", name="facilities", template="facilities"),
+        SlackTarget("", name="disabled"),
+    ]
+    notifier = SlackNotifier(HOOK_A, outbox=outbox, targets=targets)
+    ids = notifier.dispatch_search_result("식당", "서울 중구", "2026년 2월 16일 (월)", "12:00", 6)
+    assert list(ids) == ["default", "dm", "facilities"]
+
+    seen = {}
+
+    def handler(request: httpx.Request):
+        seen[str(request.url)] = (json.loads(request.content), request.extensions["timeout"]["read"])
+        return httpx.Response(500 if request.url.path.endswith("FAC") else 200)
+
+    _flush(OutboxSender(outbox, transport=httpx.MockTransport(handler)))
+
+    assert len(seen) == 3
+    dm_payload, dm_timeout = seen["https://hooks.slack.com/services/DM"]
+    assert dm_timeout == 3
+    assert len(dm_payload["blocks"]) == 1
+    assert seen[HOOK_A][1] == 10
+
+    statuses = outbox.get_statuses(list(ids.values()))
+    assert statuses[ids["default"]] == STATUS_SENT
+    assert statuses[ids["facilities"]] == STATUS_PENDING
+
+
+def test_duplicate_target_names_are_rejected(outbox):
+    targets = [
+        SlackTarget("https://hooks.slack.com/services/DM1", name="dm"),
+        SlackTarget("https://hooks.slack.com/services/DM2", name="dm"),
+    ]
+    with pytest.raises(ValueError, match="dm"):
+        SlackNotifier(outbox=outbox, targets=targets)
+
+    # 기본 Webhook은 "default"라는 이름을 씀
+    with pytest.raises(ValueError, match="default"):
+        SlackNotifier(HOOK_A, outbox=outbox, targets=[SlackTarget(HOOK_B, name="default")])
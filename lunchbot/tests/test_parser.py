@@ -0,0 +1,229 @@
+"""네이버 지도 URL 파서 테스트"""
+
+import io
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+import requests
+
+from bot_utils import parser
+from bot_utils.place_cache import PlaceCache
+
+PLACE_HTML = """
+<html><head>
+<meta property="og:title" content="{name} : 네이버">
+<meta property="og:description" content="서울 중구 {name}길 1 | 한식">
+<script type="application/ld+json">
+{{"@type": "Restaurant", "name": "{name}", "servesCuisine": "한식",
+  "address": {{"streetAddress": "서울 중구 {name}길 1"}}}}
+</script>
+</head><body><div>{filler}</div></body></html>
+"""
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    cache = PlaceCache(str(tmp_path / "place_cache.db"))
+    monkeypatch.setattr(parser, "place_cache", cache)
+    return cache
+
+
+@pytest.fixture
+def fake_network(monkeypatch, cache):
+    """단축 URL의 마지막 경로를 Place ID로 보고 가짜 페이지를 돌려줍니다."""
+    calls = []
+
+    def fake_expand(session, url):
+        calls.append(url)
+        place_id = url.rsplit("/", 1)[-1]
+        if not place_id.isdigit():
+            return url, None
+        return f"https://map.naver.com/p/entry/place/{place_id}", place_id
+
+    def fake_stream(session, place_id):
+        calls.append(place_id)
+        yield PLACE_HTML.format(name=f"식당{place_id}", filler="x" * 100)
+
+    monkeypatch.setattr(parser, "_expand_short_url", fake_expand)
+    monkeypatch.setattr(parser, "_stream_place_html", fake_stream)
+    monkeypatch.setattr(parser, "_search_naver_api", lambda query: None)
+    return calls
+
+
+def test_extract_place_info():
+    info = parser._extract_place_info(PLACE_HTML.format(name="부민옥", filler=""))
+    assert info == {"name": "부민옥", "address": "서울 중구 부민옥길 1", "category": "한식"}
+
+
+def test_extract_place_info_stops_early():
+    html = PLACE_HTML.format(name="부민옥", filler="")
+    consumed = []
+
+    def chunks():
+        for i in range(0, len(html), 64):
+            consumed.append(i)
+            yield html[i:i + 64]
+        # 필요한 태그는 이미 다 나왔으므로 여기까지 읽으면 안 됨
+        for _ in range(1000):
+            consumed.append(None)
+            yield "<div>" + "x" * 1000 + "</div>"
+
+    info = parser._extract_place_info(chunks())
+    assert info["name"] == "부민옥"
+    assert info["address"] == "서울 중구 부민옥길 1"
+    assert None not in consumed
+
+
+def test_extract_place_info_og_description_fallback():
+    html = (
+        '<meta property="og:title" content="진진 : 네이버">'
+        '<meta property="og:description" content="서울 마포구 잔다리로 123 | 중식">'
+    )
+    info = parser._extract_place_info(html)
+    assert info == {"name": "진진", "address": "서울 마포구 잔다리로 123", "category": ""}
+
+
+def test_parse_naver_map_url(fake_network):
+    info = parser.parse_naver_map_url("https://naver.me/123")
+    assert info["name"] == "식당123"
+    assert info["url"] == "https://naver.me/123"
+
+
+def test_extract_urls_dedupes_in_order():
+    text = "https://naver.me/1\nfoo https://naver.me/2, https://naver.me/1"
+    assert parser.extract_urls(text) == ["https://naver.me/1", "https://naver.me/2"]
+
+
+def test_parse_naver_map_urls_batch(fake_network):
+    urls = [f"https://naver.me/{i}" for i in range(20)] + ["https://naver.me/1", "https://naver.me/bad"]
+
+    results = dict(parser.parse_naver_map_urls(urls, max_concurrency=4))
+
+    # 중복 URL은 한 번만 처리
+    assert len(results) == 21
+    assert sorted(u for u in fake_network if u.startswith("https")) == sorted(set(urls))
+    assert results["https://naver.me/7"]["name"] == "식당7"
+    assert results["https://naver.me/bad"] is None
+
+
+def test_cached_place_costs_no_network(fake_network):
+    first = parser.parse_naver_map_url("https://naver.me/42")
+    assert fake_network == ["https://naver.me/42", "42"]
+
+    fake_network.clear()
+    second = parser.parse_naver_map_url("https://naver.me/42")
+    assert fake_network == []
+    assert second == first
+
+
+def test_place_cache_shared_across_short_urls(fake_network, cache):
+    # 다른 단축 URL이라도 같은 장소면 페이지를 다시 받지 않음
+    cache.put_short_url("https://naver.me/alias", "https://map.naver.com/p/entry/place/42", "42")
+    parser.parse_naver_map_url("https://naver.me/42")
+    fake_network.clear()
+
+    info = parser.parse_naver_map_url("https://naver.me/alias")
+    assert info["name"] == "식당42"
+    assert info["url"] == "https://naver.me/alias"
+    assert fake_network == []
+
+
+def test_place_cache_ttl(tmp_path):
+    cache = PlaceCache(str(tmp_path / "ttl.db"), short_url_ttl=-1, place_ttl=60)
+    cache.put_short_url("https://naver.me/1", "https://map.naver.com/p/entry/place/1", "1")
+    cache.put_place("1", {"name": "a", "address": "b", "category": "c"})
+
+    assert cache.get_short_url("https://naver.me/1") is None
+    assert cache.get_place("1") == {"name": "a", "address": "b", "category": "c"}
+    assert cache.purge_expired() == 1
+
+
+class _Upload(io.BytesIO):
+    """st.file_uploader 가 돌려주는 UploadedFile 흉내 (name 속성 필요)."""
+
+    def __init__(self, data: bytes, name: str):
+        super().__init__(data)
+        self.name = name
+
+
+def test_parse_uploaded_csv_with_aliases():
+    csv = "식당명,주소,업종,메모\n부민옥, 서울 중구 ,한식,\n,빈이름,,\nnan,x,,\n진진,,중식,nan\n"
+    records = parser.parse_uploaded_file(_Upload(csv.encode("utf-8"), "list.csv"))
+    assert records == [
+        {"name": "부민옥", "address": "서울 중구", "memo": "", "category": "한식"},
+        {"name": "진진", "address": "", "memo": "", "category": "중식"},
+    ]
+
+
+def test_parse_uploaded_file_requires_name_column():
+    upload = _Upload("address,memo\n서울,메모\n".encode("utf-8"), "list.csv")
+    assert parser.parse_uploaded_file(upload) == []
+
+
+def test_iter_uploaded_csv_in_batches():
+    rows = "\n".join(f"식당{i},주소{i}" for i in range(25))
+    upload = _Upload(f"name,address\n{rows}\n".encode("utf-8"), "list.csv")
+
+    batches = list(parser.iter_uploaded_file(upload, chunksize=10))
+    assert [len(b) for b in batches] == [10, 10, 5]
+    assert batches[2][-1] == {"name": "식당24", "address": "주소24", "memo": "", "category": ""}
+
+
+def test_iter_uploaded_xlsx_streaming():
+    from openpyxl import Workbook
+
+    wb = Workbook()
+    ws = wb.active
+    ws.append(["Name", "Address", "Category"])
+    for i in range(7):
+        ws.append([f"식당{i}", None if i == 3 else f"주소{i}", "한식"])
+    buffer = io.BytesIO()
+    wb.save(buffer)
+
+    batches = list(parser.iter_uploaded_file(_Upload(buffer.getvalue(), "list.xlsx"), chunksize=5))
+    assert [len(b) for b in batches] == [5, 2]
+    assert batches[0][3] == {"name": "식당3", "address": "", "memo": "", "category": "한식"}
+
+
+def test_failures_are_not_cached(fake_network, cache, monkeypatch):
+    # Place ID를 못 찾은 단축 URL(로그인/동의 redirect 등)은 캐시하지 않고 다음에 다시 시도
+    assert parser.parse_naver_map_url("https://naver.me/consent") is None
+    assert cache.get_short_url("https://naver.me/consent") is None
+
+    # 카테고리/주소 보정이 실패한 장소는 결과만 반환하고 캐시하지 않음
+    def partial_stream(session, place_id):
+        yield '<meta property="og:title" content="이름만 : 네이버">'
+
+    monkeypatch.setattr(parser, "_stream_place_html", partial_stream)
+    info = parser.parse_naver_map_url("https://naver.me/77")
+    assert info["name"] == "이름만" and info["category"] == ""
+    assert cache.get_short_url("https://naver.me/77") is not None
+    assert cache.get_place("77") is None
+
+
+def test_expand_short_url_rejects_error_pages():
+    class _Session:
+        def get(self, url, **kwargs):
+            response = requests.Response()
+            response.status_code = 429
+            response.url = "https://map.naver.com/p/entry/place/1"
+            return response
+
+    with pytest.raises(requests.HTTPError):
+        parser._expand_short_url(_Session(), "https://naver.me/limited")
+
+
+def test_batch_import_purges_expired_cache(fake_network, cache):
+    cache.short_url_ttl = -1
+    cache.put_short_url("https://naver.me/old", "https://map.naver.com/p/entry/place/9", "9")
+
+    dict(parser.parse_naver_map_urls(["https://naver.me/1"]))
+
+    import sqlite3
+
+    with sqlite3.connect(cache.db_path) as conn:
+        urls = [row[0] for row in conn.execute("SELECT url FROM short_urls")]
+    assert "https://naver.me/old" not in urls
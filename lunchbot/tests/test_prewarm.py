@@ -0,0 +1,167 @@
+"""검색 캐시 사전 채우기 테스트"""
+
+import sys
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bot_config.settings import (
+    BUDGET_KEYWORDS,
+    CUISINE_TYPES,
+    NAVER_SEARCH_API_URL,
+    RADIUS_OPTIONS,
+    SEARCH_AREAS,
+)
+from bot_core.prewarm import AUTO_SELECT_QUERY, Prewarmer, next_run_at, prewarm_queries
+from bot_core.search import search_cache_key
+from bot_utils.ttl_cache import TTLCache
+
+
+class _Api:
+    class Response:
+        status_code = 200
+
+        def __init__(self, payload):
+            self._payload = payload
+
+        def raise_for_status(self):
+            return None
+
+        def json(self):
+            return self._payload
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, url, *args, **kwargs):
+        self.calls += 1
+        if url == NAVER_SEARCH_API_URL:
+            return self.Response({"items": [{
+                "title": kwargs["params"]["query"],
+                "address": "서울 중구",
+                "mapx": "1269768000",
+                "mapy": "375700000",
+                "category": "한식",
+            }]})
+        return self.Response({"items": []})
+
+
+def test_prewarm_queries_cover_all_combinations():
+    queries = prewarm_queries()
+    assert queries[0] == AUTO_SELECT_QUERY
+    assert len(queries) == 1 + len(CUISINE_TYPES) * len(BUDGET_KEYWORDS) * len(RADIUS_OPTIONS)
+
+
+def test_next_run_at_skips_weekend():
+    friday_noon = datetime(2026, 2, 13, 12, 0)
+    assert next_run_at(friday_noon, "11:00", (0, 1, 2, 3, 4)) == datetime(2026, 2, 16, 11, 0)
+    monday_morning = datetime(2026, 2, 16, 9, 30)
+    assert next_run_at(monday_morning, "11:00", (0, 1, 2, 3, 4)) == datetime(2026, 2, 16, 11, 0)
+
+
+def test_prewarmer_fills_cache_within_quota(monkeypatch):
+    api = _Api()
+    monkeypatch.setattr("bot_core.search.httpx.get", api)
+    monkeypatch.setattr("bot_core.db.db.get_excluded_keys", lambda: set())
+    cache = TTLCache(ttl=60, max_bytes=16 * 1024 * 1024)
+    api_cache = TTLCache(ttl=60, max_bytes=16 * 1024 * 1024)
+
+    queries = [
+        {"cuisine_keyword": "한식", "budget_keyword": "", "radius": radius}
+        for radius in RADIUS_OPTIONS
+    ]
+    prewarmer = Prewarmer("id", "secret", cache=cache, api_cache=api_cache, requests_per_second=1000)
+    stats = prewarmer.run(queries)
+
+    assert stats.warmed == len(queries)
+    assert stats.api_calls == api.calls
+    # 반경만 다른 조합은 API 캐시를 재사용: 지역 검색 한 번씩
+    # + 최종 결과(최대 10곳)의 블로그 리뷰/가격 검색 한 번씩
+    assert api.calls == len(SEARCH_AREAS) + 2 * min(10, len(SEARCH_AREAS))
+    searcher = prewarmer.searcher
+    assert cache.get(search_cache_key("한식", "", searcher.center_lat, searcher.center_lng, 1000, 10))
+
+    # 호출 한도에 닿으면 남은 조합은 건너뜀
+    limited = Prewarmer(
+        "id", "secret", cache=TTLCache(60, 1 << 20), api_cache=TTLCache(60, 1 << 20),
+        requests_per_second=1000, max_api_calls=5,
+    )
+    stats = limited.run([{"cuisine_keyword": "일식", "budget_keyword": "", "radius": 1000}] * 2)
+    assert stats.warmed == 0
+    assert stats.skipped == 2
+    assert stats.api_calls == 5
+
+
+def test_prewarm_limits_do_not_leak_into_user_searches(monkeypatch):
+    """사전 캐시 작업이 실행 중인 요청에 사용자 검색이 합류하지 않아 호출 한도 오류를 받지 않는다."""
+    import threading
+
+    from bot_core.search import RestaurantSearcher, api_flight, search_flight
+
+    started = threading.Event()
+    release = threading.Event()
+    api = _Api()
+
+    def slow_get(url, *args, **kwargs):
+        if threading.current_thread().name == "prewarm-test":
+            started.set()
+            release.wait(2)
+        return api(url, *args, **kwargs)
+
+    monkeypatch.setattr("bot_core.search.httpx.get", slow_get)
+    monkeypatch.setattr("bot_core.db.db.get_excluded_keys", lambda: set())
+    cache = TTLCache(ttl=60, max_bytes=1 << 20)
+    prewarmer = Prewarmer(
+        "id", "secret", cache=cache, api_cache=TTLCache(60, 1 << 20),
+        requests_per_second=1000, max_api_calls=1,
+    )
+    assert prewarmer.searcher.search_flight is not search_flight
+    assert prewarmer.searcher.api_flight is not api_flight
+
+    query = {"cuisine_keyword": "한식", "budget_keyword": "", "radius": 1000}
+    worker = threading.Thread(target=prewarmer.run, args=([query],), name="prewarm-test")
+    worker.start()
+    started.wait(2)
+    try:
+        user = RestaurantSearcher("id", "secret").search("광화문", "한식")
+    finally:
+        release.set()
+        worker.join(2)
+
+    assert user  # 사용자 검색은 자기 요청으로 끝까지 진행
+    assert prewarmer.stats.skipped == 1
+
+
+def test_prewarm_reloads_stale_entries_synchronously(monkeypatch):
+    """캐시에 오래된 값이 있어도 백그라운드 갱신에 맡기지 않고 직접 다시 검색한다."""
+    api = _Api()
+    monkeypatch.setattr("bot_core.search.httpx.get", api)
+    monkeypatch.setattr("bot_core.db.db.get_excluded_keys", lambda: set())
+
+    def age(*caches, seconds=1000):
+        for c in caches:
+            for entry in c._entries.values():
+                entry.stored_at -= seconds
+    cache = TTLCache(ttl=60, max_age=6 * 3600, max_bytes=1 << 20)
+    api_cache = TTLCache(ttl=60, max_age=24 * 3600, max_bytes=1 << 20)
+    query = {"cuisine_keyword": "한식", "budget_keyword": "", "radius": 1000}
+
+    Prewarmer("id", "secret", cache=cache, api_cache=api_cache, requests_per_second=1000).run([query])
+    first_calls = api.calls
+
+    # 검색 캐시는 오래됨(stale), API 캐시는 검색 캐시 TTL보다 오래됨
+    age(cache, api_cache)
+    stats = Prewarmer("id", "secret", cache=cache, api_cache=api_cache, requests_per_second=1000).run([query])
+    assert stats.warmed == 1
+    assert stats.api_calls == first_calls
+    assert api.calls == 2 * first_calls
+    assert cache.stats.stale_hits == 0 and api_cache.stats.stale_hits == 0
+
+    # 오래된 값이 있어도 호출 한도 초과는 이 스레드에서 나서 남은 조합을 건너뜀
+    age(cache, api_cache)
+    limited = Prewarmer(
+        "id", "secret", cache=cache, api_cache=api_cache, requests_per_second=1000, max_api_calls=1,
+    )
+    stats = limited.run([query] * 2)
+    assert (stats.warmed, stats.skipped) == (0, 2)
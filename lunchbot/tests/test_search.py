@@ -3,6 +3,8 @@
 import sys
 from pathlib import Path
 
+import pytest
+
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from bot_core.search import (
@@ -314,3 +316,424 @@ def test_map_url_and_phone_extraction(monkeypatch):
 
     # 2. 전화번호 확인
     assert r.phone == "02-1234-5678"
+
+
+def test_attach_landmark_distances():
+    """모든 모임 장소까지의 거리가 한 번에 채워지고, 기준을 바꿔 볼 수 있어야 한다."""
+    from bot_core.search import attach_landmark_distances
+    from bot_utils.geo import haversine_distance
+
+    landmarks = {
+        "광화문역": {"lat": 37.5710, "lng": 126.9769},
+        "시청역": {"lat": 37.5657, "lng": 126.9769},
+    }
+    near_city_hall = Restaurant(name="A", address="", lat=37.5660, lng=126.9770)
+    unknown = Restaurant(name="B", address="")
+
+    attach_landmark_distances([near_city_hall, unknown], landmarks)
+
+    assert set(near_city_hall.landmark_distances) == {"광화문역", "시청역"}
+    assert near_city_hall.landmark_distances["시청역"] == pytest.approx(
+        haversine_distance(37.5660, 126.9770, 37.5657, 126.9769)
+    )
+    assert unknown.landmark_distances == {}
+
+    moved = near_city_hall.at_landmark("광화문역")
+    assert moved.distance_m == near_city_hall.landmark_distances["광화문역"]
+    assert moved.walking_time.startswith("도보")
+    assert near_city_hall.distance_m == 0.0  # 원본은 그대로
+    assert unknown.at_landmark("광화문역") is unknown
+
+
+class _CountingApi:
+    """지역 검색 1건 + 블로그 검색을 흉내 내며 호출 수를 셉니다."""
+
+    class Response:
+        status_code = 200
+
+        def __init__(self, payload):
+            self._payload = payload
+
+        def raise_for_status(self):
+            return None
+
+        def json(self):
+            return self._payload
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, url, *args, **kwargs):
+        self.calls += 1
+        if url == NAVER_SEARCH_API_URL:
+            return self.Response({"items": [{
+                "title": "캐시 식당",
+                "address": "서울 중구",
+                "roadAddress": "서울 중구 무교로 1",
+                "mapx": "1269783000",
+                "mapy": "375682000",
+                "category": "한식",
+            }]})
+        return self.Response({"items": []})
+
+
+def test_search_results_cache_shared_between_searchers(monkeypatch):
+    """같은 조건의 검색은 다른 세션(검색기)에서도 API를 다시 부르지 않아야 한다."""
+    from bot_core.search import search_cache_key
+    from bot_utils.ttl_cache import TTLCache
+
+    api = _CountingApi()
+    monkeypatch.setattr("bot_core.search.httpx.get", api)
+    monkeypatch.setattr("bot_core.db.db.get_excluded_keys", lambda: set())
+    cache = TTLCache(ttl=60, max_bytes=1024 * 1024)
+
+    first = RestaurantSearcher("id", "secret", cache=cache).search("광화문", "한식")
+    calls = api.calls
+    second = RestaurantSearcher("id", "secret", cache=cache).search("광화문", " 한식 ")
+
+    assert api.calls == calls
+    assert [r.name for r in second] == [r.name for r in first]
+    assert second[0] is not first[0]
+    assert search_cache_key(" 한식", "", 37.568200001, 126.97, 1000, 10) == \
+        search_cache_key("한식 ", "", 37.5682, 126.97, 1000, 10)
+
+    # 캐시된 뒤 제외한 식당은 캐시 적중 결과에서도 빠짐
+    from bot_core.db import restaurant_key
+
+    monkeypatch.setattr(
+        "bot_core.db.db.get_excluded_keys",
+        lambda: {restaurant_key("캐시 식당", "서울 중구 무교로 1")},
+    )
+    assert RestaurantSearcher("id", "secret", cache=cache).search("광화문", "한식") == []
+    assert api.calls == calls
+
+
+def test_legacy_jibun_keyed_exclusion_filters_search(tmp_path, monkeypatch):
+    """지번 주소로 저장된 구버전 제외 식당도 검색 결과에서 빠져야 한다."""
+    import sqlite3
+
+    from bot_core.db import DatabaseManager
+    from bot_utils.ttl_cache import TTLCache
+
+    db_path = tmp_path / "legacy.db"
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "CREATE TABLE exclusions (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+            "created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP, "
+            "restaurant_name TEXT NOT NULL, address TEXT, reason TEXT)"
+        )
+        conn.execute(
+            "INSERT INTO exclusions (restaurant_name, address, reason) VALUES ('캐시 식당', '서울 중구', '')"
+        )
+    migrated = DatabaseManager(str(db_path))
+
+    monkeypatch.setattr("bot_core.search.httpx.get", _CountingApi())
+    monkeypatch.setattr("bot_core.db.db.get_excluded_keys", migrated.get_excluded_keys)
+    searcher = RestaurantSearcher("id", "secret", cache=TTLCache(ttl=60, max_bytes=1024 * 1024))
+    assert searcher.search("광화문", "한식") == []
+
+
+def test_concurrent_identical_searches_share_api_calls(monkeypatch):
+    """동시에 같은 검색을 하면 지역/블로그 API는 한 번씩만 호출되어야 한다."""
+    import threading
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    from bot_core.search import search_flight
+
+    api = _CountingApi()
+    started = threading.Event()
+
+    def slow_get(url, *args, **kwargs):
+        started.set()
+        time.sleep(0.05)
+        return api(url, *args, **kwargs)
+
+    monkeypatch.setattr("bot_core.search.httpx.get", slow_get)
+    monkeypatch.setattr("bot_core.db.db.get_excluded_keys", lambda: set())
+
+    single = RestaurantSearcher("id", "secret")
+    single.search("광화문", "양식")
+    calls_per_search = api.calls
+    api.calls = 0
+    shared_before = search_flight.shared
+
+    def run():
+        return RestaurantSearcher("id", "secret").search("광화문", "양식")
+
+    with ThreadPoolExecutor(max_workers=5) as pool:
+        first = pool.submit(run)
+        started.wait()
+        others = [pool.submit(run) for _ in range(4)]
+        results = [first.result()] + [f.result() for f in others]
+
+    assert api.calls == calls_per_search
+    assert search_flight.shared - shared_before == 4
+    assert all([r.name for r in res] == ["캐시 식당"] for res in results)
+
+
+def test_api_cache_shared_between_different_searches(monkeypatch):
+    """반경만 다른 검색은 지역/블로그 API 응답 캐시를 함께 쓴다."""
+    from bot_utils.ttl_cache import TTLCache
+
+    api = _CountingApi()
+    monkeypatch.setattr("bot_core.search.httpx.get", api)
+    monkeypatch.setattr("bot_core.db.db.get_excluded_keys", lambda: set())
+    api_cache = TTLCache(ttl=60, max_age=3600, max_bytes=1024 * 1024)
+
+    searcher = RestaurantSearcher("id", "secret", api_cache=api_cache)
+    searcher.search("광화문", "중식", radius=1000)
+    calls = api.calls
+    searcher.search("광화문", "중식", radius=2000)
+
+    # 지역/블로그 리뷰 요청은 모두 캐시에서 응답
+    assert api.calls == calls
+
+
+def test_search_deadline_returns_partial_results(monkeypatch):
+    """시간 예산을 넘기면 남은 지역은 건너뛰고, 모은 결과를 부분 결과로 반환한다."""
+    import time
+
+    from bot_config.settings import SEARCH_AREAS
+    from bot_utils.ttl_cache import TTLCache
+
+    api = _CountingApi()
+    area_calls = []
+
+    def slow_get(url, *args, **kwargs):
+        if url == NAVER_SEARCH_API_URL:
+            area_calls.append(kwargs["params"]["query"])
+            time.sleep(0.15)
+        return api(url, *args, **kwargs)
+
+    monkeypatch.setattr("bot_core.search.httpx.get", slow_get)
+    monkeypatch.setattr("bot_core.db.db.get_excluded_keys", lambda: set())
+    cache = TTLCache(ttl=60, max_bytes=1024 * 1024)
+
+    searcher = RestaurantSearcher("id", "secret", cache=cache)
+    started = time.monotonic()
+    results = searcher.search("광화문", "한식", timeout_budget=0.5)
+
+    assert time.monotonic() - started < 1.0
+    assert results.partial
+    assert [r.name for r in results] == ["캐시 식당"]
+    assert len(area_calls) < len(SEARCH_AREAS)
+    assert results.skipped_areas == SEARCH_AREAS[len(area_calls):]
+    # 부분 결과는 캐시하지 않음
+    assert len(cache) == 0
+
+    full = searcher.search("광화문", "한식")
+    assert not full.partial and full.skipped_areas == []
+    assert len(cache) == 1
+
+
+def test_search_deadline_during_blog_lookups_is_not_cached(monkeypatch):
+    """지역 검색은 끝났지만 리뷰/가격 조회 중에 예산이 바닥나면 부분 결과로 보고 캐시하지 않는다."""
+    import time
+
+    from bot_utils.ttl_cache import TTLCache
+
+    api = _CountingApi()
+
+    def slow_blog_get(url, *args, **kwargs):
+        if url == NAVER_BLOG_SEARCH_API_URL:
+            time.sleep(0.4)
+        return api(url, *args, **kwargs)
+
+    monkeypatch.setattr("bot_core.search.httpx.get", slow_blog_get)
+    monkeypatch.setattr("bot_core.db.db.get_excluded_keys", lambda: set())
+    cache = TTLCache(ttl=60, max_bytes=1024 * 1024)
+
+    results = RestaurantSearcher("id", "secret", cache=cache).search("광화문", "한식", timeout_budget=0.5)
+
+    assert [r.name for r in results] == ["캐시 식당"]
+    assert results.skipped_areas == []
+    assert results.partial
+    assert len(cache) == 0
+
+
+class _ErrorResponse:
+    """raise_for_status()에서 HTTP 오류를 내는 응답."""
+
+    def __init__(self, response):
+        self._response = response
+        self.status_code = response.status_code
+
+    def raise_for_status(self):
+        self._response.raise_for_status()
+
+
+def test_resilient_search_retries_and_reports_failed_areas(monkeypatch):
+    """일시적 5xx는 재시도로 살리고, 장애로 차단된 지역은 조용히 빠지지 않고 생략 지역으로 알린다."""
+    import httpx
+
+    from bot_config.settings import SEARCH_AREAS
+    from bot_utils import resilience
+    from bot_utils.resilience import CircuitBreaker, ResilientCaller
+    from bot_utils.ttl_cache import TTLCache
+
+    monkeypatch.setattr(resilience.time, "sleep", lambda seconds: None)
+    monkeypatch.setattr("bot_core.db.db.get_excluded_keys", lambda: set())
+    api = _CountingApi()
+    failures = {"left": 1}
+
+    def flaky_get(url, *args, **kwargs):
+        if failures["left"]:
+            failures["left"] -= 1
+            request = httpx.Request("GET", url)
+            return _ErrorResponse(httpx.Response(503, request=request))
+        return api(url, *args, **kwargs)
+
+    monkeypatch.setattr("bot_core.search.httpx.get", flaky_get)
+    caller = ResilientCaller(breaker=CircuitBreaker(failure_threshold=2), hedge=False)
+    cache = TTLCache(ttl=60, max_bytes=1024 * 1024)
+    searcher = RestaurantSearcher("id", "secret", cache=cache, caller=caller)
+
+    results = searcher.search("광화문", "한식")
+    assert [r.name for r in results] == ["캐시 식당"]
+    assert not results.partial and caller.retries == 1
+
+    # API가 계속 실패하면 차단 → 나머지 지역은 호출 없이 생략, 부분 결과는 캐시하지 않음
+    failures["left"] = 10 ** 6
+    results = searcher.search("광화문", "양식")
+    assert results == [] and results.partial
+    assert results.skipped_areas == SEARCH_AREAS
+    assert caller.rejected > 0
+    assert len(cache) == 1
+
+
+def test_api_cache_serves_expired_response_while_circuit_open(monkeypatch):
+    """차단 중에는 API 캐시에 남아 있는 지난 응답(max_age 초과 포함)을 대신 쓴다."""
+    from bot_utils import ttl_cache
+    from bot_utils.resilience import CircuitBreaker, ResilientCaller
+    from bot_utils.ttl_cache import TTLCache
+
+    api = _CountingApi()
+    monkeypatch.setattr("bot_core.search.httpx.get", api)
+    now = [1000.0]
+    monkeypatch.setattr(ttl_cache.time, "monotonic", lambda: now[0])
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+    api_cache = TTLCache(ttl=10, max_age=20, max_bytes=1024 * 1024)
+    searcher = RestaurantSearcher(
+        "id", "secret", api_cache=api_cache, caller=ResilientCaller(breaker=breaker, hedge=False)
+    )
+    params = {"query": "광화문 한식", "display": 5, "start": 1, "sort": "comment"}
+
+    items = searcher._get_items(NAVER_SEARCH_API_URL, params)
+    now[0] += 100
+    breaker.record_failure()
+    assert searcher._get_items(NAVER_SEARCH_API_URL, params) == items
+    assert api.calls == 1
+
+
+def test_paged_area_search_stops_when_no_new_candidates(monkeypatch):
+    """첫 페이지가 꽉 차면 다음 페이지들을 가져오고, 반경 안 새 후보가 없으면 더 넘기지 않는다."""
+    from bot_config.settings import SEARCH_AREAS
+
+    monkeypatch.setattr("bot_core.db.db.get_excluded_keys", lambda: set())
+    monkeypatch.setattr("bot_core.search.SEARCH_AREAS", SEARCH_AREAS[:1])
+    starts = []
+
+    def item(name, far=False):
+        return {
+            "title": name,
+            "address": "서울 중구",
+            "mapx": "1279783000" if far else "1269783000",
+            "mapy": "375682000",
+            "category": "한식",
+        }
+
+    class Response:
+        status_code = 200
+
+        def __init__(self, items):
+            self._items = items
+
+        def raise_for_status(self):
+            return None
+
+        def json(self):
+            return {"items": self._items}
+
+    def paged_get(url, *args, **kwargs):
+        if url != NAVER_SEARCH_API_URL:
+            return Response([])
+        start = kwargs["params"]["start"]
+        starts.append(start)
+        page = (start - 1) // 5
+        # 1~2페이지는 가까운 식당, 3페이지부터는 반경 밖 식당만
+        return Response([item(f"식당{page}-{i}", far=page >= 2) for i in range(5)])
+
+    monkeypatch.setattr("bot_core.search.httpx.get", paged_get)
+    searcher = RestaurantSearcher(
+        "id", "secret", center_lat=37.5682, center_lng=126.9783, max_pages=10, page_concurrency=2
+    )
+    results = searcher.search("광화문", "한식", radius=1000, display=30)
+
+    # 1페이지 → (2,3페이지 동시) → 3페이지까지 반경 안 새 후보 있음 → (4,5페이지) 새 후보 없음 → 멈춤
+    assert sorted(starts) == [1, 6, 11, 16, 21]
+    assert len([r for r in results if r.distance_m <= 1000]) == 10
+
+    # 꽉 차지 않은 첫 페이지는 다음 페이지를 요청하지 않음
+    def single_get(url, *args, **kwargs):
+        if url == NAVER_SEARCH_API_URL:
+            starts.append(kwargs["params"]["start"])
+        return Response([item("혼자")])
+
+    starts.clear()
+    monkeypatch.setattr("bot_core.search.httpx.get", single_get)
+    searcher.search("광화문", "양식", radius=1000)
+    assert starts == [1]
+
+
+def test_search_blog_for_price_uses_most_mentioned_price(monkeypatch):
+    """블로그 본문에서 가장 많이 언급된 가격을 쓰고, 요청에는 API 키 헤더가 붙는다."""
+    from bot_utils.ttl_cache import TTLCache
+
+    requests = []
+
+    def blog_get(url, *args, **kwargs):
+        requests.append((url, kwargs))
+        return _CountingApi.Response({"items": [
+            {"description": "점심 <b>백반</b> 9,000원, 제육 11,000원"},
+            {"description": "대표 메뉴 11,000원 · 주차 1,000원"},
+            {"description": "가격은 11000원"},
+        ]})
+
+    monkeypatch.setattr("bot_core.search.httpx.get", blog_get)
+    searcher = RestaurantSearcher("id", "secret", api_cache=TTLCache(ttl=60, max_bytes=1 << 20))
+
+    assert searcher.search_blog_for_price("부민옥") == "11,000원"
+    url, kwargs = requests[0]
+    assert url == NAVER_BLOG_SEARCH_API_URL
+    assert kwargs["headers"]["X-Naver-Client-Secret"] == "secret"
+    assert kwargs["params"]["query"] == "부민옥 메뉴판 가격"
+
+    # 같은 식당은 API 캐시에서 응답
+    assert searcher.search_blog_for_price("부민옥") == "11,000원"
+    assert len(requests) == 1
+
+
+def test_blog_lookups_only_for_final_in_radius_results(monkeypatch):
+    """반경 밖 후보와 표시 개수를 넘는 후보에는 블로그 리뷰/가격 API를 부르지 않는다."""
+    from bot_config.settings import SEARCH_AREAS
+
+    monkeypatch.setattr("bot_core.db.db.get_excluded_keys", lambda: set())
+    monkeypatch.setattr("bot_core.search.SEARCH_AREAS", SEARCH_AREAS[:1])
+    blog_queries = []
+
+    def get(url, *args, **kwargs):
+        if url != NAVER_SEARCH_API_URL:
+            blog_queries.append(kwargs["params"]["query"])
+            return _CountingApi.Response({"items": []})
+        return _CountingApi.Response({"items": [
+            {"title": "가까운 식당", "address": "서울 중구", "mapx": "1269783000", "mapy": "375682000"},
+            {"title": "먼 식당", "address": "서울 중구", "mapx": "1279783000", "mapy": "375682000"},
+        ]})
+
+    monkeypatch.setattr("bot_core.search.httpx.get", get)
+    searcher = RestaurantSearcher("id", "secret", center_lat=37.5682, center_lng=126.9783)
+    results = searcher.search("광화문", "한식", radius=1000)
+
+    assert [r.name for r in results] == ["가까운 식당"]
+    assert blog_queries == ["가까운 식당 후기", "가까운 식당 메뉴판 가격"]
@@ -6,7 +6,16 @@ from datetime import date
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from bot_utils.geo import haversine_distance, is_within_radius, format_distance, estimate_walking_time
+import pytest
+
+from bot_utils.geo import (
+    bounding_box,
+    estimate_walking_time,
+    format_distance,
+    haversine_distance,
+    haversine_distances,
+    is_within_radius,
+)
 from bot_utils.date_helper import get_next_monday, format_date_korean, format_date_short
 
 
@@ -77,3 +86,274 @@ def test_format_date_short():
     result = format_date_short(d)
     assert "02/16" in result
     assert "월" in result
+
+
+def test_haversine_distances_matches_scalar():
+    lats = [37.5710, 37.5657, 37.5682]
+    lngs = [126.9769, 126.9769, 126.9783]
+    distances = haversine_distances(37.5682, 126.9783, lats, lngs)
+    for lat, lng, d in zip(lats, lngs, distances):
+        assert abs(d - haversine_distance(37.5682, 126.9783, lat, lng)) < 1e-6
+
+
+def test_bounding_box_contains_radius():
+    min_lat, max_lat, min_lng, max_lng = bounding_box(37.5682, 126.9783, 500)
+    assert haversine_distance(37.5682, 126.9783, max_lat, 126.9783) == pytest.approx(500, rel=0.01)
+    assert haversine_distance(37.5682, 126.9783, 37.5682, max_lng) == pytest.approx(500, rel=0.01)
+    assert min_lat < 37.5682 < max_lat and min_lng < 126.9783 < max_lng
+
+
+def test_ttl_cache_expiry_and_lru_eviction(monkeypatch):
+    """TTL이 지나면 만료되고, 메모리 상한을 넘으면 가장 오래 안 쓴 항목부터 제거된다."""
+    from bot_utils import ttl_cache
+    from bot_utils.ttl_cache import TTLCache
+
+    now = [1000.0]
+    monkeypatch.setattr(ttl_cache.time, "monotonic", lambda: now[0])
+    cache = TTLCache(ttl=10, max_bytes=30, sizeof=lambda value: 10)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("c", 3)
+    assert cache.get("a") == 1  # a를 최근 사용으로 갱신
+    cache.set("d", 4)  # 상한 초과 → b 제거
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("d") == 4
+    assert cache.stats.evictions == 1
+    assert cache.stats.bytes == 30
+
+    now[0] += 11
+    assert cache.get("a", "expired") == "expired"
+    assert len(cache) == 2
+
+
+def test_single_flight_coalesces_threads_and_async():
+    """동시에 들어온 같은 키의 호출은 한 번만 실행되고, 스레드/async 호출자가 결과를 공유한다."""
+    import asyncio
+    import threading
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    from bot_utils.single_flight import SingleFlight
+
+    flight = SingleFlight()
+    started = threading.Event()
+    calls = []
+
+    def slow():
+        calls.append(1)
+        started.set()
+        time.sleep(0.3)
+        return "result"
+
+    async def waiter():
+        started.wait()
+        return await flight.do_async("k", lambda: None)  # 실행 중인 호출에 합류
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        leader = pool.submit(flight.do, "k", slow)
+        started.wait()
+        followers = [pool.submit(flight.do, "k", slow) for _ in range(2)]
+        async_result = asyncio.run(waiter())
+        results = [leader.result()] + [f.result() for f in followers]
+
+    assert results == ["result"] * 3
+    assert async_result == "result"
+    assert len(calls) == 1
+    assert flight.shared == 3
+
+    # 끝난 뒤에는 새로 실행하고, 예외도 공유되지 않고 그대로 전달
+    with pytest.raises(ValueError):
+        flight.do("k", lambda: (_ for _ in ()).throw(ValueError("boom")))
+    assert flight.do("k", lambda: "again") == "again"
+
+
+def test_ttl_cache_stale_while_revalidate(monkeypatch):
+    """TTL이 지난 값은 바로 반환하고 백그라운드에서 한 번만 갱신, max_age가 지나면 동기로 다시 불러온다."""
+    import threading
+
+    from bot_utils import ttl_cache
+    from bot_utils.ttl_cache import TTLCache
+
+    now = [1000.0]
+    monkeypatch.setattr(ttl_cache.time, "monotonic", lambda: now[0])
+    cache = TTLCache(ttl=10, max_age=100, max_bytes=1024)
+
+    release = threading.Event()
+    loads = []
+
+    def loader():
+        loads.append(1)
+        if len(loads) == 2:
+            release.wait(2)  # 백그라운드 갱신이 끝나기 전에 다시 조회
+        return f"v{len(loads)}"
+
+    assert cache.get_or_load("k", loader) == "v1"
+    assert cache.get_or_load("k", loader) == "v1"
+    assert len(loads) == 1
+
+    now[0] += 20  # 오래됨: 기존 값을 바로 반환, 갱신은 한 번만
+    assert cache.get_or_load("k", loader) == "v1"
+    assert cache.get_or_load("k", loader) == "v1"
+    release.set()
+    for thread in threading.enumerate():
+        if thread.name == "cache-refresh":
+            thread.join(2)
+    assert len(loads) == 2
+    assert cache.get_or_load("k", loader) == "v2"
+    assert cache.stats.stale_hits == 2
+
+    now[0] += 200  # max_age 초과: 기다려서 새로 불러옴
+    assert cache.get_or_load("k", loader) == "v3"
+    assert cache.get_or_load("empty", lambda: [], cacheable=bool) == []
+    assert cache.get("empty") is None
+
+
+def test_ttl_cache_refresh_older_than_loads_synchronously(monkeypatch):
+    """refresh_older_than보다 오래된 값은 오래된 값 제공 없이 호출한 스레드에서 다시 불러온다."""
+    from bot_utils import ttl_cache
+    from bot_utils.ttl_cache import TTLCache
+
+    now = [1000.0]
+    monkeypatch.setattr(ttl_cache.time, "monotonic", lambda: now[0])
+    cache = TTLCache(ttl=10, max_age=100, max_bytes=1024)
+    cache.set("k", "old")
+
+    now[0] += 5  # 신선한 값도 0이면 다시 불러옴
+    assert cache.get_or_load("k", lambda: "new", refresh_older_than=0) == "new"
+
+    now[0] += 5  # 기준보다 새로우면 그대로
+    assert cache.get_or_load("k", lambda: "newer", refresh_older_than=60) == "new"
+
+    # 오류가 나면 예외를 그대로 받음 (오래된 값으로 대신하지 않음)
+    def fail():
+        raise RuntimeError("quota")
+
+    with pytest.raises(RuntimeError):
+        cache.get_or_load("k", fail, refresh_older_than=0)
+    assert cache.stats.stale_hits == 0
+
+
+def test_circuit_breaker_opens_and_half_opens(monkeypatch):
+    """연속 실패가 쌓이면 차단하고, reset_timeout 뒤에는 시험 호출 하나만 허용한다."""
+    from bot_utils import resilience
+    from bot_utils.resilience import CircuitBreaker
+
+    now = [1000.0]
+    monkeypatch.setattr(resilience.time, "monotonic", lambda: now[0])
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30)
+
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow()
+
+    now[0] += 31
+    assert breaker.allow()  # 시험 호출
+    assert not breaker.allow()  # 시험 중에는 나머지 차단
+    breaker.record_failure()  # 시험 실패 → 다시 차단
+    assert not breaker.allow()
+
+    now[0] += 31
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED and breaker.allow()
+
+
+def test_resilient_caller_retries_and_fails_fast(monkeypatch):
+    """일시적 오류만 재시도하고, 차단 중에는 호출하지 않고 CircuitOpenError를 던진다."""
+    from bot_utils import resilience
+    from bot_utils.resilience import CircuitBreaker, CircuitOpenError, ResilientCaller
+
+    monkeypatch.setattr(resilience.time, "sleep", lambda seconds: None)
+    caller = ResilientCaller(
+        breaker=CircuitBreaker(failure_threshold=3, reset_timeout=60), max_attempts=3, hedge=False
+    )
+    calls = []
+
+    def flaky(timeout):
+        calls.append(timeout)
+        if len(calls) < 3:
+            raise ConnectionError("reset")
+        return "ok"
+
+    def retryable(e):
+        return isinstance(e, ConnectionError)
+
+    assert caller.call(flaky, 5.0, retryable) == "ok"
+    assert len(calls) == 3 and caller.retries == 2
+    assert all(t <= 5.0 for t in calls)
+
+    # 재시도 대상이 아닌 오류는 바로 전달하고 장애로 세지 않음
+    with pytest.raises(KeyError):
+        caller.call(lambda timeout: {}["x"], 5.0, retryable)
+    assert caller.breaker.state == CircuitBreaker.CLOSED
+
+    def down(timeout):
+        raise ConnectionError("down")
+
+    with pytest.raises(ConnectionError):
+        caller.call(down, 5.0, retryable)
+    assert caller.breaker.state == CircuitBreaker.OPEN
+    with pytest.raises(CircuitOpenError):
+        caller.call(flaky, 5.0, retryable)
+    assert caller.rejected == 1
+
+
+def test_resilient_caller_hedges_slow_requests():
+    """최근 p95보다 늦어지는 요청은 하나 더 보내 먼저 성공한 응답을 쓴다."""
+    import threading
+    import time
+
+    from bot_utils.resilience import LatencyTracker, ResilientCaller
+
+    latency = LatencyTracker(min_samples=5)
+    for _ in range(10):
+        latency.record(0.01)
+    caller = ResilientCaller(latency=latency, min_hedge_delay=0.05)
+    calls = []
+    lock = threading.Lock()
+
+    def first_is_stuck(timeout):
+        with lock:
+            calls.append(timeout)
+            n = len(calls)
+        if n == 1:
+            time.sleep(1.0)
+            return "slow"
+        return "fast"
+
+    started = time.monotonic()
+    assert caller.call(first_is_stuck, 5.0, lambda e: False) == "fast"
+    assert time.monotonic() - started < 0.5
+    assert caller.hedged == 1 and len(calls) == 2
+
+
+def test_resilient_caller_times_attempts_from_when_they_start():
+    """공용 풀이 밀려 늦게 시작한 시도는 남은 시간만 쓰고, 시간이 없으면 요청을 보내지 않는다."""
+    import time
+
+    from bot_utils.resilience import CircuitBreaker, LatencyTracker, ResilientCaller
+
+    latency = LatencyTracker(min_samples=5)
+    for _ in range(10):
+        latency.record(0.01)
+    breaker = CircuitBreaker(failure_threshold=1)
+    caller = ResilientCaller(breaker=breaker, latency=latency, min_hedge_delay=0.05, max_workers=1)
+    timeouts = []
+
+    def request(timeout):
+        timeouts.append(timeout)
+        return "ok"
+
+    caller._pool.submit(time.sleep, 0.3)  # 풀을 점유
+    assert caller.call(request, 1.0, lambda e: True) == "ok"
+    assert timeouts and max(timeouts) < 0.75
+
+    timeouts.clear()
+    caller._pool.submit(time.sleep, 0.6)
+    with pytest.raises(TimeoutError):
+        caller.call(request, 0.5, lambda e: True)
+    assert timeouts == []
+    assert breaker.state == CircuitBreaker.CLOSED  # 보내지 못한 시도는 API 실패가 아님
@@ -13,15 +13,21 @@ _LOGO_PATH = _APP_DIR / "assets" / "kobaco_logo.png"
 
 import base64
 
+
+@st.cache_resource
+def _logo_base64() -> str:
+    """로고 이미지를 Base64로 인코딩합니다 (프로세스당 한 번)."""
+    with open(_LOGO_PATH, "rb") as f:
+        return base64.b64encode(f.read()).decode()
+
+
 def render_header():
     """KOBACO 로고와 앱 헤더를 렌더링합니다."""
     col_logo, col_title = st.columns([1, 4])
     with col_logo:
         if _LOGO_PATH.exists():
             # 이미지를 Base64로 인코딩하여 클릭 가능한 HTML 링크로 렌더링
-            with open(_LOGO_PATH, "rb") as f:
-                img_data = f.read()
-                img_b64 = base64.b64encode(img_data).decode()
+            img_b64 = _logo_base64()
             
             # target="_self"로 현재 탭에서 리로드 (홈으로 이동 효과)
             st.markdown(
@@ -33,9 +39,22 @@ def render_header():
         st.caption("여러분의 즐겨찾기 추가와, 제외로 좀 더 나은 결과가 나올 것입니다.")
 
 
+@st.fragment
 def render_restaurant_card(restaurant: Restaurant, index: int):
-    """식당 정보를 카드 형태로 표시합니다."""
+    """
+    식당 정보를 카드 형태로 표시합니다.
+    카드 단위 fragment라서 버튼을 눌러도 이 카드만 다시 그려집니다.
+    """
+    from bot_core.db import db
+
+    address_for_db = restaurant.road_address or restaurant.address
+
     with st.container(border=True):
+        # 접힘 여부는 세션 상태가 아니라 DB 기준: DB 관리 화면에서 제외를 해제하면 다시 펼쳐짐
+        if db.is_excluded(restaurant.name, address_for_db, restaurant.address):
+            st.caption(f"🚫 {restaurant.name} — 제외 처리되었습니다.")
+            return
+
         col1, col2 = st.columns([2.5, 1.5])
 
         with col1:
@@ -85,25 +104,38 @@ def render_restaurant_card(restaurant: Restaurant, index: int):
             if homepage_url:
                 st.link_button("🏠 홈페이지", homepage_url, use_container_width=True)
             
-            from bot_core.db import db
-            address_for_db = restaurant.road_address or restaurant.address
-            
             # 2. 즐겨찾기 버튼
-            if db.is_favorite(restaurant.name, address_for_db):
+            # on_click 콜백에서 DB를 갱신하므로 이 카드만 다시 그려도 바뀐 상태가 보임
+            if db.is_favorite(restaurant.name, address_for_db, restaurant.address):
                 st.button("⭐ 저장됨", disabled=True, key=f"fav_disabled_{index}", use_container_width=True)
             else:
-                if st.button("⭐ 즐겨찾기", key=f"add_fav_{index}", use_container_width=True):
-                    db.add_favorite(restaurant.name, address_for_db, restaurant.category)
-                    st.toast(f"⭐ {restaurant.name} 즐겨찾기 추가 완료!")
-                    st.rerun()
+                st.button(
+                    "⭐ 즐겨찾기", key=f"add_fav_{index}", use_container_width=True,
+                    on_click=_add_card_favorite, args=(restaurant, address_for_db),
+                )
 
             # 3. 제외 버튼
-            if st.button("🚫 영구 제외", key=f"exclude_{index}", use_container_width=True):
-                db.add_exclusion(restaurant.name, address_for_db, "검색 결과에서 제외됨")
-                if "search_results" in st.session_state and st.session_state["search_results"]:
-                    st.session_state["search_results"] = [
-                        r for r in st.session_state["search_results"] 
-                        if not (r.name == restaurant.name and (r.road_address or r.address) == address_for_db)
-                    ]
-                st.toast(f"🚫 {restaurant.name} 제외 처리되었습니다.")
-                st.rerun()
+            st.button(
+                "🚫 영구 제외", key=f"exclude_{index}", use_container_width=True,
+                on_click=_exclude_card, args=(restaurant, address_for_db),
+            )
+
+
+def _add_card_favorite(restaurant: Restaurant, address_for_db: str):
+    from bot_core.db import db
+
+    db.add_favorite(restaurant.name, address_for_db, category=restaurant.category)
+    st.toast(f"⭐ {restaurant.name} 즐겨찾기 추가 완료!")
+
+
+def _exclude_card(restaurant: Restaurant, address_for_db: str):
+    from bot_core.db import db
+
+    db.add_exclusion(restaurant.name, address_for_db, "검색 결과에서 제외됨")
+    # 목록에서는 다음 전체 실행 때 빠지고, 지금은 이 카드만 접어서 표시
+    if "search_results" in st.session_state and st.session_state["search_results"]:
+        st.session_state["search_results"] = [
+            r for r in st.session_state["search_results"] 
+            if not (r.name == restaurant.name and (r.road_address or r.address) == address_for_db)
+        ]
+    st.toast(f"🚫 {restaurant.name} 제외 처리되었습니다.")
@@ -3,7 +3,13 @@
 import streamlit as st
 import pandas as pd
 from bot_core.db import db
-from bot_utils.parser import parse_uploaded_file, parse_naver_map_url
+from bot_core.enrichment import get_background_enrichment, start_background_enrichment
+from bot_utils.parser import (
+    extract_urls,
+    iter_uploaded_file,
+    parse_naver_map_url,
+    parse_naver_map_urls,
+)
 
 def render_db_management_tab():
     """DB 관리 탭 (즐겨찾기/제외목록/데이터추가)"""
@@ -21,75 +27,200 @@ def render_db_management_tab():
         _render_data_import()
 
 
+PAGE_SIZE = 50
+
+_FAVORITE_SORT_LABELS = {
+    "최근 추가순": "recent",
+    "오래된순": "oldest",
+    "이름순": "name",
+    "카테고리순": "category",
+}
+
+_EXCLUSION_SORT_LABELS = {
+    "최근 추가순": "recent",
+    "오래된순": "oldest",
+    "이름순": "name",
+}
+
+
+def _page_controls(prefix: str, sort_labels: dict[str, str], total_counter) -> tuple[str, str, int, int]:
+    """검색어/정렬/페이지 입력을 그리고 (검색어, 정렬 키, 전체 개수, offset)을 반환합니다."""
+    col_query, col_sort = st.columns([3, 1])
+    with col_query:
+        query = st.text_input(
+            "검색", key=f"{prefix}_query", placeholder="식당명, 주소, 메모로 검색",
+            label_visibility="collapsed",
+        ).strip()
+    with col_sort:
+        sort_label = st.selectbox(
+            "정렬", list(sort_labels), key=f"{prefix}_sort", label_visibility="collapsed",
+        )
+
+    total = total_counter(query)
+    pages = max(1, -(-total // PAGE_SIZE))
+
+    # 검색어가 바뀌어 페이지 수가 줄어든 경우 범위 안으로 되돌림
+    page_key = f"{prefix}_page"
+    if st.session_state.get(page_key, 1) > pages:
+        st.session_state[page_key] = 1
+
+    page = 1
+    if pages > 1:
+        page = st.number_input(
+            f"페이지 (총 {pages}쪽, {total}개)", min_value=1, max_value=pages, step=1, key=page_key,
+        )
+    return query, sort_labels[sort_label], total, (int(page) - 1) * PAGE_SIZE
+
+
+def _selected_rows(prefix: str, frame: pd.DataFrame, column_config: dict) -> list[int]:
+    """한 페이지 분량의 표를 그리고 선택된 행 번호를 반환합니다.
+
+    처리 후 선택이 남지 않도록 작업마다 표의 key를 바꿉니다.
+    """
+    version = st.session_state.get(f"{prefix}_table_version", 0)
+    event = st.dataframe(
+        frame,
+        key=f"{prefix}_table_{version}",
+        on_select="rerun",
+        selection_mode="multi-row",
+        hide_index=True,
+        use_container_width=True,
+        column_config=column_config,
+    )
+    return list(event.selection.rows)
+
+
+def _finish_action(prefix: str, message: str, both_lists: bool = False):
+    """
+    선택을 초기화하고 결과 메시지를 남깁니다.
+    두 목록을 함께 바꾸는 작업(즐겨찾기 ↔ 제외 이동)이면 다음 실행에서 앱 전체를 다시 그리도록 표시합니다.
+    on_click 콜백 안에서는 st.rerun()이 동작하지 않으므로 fragment 본문에서 처리합니다.
+    """
+    st.session_state[f"{prefix}_table_version"] = st.session_state.get(f"{prefix}_table_version", 0) + 1
+    st.session_state[f"{prefix}_message"] = message
+    if both_lists:
+        st.session_state["db_lists_rerun_app"] = True
+
+
+def _rerun_app_if_lists_changed():
+    """다른 목록도 바뀌었으면 해당 fragment만이 아니라 앱 전체를 다시 실행합니다."""
+    if st.session_state.pop("db_lists_rerun_app", False):
+        st.rerun(scope="app")
+
+
+@st.fragment
 def _render_favorites():
+    """즐겨찾기 목록. 한 페이지 분량만 DB에서 읽어 표로 그립니다."""
+    _rerun_app_if_lists_changed()
     st.subheader("즐겨찾기 목록")
-    favorites = db.get_favorites()
 
-    if not favorites:
-        st.info("즐겨찾기한 식당이 없습니다.")
+    query, sort, total, offset = _page_controls("fav", _FAVORITE_SORT_LABELS, db.count_favorites)
+    if message := st.session_state.pop("fav_message", None):
+        st.success(message)
+
+    if not total:
+        st.info("검색 결과가 없습니다." if query else "즐겨찾기한 식당이 없습니다.")
         return
 
-    for item in favorites:
-        name = item["restaurant_name"]
-        address = item["address"] or ""
-        memo = item["memo"] or ""
-        
-        with st.expander(f"⭐ {name}", expanded=False):
-            if address:
-                st.caption(f"📍 {address}")
-            if item.get("category"):
-                st.caption(f"📂 {item['category']}")
-            if memo:
-                 st.caption(f"📝 {memo}")
-            
-            col_btn1, col_btn2 = st.columns(2)
-            with col_btn1:
-                if st.button("🚫 제외", key=f"fav_to_ex_{item['id']}", use_container_width=True):
-                    db.remove_favorite(name, address)
-                    db.add_exclusion(name, address, "즐겨찾기에서 이동됨")
-                    st.toast(f"🚫 {name} 제외 목록으로 이동")
-                    st.rerun()
-
-            with col_btn2:
-                if st.button("삭제", key=f"del_fav_{item['id']}", use_container_width=True):
-                    db.remove_favorite(name, address)
-                    st.toast(f"🗑️ {name} 삭제 완료")
-                    st.rerun()
+    rows = db.get_favorites_page(query, sort, limit=PAGE_SIZE, offset=offset)
+    frame = pd.DataFrame(rows, columns=["restaurant_name", "category", "address", "memo"])
+    selected = [rows[i] for i in _selected_rows("fav", frame, {
+        "restaurant_name": "식당",
+        "category": "카테고리",
+        "address": "주소",
+        "memo": "메모",
+    })]
+
+    col_btn1, col_btn2 = st.columns(2)
+    with col_btn1:
+        st.button(
+            f"🚫 제외로 이동 ({len(selected)})", key="fav_to_ex", use_container_width=True,
+            disabled=not selected, on_click=_move_favorites_to_exclusions, args=(selected,),
+        )
+    with col_btn2:
+        st.button(
+            f"삭제 ({len(selected)})", key="del_fav", use_container_width=True,
+            disabled=not selected, on_click=_delete_favorites, args=(selected,),
+        )
+
+    col_tag, col_tag_btn = st.columns([3, 1])
+    with col_tag:
+        st.text_input(
+            "카테고리", key="fav_tag", placeholder="선택한 식당에 지정할 카테고리",
+            label_visibility="collapsed", disabled=not selected,
+        )
+    with col_tag_btn:
+        st.button(
+            "🏷️ 지정", key="tag_fav", use_container_width=True,
+            disabled=not selected, on_click=_tag_favorites, args=(selected,),
+        )
+
+
+def _restaurant_ids(items: list[dict]) -> list[int]:
+    return [item["restaurant_id"] for item in items]
+
 
+def _move_favorites_to_exclusions(items: list[dict]):
+    moved = db.move_favorites_to_exclusions(_restaurant_ids(items))
+    _finish_action("fav", f"🚫 {moved}개 식당을 제외 목록으로 이동했습니다.", both_lists=True)
+
+
+def _delete_favorites(items: list[dict]):
+    deleted = db.remove_favorites(_restaurant_ids(items))
+    _finish_action("fav", f"🗑️ {deleted}개 식당을 삭제했습니다.")
+
+
+def _tag_favorites(items: list[dict]):
+    category = st.session_state.get("fav_tag", "").strip()
+    tagged = db.tag_favorites(_restaurant_ids(items), category)
+    _finish_action("fav", f"🏷️ {tagged}개 식당의 카테고리를 '{category or '없음'}'(으)로 지정했습니다.")
+
+
+@st.fragment
 def _render_exclusions():
+    """제외 목록. 한 페이지 분량만 DB에서 읽어 표로 그립니다."""
+    _rerun_app_if_lists_changed()
     st.subheader("제외된 식당 목록")
     st.caption("이 목록에 있는 식당은 검색 결과에 나타나지 않습니다.")
-    
-    exclusions = db.get_exclusions()
 
-    if not exclusions:
-        st.info("제외된 식당이 없습니다.")
+    query, sort, total, offset = _page_controls("ex", _EXCLUSION_SORT_LABELS, db.count_exclusions)
+    if message := st.session_state.pop("ex_message", None):
+        st.success(message)
+
+    if not total:
+        st.info("검색 결과가 없습니다." if query else "제외된 식당이 없습니다.")
         return
 
-    for item in exclusions:
-        name = item["restaurant_name"]
-        address = item["address"] or ""
-        reason = item["reason"] or ""
-        
-        with st.expander(f"🚫 {name}", expanded=False):
-             if address:
-                st.caption(f"📍 {address}")
-             if reason:
-                 st.caption(f"📝 사유: {reason}")
-
-             col_btn1, col_btn2 = st.columns(2)
-             with col_btn1:
-                if st.button("⭐ 즐겨찾기", key=f"ex_to_fav_{item['id']}", use_container_width=True):
-                    db.remove_exclusion(name, address)
-                    db.add_favorite(name, address, "제외 목록에서 복구됨")
-                    st.toast(f"⭐ {name} 즐겨찾기로 이동")
-                    st.rerun()
-
-             with col_btn2:
-                if st.button("해제", key=f"restore_ex_{item['id']}", use_container_width=True):
-                    db.remove_exclusion(name, address)
-                    st.toast(f"✅ {name} 제외 해제 완료")
-                    st.rerun()
+    rows = db.get_exclusions_page(query, sort, limit=PAGE_SIZE, offset=offset)
+    frame = pd.DataFrame(rows, columns=["restaurant_name", "address", "reason"])
+    selected = [rows[i] for i in _selected_rows("ex", frame, {
+        "restaurant_name": "식당",
+        "address": "주소",
+        "reason": "사유",
+    })]
+
+    col_btn1, col_btn2 = st.columns(2)
+    with col_btn1:
+        st.button(
+            f"⭐ 즐겨찾기로 이동 ({len(selected)})", key="ex_to_fav", use_container_width=True,
+            disabled=not selected, on_click=_move_exclusions_to_favorites, args=(selected,),
+        )
+    with col_btn2:
+        st.button(
+            f"해제 ({len(selected)})", key="restore_ex", use_container_width=True,
+            disabled=not selected, on_click=_delete_exclusions, args=(selected,),
+        )
+
+
+def _move_exclusions_to_favorites(items: list[dict]):
+    moved = db.move_exclusions_to_favorites(_restaurant_ids(items))
+    _finish_action("ex", f"⭐ {moved}개 식당을 즐겨찾기로 이동했습니다.", both_lists=True)
+
+
+def _delete_exclusions(items: list[dict]):
+    released = db.remove_exclusions(_restaurant_ids(items))
+    _finish_action("ex", f"✅ {released}개 식당의 제외를 해제했습니다.")
+
 
 def _render_data_import():
     st.subheader("데이터 일괄 추가")
@@ -117,9 +248,26 @@ def _render_data_import():
     uploaded_file = st.file_uploader("파일 선택", type=["csv", "xlsx", "xls"])
     if uploaded_file:
         if st.button("파일 데이터 가져오기"):
-            data = parse_uploaded_file(uploaded_file)
-            if data:
-                count = db.import_favorites(data)
+            # 배치 단위로 파싱 → 저장하여 큰 파일도 메모리를 일정하게 사용
+            parsed = count = 0
+            error = None
+            try:
+                with st.spinner("파일을 읽는 중..."):
+                    for batch in iter_uploaded_file(uploaded_file):
+                        parsed += len(batch)
+                        count += db.import_favorites(batch)
+            except Exception as e:
+                error = e
+
+            if error is not None and parsed:
+                # 앞 배치는 이미 저장됨: 어디까지 들어갔는지 알려주고 성공 메시지는 띄우지 않음
+                st.warning(
+                    f"⚠️ 파일을 읽다가 중단되었습니다: {error}\n\n"
+                    f"중단 전까지 읽은 {parsed}행 중 {count}개 식당을 추가했고, 나머지 행은 가져오지 못했습니다."
+                )
+            elif error is not None:
+                st.error(f"파일을 읽을 수 없습니다: {error}")
+            elif parsed:
                 st.success(f"✅ {count}개 식당을 즐겨찾기에 추가했습니다.")
             else:
                 st.error("데이터를 파싱할 수 없습니다. 컬럼명을 확인해주세요.")
@@ -143,3 +291,89 @@ def _render_data_import():
         else:
             st.error("URL에서 정보를 가져오지 못했습니다. 직접 입력해주세요.")
 
+    st.divider()
+
+    # 3. URL 일괄 추가
+    st.markdown("### 📚 여러 URL 한 번에 추가")
+    st.caption("한 줄에 하나씩 붙여넣거나, URL 목록이 담긴 텍스트 파일을 올려주세요.")
+    urls_text = st.text_area("네이버 지도 공유 URL 목록", placeholder="https://naver.me/...\nhttps://naver.me/...")
+    urls_file = st.file_uploader("URL 목록 파일", type=["txt", "csv"], key="batch_url_file")
+
+    urls = extract_urls(urls_text)
+    if urls_file:
+        urls += extract_urls(urls_file.getvalue().decode("utf-8", errors="ignore"))
+    urls = list(dict.fromkeys(urls))
+
+    if urls and st.button(f"URL {len(urls)}개 가져오기"):
+        _import_urls(urls)
+
+    st.divider()
+
+    # 4. 정보 보강
+    _render_enrichment()
+
+
+def _render_enrichment():
+    """카테고리/주소/좌표가 비어 있는 즐겨찾기를 백그라운드에서 채웁니다."""
+    st.markdown("### 🛰️ 즐겨찾기 정보 보강")
+    st.caption("네이버 검색으로 카테고리, 주소, 좌표를 채웁니다. 좌표가 있으면 내 DB 검색에서도 거리가 표시됩니다.")
+
+    job = get_background_enrichment()
+    if job and job[1]:
+        enricher, _ = job
+        stats = enricher.stats
+        st.progress(
+            stats.processed / stats.total if stats.total else 0.0,
+            text=f"보강 중... ({stats.processed}/{stats.total})",
+        )
+        if st.button("🔄 진행 상황 새로고침"):
+            st.rerun()
+        return
+
+    if job:
+        stats = job[0].stats
+        st.caption(
+            f"최근 작업: 보강 {stats.enriched}개 · 검색 실패 {stats.not_found}개 · 오류 {stats.failed}개"
+        )
+
+    pending = db.count_unenriched_favorites()
+    if not pending:
+        st.success("모든 즐겨찾기가 보강되었습니다.")
+        return
+
+    if st.button(f"보강 시작 ({pending}개 대기)"):
+        client_id = st.secrets.get("NAVER_CLIENT_ID", "")
+        client_secret = st.secrets.get("NAVER_CLIENT_SECRET", "")
+        start_background_enrichment(client_id, client_secret)
+        st.rerun()
+
+
+def _import_urls(urls: list[str]):
+    """URL을 동시에 파싱하며 진행 상황을 표시하고, 끝나면 즐겨찾기에 일괄 추가합니다."""
+    progress = st.progress(0.0, text="URL 분석 중...")
+    log = st.empty()
+    found: list[dict] = []
+    failed: list[str] = []
+
+    for done, (url, info) in enumerate(parse_naver_map_urls(urls), 1):
+        if info:
+            found.append({
+                "name": info["name"],
+                "address": info["address"],
+                "memo": "",
+                "category": info.get("category", ""),
+            })
+            log.caption(f"✅ {info['name']}")
+        else:
+            failed.append(url)
+            log.caption(f"⚠️ 실패: {url}")
+        progress.progress(done / len(urls), text=f"URL 분석 중... ({done}/{len(urls)})")
+
+    count = db.import_favorites(found) if found else 0
+    progress.empty()
+    log.empty()
+
+    st.success(f"✅ {len(found)}개 식당을 찾아 {count}개를 즐겨찾기에 추가했습니다. (중복 {len(found) - count}개)")
+    if failed:
+        with st.expander(f"⚠️ 실패한 URL {len(failed)}개"):
+            st.code("\n".join(failed), language="text")
@@ -36,5 +36,5 @@ def _render_search_history():
                 st.caption(f"📞 {record['phone']}")
 
             # 즐겨찾기 여부 표시
-            if db.is_favorite(name, record["address"]):
+            if record["is_favorite"]:
                 st.caption("⭐ 즐겨찾기 등록됨")
@@ -129,6 +129,15 @@ def render_input_form() -> dict | None:
             # ── 내 DB 검색 폼 ──
             st.info("즐겨찾기에 저장된 나만의 맛집을 검색합니다.")
             query = st.text_input("검색어 (식당명, 메모, 주소)", placeholder="예: 국밥, 맛있는 집")
+
+            # 0 = 반경 제한 없음 (좌표가 있는 식당은 거리순 정렬)
+            db_radius_labels = {0: "전체", 500: "500m", 1000: "1km", 1500: "1.5km", 2000: "2km"}
+            db_radius = st.select_slider(
+                "🔍 검색 반경 (좌표가 보강된 식당만 적용)",
+                options=[0] + RADIUS_OPTIONS,
+                value=0,
+                format_func=lambda x: db_radius_labels[x],
+            )
             
             submitted = st.form_submit_button("🔎 내 데이터에서 찾기", type="primary", use_container_width=True)
             
@@ -138,7 +147,9 @@ def render_input_form() -> dict | None:
                     "source": "db",
                     "query": query,
                     "cuisine": "내 DB 검색", # Display용
-                    "radius": 0,
+                    "area": AREA_CENTER["name"],
+                    "area_coords": {"lat": AREA_CENTER["lat"], "lng": AREA_CENTER["lng"]},
+                    "radius": db_radius,
                     "budget": "전체",
                     "party_size": 0,
                     "date": date.today(),
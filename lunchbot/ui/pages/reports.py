@@ -0,0 +1,45 @@
+"""이력 리포트 페이지"""
+
+import streamlit as st
+
+from bot_core.analytics import HistorySnapshot
+
+
+def render_reports_tab():
+    """리포트 탭 렌더링 (운영 DB가 아닌 Parquet 스냅샷만 읽음)"""
+    st.subheader("📊 점심 이력 리포트")
+
+    snapshot = HistorySnapshot()
+
+    col_info, col_btn = st.columns([3, 1])
+    with col_btn:
+        if st.button("🔄 스냅샷 갱신", use_container_width=True):
+            stats = snapshot.refresh()
+            st.toast(f"새 이력 {stats.new_history_rows}건 반영")
+    with col_info:
+        st.caption(f"스냅샷 기준: 이력 #{snapshot.high_water_mark}까지 반영됨")
+
+    if snapshot.high_water_mark == 0:
+        st.info("아직 스냅샷이 없습니다. '스냅샷 갱신'을 눌러주세요.")
+        return
+
+    st.markdown("#### 🗓️ 요일별 음식 종류")
+    by_weekday = snapshot.cuisine_by_weekday()
+    if by_weekday.empty:
+        st.caption("데이터가 없습니다.")
+    else:
+        st.bar_chart(by_weekday)
+
+    st.markdown("#### 👥 지역 · 월별 평균 인원")
+    party = snapshot.party_size_by_area_month()
+    if party.empty:
+        st.caption("데이터가 없습니다.")
+    else:
+        st.dataframe(party, use_container_width=True)
+
+    st.markdown("#### 🏆 많이 간 식당")
+    top = snapshot.top_restaurants()
+    if top.empty:
+        st.caption("데이터가 없습니다.")
+    else:
+        st.dataframe(top, use_container_width=True, hide_index=True)
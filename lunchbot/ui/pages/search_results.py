@@ -2,10 +2,13 @@
 
 import streamlit as st
 
+from bot_config.constants import LANDMARKS
 from bot_core.search import Restaurant
 from ui.components import render_restaurant_card
 from bot_utils.date_helper import format_date_korean
 
+_SEARCH_CENTER_LABEL = "검색 기준점"
+
 
 def render_search_results(
     restaurants: list[Restaurant],
@@ -16,7 +19,10 @@ def render_search_results(
     """
     cuisine = input_data["cuisine"]
     radius = input_data["radius"]
-    radius_text = f"{radius}m" if radius < 1000 else f"{radius / 1000:.0f}km"
+    if not radius:
+        radius_text = "전체"
+    else:
+        radius_text = f"{radius}m" if radius < 1000 else f"{radius / 1000:.0f}km"
     budget = input_data.get("budget", "상관없음")
     party = input_data["party_size"]
     date_str = format_date_korean(input_data["date"])
@@ -28,6 +34,12 @@ def render_search_results(
         f"📅 {date_str} {time_str} · 📍 반경 {radius_text}"
     )
 
+    skipped_areas = input_data.get("skipped_areas")
+    if skipped_areas:
+        st.warning(
+            f"⏱️ 일부 지역 결과 생략: 응답 지연 또는 API 오류로 {', '.join(skipped_areas)} 지역은 검색하지 못했습니다."
+        )
+
     if not restaurants:
         st.warning("검색 결과가 없습니다. 반경을 넓히거나 다른 조건을 선택해보세요.")
         if st.button("🔄 다시 검색하기"):
@@ -61,6 +73,20 @@ def render_search_results(
              st.rerun()
     # ──────────────────────────────────────────────────
 
+    # ── 모임 장소 기준 재정렬 (재검색 없이 미리 계산된 거리 사용) ──
+    if any(r.landmark_distances for r in display_restaurants):
+        meeting_point = st.selectbox(
+            "📍 거리 기준 모임 장소",
+            options=[_SEARCH_CENTER_LABEL] + list(LANDMARKS),
+            key="meeting_point",
+        )
+        if meeting_point != _SEARCH_CENTER_LABEL:
+            display_restaurants = sorted(
+                (r.at_landmark(meeting_point) for r in display_restaurants),
+                # 거리를 모르는 식당은 뒤로
+                key=lambda r: r.landmark_distances.get(meeting_point, float("inf")),
+            )
+
     # 식당 목록 표시
     selected_idx = None
     for i, restaurant in enumerate(display_restaurants, 1):
@@ -87,22 +113,25 @@ def render_search_results(
         # ── DB 액션 버튼 (즐겨찾기 / 제외) ────────────────
         from bot_core.db import db
 
+        # 카드와 동일한 주소(도로명 우선)로 DB 엔티티를 식별 (구버전 지번 주소 키도 확인)
+        address_for_db = selected.road_address or selected.address
+
         col_act1, col_act2 = st.columns(2)
         
         with col_act1:
-            if db.is_favorite(selected.name, selected.address):
+            if db.is_favorite(selected.name, address_for_db, selected.address):
                 if st.button("❌ 즐겨찾기 해제", key=f"fav_del_{selected.name}"):
-                    db.remove_favorite(selected.name, selected.address)
+                    db.remove_favorite(selected.name, address_for_db, selected.address)
                     st.rerun()
             else:
                 if st.button("⭐ 즐겨찾기 추가", key=f"fav_add_{selected.name}"):
-                    if db.add_favorite(selected.name, selected.address):
+                    if db.add_favorite(selected.name, address_for_db):
                         st.toast("즐겨찾기에 추가되었습니다!", icon="⭐")
                         st.rerun()
 
         with col_act2:
             if st.button("🚫 이 식당 제외하기", key=f"excl_{selected.name}"):
-                if db.add_exclusion(selected.name, selected.address, reason="사용자 선택"):
+                if db.add_exclusion(selected.name, address_for_db, reason="사용자 선택"):
                     st.warning("제외 목록에 추가되었습니다. 앞으로 검색되지 않습니다.")
                     if "random_picks" in st.session_state:
                         # 랜덤 추천 중 제외했으면 갱신 필요하지만 복잡해지므로 일단 리셋